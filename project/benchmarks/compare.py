@@ -0,0 +1,52 @@
+import argparse
+import json
+import sys
+from typing import Iterator, Tuple
+
+lower_is_better = {"p50Milliseconds", "p99Milliseconds", "p50Microseconds", "p99Microseconds", "meanMicroseconds"}
+higher_is_better = {"requestsPerSecond", "callsPerSecond"}
+
+
+def iterate_metrics(results: dict, path: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], str, float]]:
+    for key, value in results.items():
+        if isinstance(value, dict):
+            yield from iterate_metrics(value, path + (key,))
+        elif key in lower_is_better or key in higher_is_better:
+            yield path, key, value
+
+
+def compute_regression(metric: str, baseline: float, candidate: float) -> float:
+    if not baseline:
+        return 0.0
+    change = (candidate - baseline) / baseline
+    return change if metric in lower_is_better else -change
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files and flag regressions.")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown reported as a regression")
+    arguments = parser.parse_args()
+
+    with open(arguments.baseline) as baseline_file, open(arguments.candidate) as candidate_file:
+        baseline, candidate = json.load(baseline_file), json.load(candidate_file)
+    print(f"{baseline['metadata']['commit']} -> {candidate['metadata']['commit']}")
+    baseline_metrics = {(path, metric): value for path, metric, value in iterate_metrics(baseline["results"])}
+    regressions = 0
+    for path, metric, candidate_value in iterate_metrics(candidate["results"]):
+        baseline_value = baseline_metrics.get((path, metric))
+        if baseline_value is None:
+            continue
+        regression = compute_regression(metric, baseline_value, candidate_value)
+        flag = "REGRESSION" if regression > arguments.threshold else ""
+        regressions += bool(flag)
+        print(
+            f"{' / '.join(path):<48} {metric:<18} {baseline_value:>12.2f} {candidate_value:>12.2f}"
+            f" {regression:>+8.1%} {flag}"
+        )
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
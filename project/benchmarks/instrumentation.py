@@ -0,0 +1,147 @@
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+from project.src.repository.utilities.time_repository_call import time_call, time_async_call, TimedCursor, MONGO
+from project.src.routes.metrics_middleware import MetricsMiddleware
+from project.src.services.utilities.metrics import repository_call_duration_seconds
+
+ROUTE = SimpleNamespace(path="/g3/contact/{_id}")
+
+
+def bare_call() -> bool:
+    return True
+
+
+async def bare_async_call() -> bool:
+    return True
+
+
+async def bare_app(scope, receive, send):
+    scope["route"] = ROUTE
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message):
+    pass
+
+
+def build_scope() -> dict:
+    return {"type": "http", "method": "GET", "path": "/g3/contact/0"}
+
+
+def best_of(repeats: int, run: Callable[[], float]) -> float:
+    return min(run() for _ in range(repeats))
+
+
+def measure_call(calls: int, repeats: int) -> dict:
+    timed = time_call(MONGO)(bare_call)
+
+    def run(function: Callable) -> Callable[[], float]:
+        def timed_run() -> float:
+            started_at = time.perf_counter()
+            for _ in range(calls):
+                function()
+            return time.perf_counter() - started_at
+        return timed_run
+
+    return {"bare": best_of(repeats, run(bare_call)), "instrumented": best_of(repeats, run(timed))}
+
+
+def measure_async_call(calls: int, repeats: int) -> dict:
+    timed = time_async_call(MONGO)(bare_async_call)
+
+    def run(function: Callable) -> Callable[[], float]:
+        async def calls_loop():
+            for _ in range(calls):
+                await function()
+
+        def timed_run() -> float:
+            started_at = time.perf_counter()
+            asyncio.run(calls_loop())
+            return time.perf_counter() - started_at
+        return timed_run
+
+    return {"bare": best_of(repeats, run(bare_async_call)), "instrumented": best_of(repeats, run(timed))}
+
+
+def measure_cursor(calls: int, repeats: int) -> dict:
+    duration = repository_call_duration_seconds.labels(MONGO, "find")
+    documents = [{"_id": index} for index in range(calls)]
+
+    def run(wrap: Callable) -> Callable[[], float]:
+        def timed_run() -> float:
+            started_at = time.perf_counter()
+            for _ in wrap(iter(documents)):
+                pass
+            return time.perf_counter() - started_at
+        return timed_run
+
+    return {
+        "bare": best_of(repeats, run(lambda cursor: cursor)),
+        "instrumented": best_of(repeats, run(lambda cursor: TimedCursor(cursor, duration))),
+    }
+
+
+def measure_middleware(calls: int, repeats: int) -> dict:
+    instrumented_app = MetricsMiddleware(bare_app)
+
+    def run(app) -> Callable[[], float]:
+        async def calls_loop():
+            for _ in range(calls):
+                await app(build_scope(), receive, send)
+
+        def timed_run() -> float:
+            started_at = time.perf_counter()
+            asyncio.run(calls_loop())
+            return time.perf_counter() - started_at
+        return timed_run
+
+    return {"bare": best_of(repeats, run(bare_app)), "instrumented": best_of(repeats, run(instrumented_app))}
+
+
+measurements = {
+    "repository call (sync)": measure_call,
+    "repository call (async)": measure_async_call,
+    "cursor document": measure_cursor,
+    "request middleware": measure_middleware,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the per-call overhead of the Prometheus instrumentation.")
+    parser.add_argument("--calls", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    arguments = parser.parse_args()
+
+    results = {}
+    for name, measurement in measurements.items():
+        timings = measurement(arguments.calls, arguments.repeats)
+        results[name] = {
+            "bareMicroseconds": timings["bare"] / arguments.calls * 1e6,
+            "instrumentedMicroseconds": timings["instrumented"] / arguments.calls * 1e6,
+            "overheadMicroseconds": (timings["instrumented"] - timings["bare"]) / arguments.calls * 1e6,
+        }
+    if arguments.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{arguments.calls} calls, best of {arguments.repeats}")
+    for name, result in results.items():
+        print(
+            f"{name:<24} {result['bareMicroseconds']:>8.2f} us bare"
+            f" {result['instrumentedMicroseconds']:>8.2f} us instrumented"
+            f" {result['overheadMicroseconds']:>8.2f} us overhead"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import httpx
+
+from project.benchmarks.micro import build_contact_parameters, build_contact_payload
+from project.benchmarks.reporting import build_metadata, summarize_latencies, write_results
+from project.benchmarks.stand_ins import stores, LOCAL, MOCK
+from project.main import app
+from project.src.infrastructure.mongo_connection import AsyncMongoConnection
+from project.src.repository.async_repository_actions import AsyncSetNewContact
+from project.src.services.utilities.env_config import config
+from project.src.services.utilities.transform_parameters_to_contact import transform_parameters_to_contact
+
+PREFIX = config("ROUTERS_PREFIX")
+SEED_BATCH_SIZE = 10000
+BULK_SIZE = 100
+SUCCESSFUL_STATUS_CODES = {200, 304}
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    params: Optional[dict] = None
+    json: Optional[object] = None
+    headers: Optional[dict] = None
+
+
+class Scenario(NamedTuple):
+    name: str
+    build_request: Callable[["ScenarioState", int], Request]
+    max_requests: Optional[int] = None
+    unsupported_stores: Tuple[str, ...] = ()
+
+
+class ScenarioState:
+    def __init__(self, contacts_ids: List[str], contacts_count: int, seed: int):
+        self.contacts_ids = contacts_ids
+        self.random = random.Random(seed)
+        self.next_contact_index = contacts_count
+        self.removable_contacts_ids = list(reversed(contacts_ids))
+        self.entity_tag: Optional[str] = None
+
+    def any_contact_id(self) -> str:
+        return self.random.choice(self.contacts_ids)
+
+    def new_contact(self) -> dict:
+        self.next_contact_index += 1
+        return build_contact_payload(self.next_contact_index)
+
+    def removable_contact_id(self) -> str:
+        if not self.removable_contacts_ids:
+            return self.any_contact_id()
+        return self.removable_contacts_ids.pop()
+
+    def name_prefix(self) -> str:
+        return f"First{self.random.randint(100, 999)}"
+
+
+scenarios = [
+    Scenario("POST /register", lambda state, index: Request("POST", "/register", json=state.new_contact())),
+    Scenario("POST /register/bulk", lambda state, index: Request(
+        "POST", "/register/bulk", json=[state.new_contact() for _ in range(BULK_SIZE)]), max_requests=20),
+    Scenario("GET /contacts", lambda state, index: Request("GET", "/contacts")),
+    Scenario("GET /contacts?after", lambda state, index: Request(
+        "GET", "/contacts", params={"after": state.any_contact_id()})),
+    Scenario("GET /contacts/{prefix}", lambda state, index: Request("GET", f"/contacts/{state.name_prefix()}")),
+    Scenario("GET /contacts/{prefix}?stream", lambda state, index: Request(
+        "GET", f"/contacts/{state.name_prefix()}", params={"stream": "true"})),
+    Scenario("GET /count", lambda state, index: Request("GET", "/count"), max_requests=20),
+    Scenario("GET /stats", lambda state, index: Request("GET", "/stats"), max_requests=20, unsupported_stores=(MOCK,)),
+    Scenario("GET /contact/{_id}", lambda state, index: Request("GET", f"/contact/{state.any_contact_id()}")),
+    Scenario("GET /contact/{_id} If-None-Match", lambda state, index: Request(
+        "GET", f"/contact/{state.contacts_ids[0]}", headers={"If-None-Match": state.entity_tag or ""})),
+    Scenario("PUT /edit/{_id}", lambda state, index: Request(
+        "PUT", f"/edit/{state.any_contact_id()}", json={"lastName": f"Edited{index}"})),
+    Scenario("PUT /edit/bulk", lambda state, index: Request("PUT", "/edit/bulk", json=[
+        {"contactId": state.any_contact_id(), "updates": {"lastName": f"Edited{index}"}}
+        for _ in range(BULK_SIZE)
+    ]), max_requests=20),
+    Scenario("DELETE /remove/{_id}", lambda state, index: Request("DELETE", f"/remove/{state.removable_contact_id()}")),
+    Scenario("DELETE /remove/bulk", lambda state, index: Request(
+        "DELETE", "/remove/bulk", json=[state.removable_contact_id() for _ in range(BULK_SIZE)]), max_requests=20),
+    Scenario("GET /export?format=ndjson", lambda state, index: Request("GET", "/export"), max_requests=5),
+    Scenario("GET /export?format=csv&gzip", lambda state, index: Request(
+        "GET", "/export", params={"format": "csv", "gzip": "true"}), max_requests=5),
+    Scenario("GET /ready", lambda state, index: Request("GET", "/ready")),
+]
+
+
+async def seed_contacts(contacts_count: int) -> List[str]:
+    repository = AsyncSetNewContact(AsyncMongoConnection.get_singleton_connection())
+    contacts_ids = []
+    for batch_start in range(0, contacts_count, SEED_BATCH_SIZE):
+        contacts = [
+            transform_parameters_to_contact(build_contact_parameters(index))
+            for index in range(batch_start, min(batch_start + SEED_BATCH_SIZE, contacts_count))
+        ]
+        await repository.register_many(contacts)
+        contacts_ids.extend(contact.contactId for contact in contacts)
+    return contacts_ids
+
+
+async def send_request(client: httpx.AsyncClient, request: Request) -> httpx.Response:
+    response = await client.request(
+        request.method, PREFIX + request.path, params=request.params, json=request.json, headers=request.headers)
+    await response.aread()
+    return response
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, state: ScenarioState, requests_count: int, concurrency: int) -> dict:
+    requests_count = min(requests_count, scenario.max_requests or requests_count)
+    requests = [scenario.build_request(state, index) for index in range(requests_count)]
+    latencies: List[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while requests:
+            request = requests.pop()
+            started_at = time.perf_counter()
+            try:
+                response = await send_request(client, request)
+                if response.status_code not in SUCCESSFUL_STATUS_CODES:
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return {**summarize_latencies(latencies, time.perf_counter() - started_at), "errors": errors}
+
+
+async def run_size(contacts_count: int, requests_count: int, concurrency: int, seed: int, stores_name: str) -> dict:
+    async with app.router.lifespan_context(app):
+        contacts_ids = await seed_contacts(contacts_count)
+        state = ScenarioState(contacts_ids, contacts_count, seed)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            warm_up = await send_request(client, Request("GET", f"/contact/{contacts_ids[0]}"))
+            state.entity_tag = warm_up.headers.get("ETag")
+            results = {}
+            for scenario in scenarios:
+                if stores_name in scenario.unsupported_stores:
+                    results[scenario.name] = {"skipped": f"unsupported with {stores_name} stores"}
+                else:
+                    results[scenario.name] = await run_scenario(client, scenario, state, requests_count, concurrency)
+                print(f"{contacts_count:>9} {scenario.name:<36} {json.dumps(results[scenario.name])}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load every route against local MongoDB/Redis stand-ins.")
+    parser.add_argument("--stores", choices=sorted(stores), default=LOCAL)
+    parser.add_argument("--sizes", default="1000,100000,1000000", help="comma separated contact book sizes")
+    parser.add_argument("--requests", type=int, default=200, help="requests per route and size")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="where to write the JSON results")
+    arguments = parser.parse_args()
+
+    sizes = [int(size) for size in arguments.sizes.split(",")]
+    results = {}
+    for contacts_count in sizes:
+        with stores[arguments.stores]():
+            results[str(contacts_count)] = asyncio.run(
+                run_size(contacts_count, arguments.requests, arguments.concurrency, arguments.seed, arguments.stores))
+    report = {
+        "metadata": build_metadata(
+            stores=arguments.stores, requests=arguments.requests, concurrency=arguments.concurrency,
+            seed=arguments.seed,
+        ),
+        "results": results,
+    }
+    print(f"written to {write_results('load', report, arguments.output)}")
+
+
+if __name__ == "__main__":
+    main()
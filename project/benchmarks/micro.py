@@ -0,0 +1,126 @@
+import argparse
+import json
+import time
+from typing import Callable, List
+
+from project.benchmarks.read_path import build_documents
+from project.benchmarks.reporting import build_metadata, percentile, write_results
+from project.benchmarks.stand_ins import mock_stores
+from project.src.core.entities.contacts import ContactParameters
+from project.src.core.entities.name import FirstName
+from project.src.core.enum.contact_file_format import ContactFileFormat
+from project.src.infrastructure.mongo_connection import MongoConnection
+from project.src.repository.repository_actions import SetExistentContact, SetNewContact
+from project.src.repository.utilities.convert_dict_to_contact import convert_dict_to_contact
+from project.src.services.service_actions import CountContacts
+from project.src.services.utilities.convert_document_to_export import render_methods_per_export_format
+from project.src.services.utilities.transform_parameters_to_contact import transform_parameters_to_contact
+from project.src.services.utilities.validate_contact_rows import validate_contact_row
+
+
+def build_contact_payload(index: int) -> dict:
+    return {
+        "email": f"contact{index}@example.com",
+        "address": f"{index} Main Street",
+        "lastName": f"Last{index}",
+        "firstName": f"First{index}",
+        "phoneList": [
+            {"type": "mobile", "number": f"+55 11 9{index:08d}"},
+            {"type": "residential", "number": f"+55 11 3{index:07d}"},
+        ],
+    }
+
+
+def build_contact_parameters(index: int) -> ContactParameters:
+    return ContactParameters(**build_contact_payload(index))
+
+
+def convert_dict_to_contact_case(calls: int) -> Callable[[int], object]:
+    documents = build_documents(calls)
+    return lambda index: convert_dict_to_contact(documents[index])
+
+
+def transform_parameters_to_contact_case(calls: int) -> Callable[[int], object]:
+    contacts_parameters = [build_contact_parameters(index) for index in range(calls)]
+    return lambda index: transform_parameters_to_contact(contacts_parameters[index])
+
+
+def validate_contact_row_case(calls: int) -> Callable[[int], object]:
+    payloads = [build_contact_payload(index) for index in range(calls)]
+    return lambda index: validate_contact_row(index, payloads[index])
+
+
+def count_phones_types_case(calls: int) -> Callable[[int], object]:
+    groups = [{"_id": "mobile", "Count": 120}, {"_id": "residential", "Count": 80}]
+    return lambda index: CountContacts._count_phones_types(groups)
+
+
+def update_contact_case(calls: int) -> Callable[[int], object]:
+    mongo_connection = MongoConnection.get_singleton_connection()
+    contact = transform_parameters_to_contact(build_contact_parameters(0))
+    SetNewContact(mongo_connection).register(contact)
+    repository = SetExistentContact(mongo_connection)
+    return lambda index: repository.update_contact(contact.contactId, [FirstName(firstName=f"First{index}")])
+
+
+def render_export_case(export_format: ContactFileFormat) -> Callable[[int], Callable[[int], object]]:
+    render_method = render_methods_per_export_format.get(export_format)
+
+    def build_case(calls: int) -> Callable[[int], object]:
+        documents = build_documents(calls)
+        return lambda index: render_method(documents[index:index + 1])
+    return build_case
+
+
+cases = {
+    "convert_dict_to_contact": convert_dict_to_contact_case,
+    "transform_parameters_to_contact": transform_parameters_to_contact_case,
+    "validate_contact_row": validate_contact_row_case,
+    "CountContacts._count_phones_types": count_phones_types_case,
+    "SetExistentContact.update_contact": update_contact_case,
+    **{f"render_{export_format.value}": render_export_case(export_format) for export_format in ContactFileFormat},
+}
+
+
+def measure(call: Callable[[int], object], calls: int) -> dict:
+    timings: List[float] = []
+    started_at = time.perf_counter()
+    for index in range(calls):
+        call_started_at = time.perf_counter()
+        call(index)
+        timings.append(time.perf_counter() - call_started_at)
+    elapsed = time.perf_counter() - started_at
+    timings.sort()
+    return {
+        "calls": calls,
+        "meanMicroseconds": sum(timings) / calls * 1e6,
+        "p50Microseconds": percentile(timings, 0.50) * 1e6,
+        "p99Microseconds": percentile(timings, 0.99) * 1e6,
+        "callsPerSecond": calls / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the hot conversion and repository functions.")
+    parser.add_argument("--calls", type=int, default=10000)
+    parser.add_argument("--output", help="where to write the JSON results")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    arguments = parser.parse_args()
+
+    with mock_stores():
+        results = {name: measure(case(arguments.calls), arguments.calls) for name, case in cases.items()}
+    report = {"metadata": build_metadata(calls=arguments.calls), "results": results}
+    output = write_results("micro", report, arguments.output)
+    if arguments.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{arguments.calls} calls per case, written to {output}")
+    for name, result in results.items():
+        print(
+            f"{name:<36} {result['p50Microseconds']:>9.2f} us p50 {result['p99Microseconds']:>9.2f} us p99"
+            f" {result['callsPerSecond']:>12.0f} calls/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
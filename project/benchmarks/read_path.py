@@ -0,0 +1,102 @@
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+from project.src.repository.utilities.convert_dict_to_contact import convert_dict_to_contact
+from project.src.repository.utilities.convert_dict_to_record import convert_dict_to_record
+from project.src.services.service_actions import ListsContacts
+from project.src.services.utilities.convert_document_to_json import convert_document_to_json
+
+
+def build_documents(documents_count: int) -> List[dict]:
+    return [{
+        "_id": f"{index:032x}",
+        "firstName": f"First{index}",
+        "firstNameKey": f"first{index}",
+        "lastName": f"Last{index}",
+        "email": f"contact{index}@example.com",
+        "address": f"{index} Main Street",
+        "phones": [
+            {"type": "mobile", "number": f"+55 11 9{index:08d}"},
+            {"type": "residential", "number": f"+55 11 3{index:07d}"},
+        ],
+        "active": True,
+    } for index in range(documents_count)]
+
+
+def pydantic_read_path(document: dict) -> dict:
+    contact = convert_dict_to_contact(document)
+    return {
+        "contactId": contact.contactId,
+        "firstName": contact.name.firstName,
+        "lastName": contact.name.lastName,
+        "email": contact.email.email,
+        "phoneList": [{
+            "number": phone.number,
+            "type": phone.type.value,
+        } for phone in contact.phoneList]
+    }
+
+
+def rendered_read_path(document: dict) -> dict:
+    return convert_document_to_json(document, ListsContacts.LIST_FIELDS)
+
+
+read_paths = {
+    "Contact models (before)": convert_dict_to_contact,
+    "ContactRecord (after)": convert_dict_to_record,
+    "models + render (before)": pydantic_read_path,
+    "render from document (after)": rendered_read_path,
+}
+
+
+def measure(read_path: Callable[[dict], object], documents: List[dict], repeats: int) -> dict:
+    timings = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        for document in documents:
+            read_path(document)
+        timings.append(time.perf_counter() - started_at)
+
+    gc.collect()
+    allocated_blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    results = [read_path(document) for document in documents]
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained_blocks = sys.getallocatedblocks() - allocated_blocks_before
+    del results
+
+    return {
+        "milliseconds": min(timings) * 1000,
+        "retainedObjects": retained_blocks,
+        "peakKilobytes": peak_bytes / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the pydantic read path with the trusted read path.")
+    parser.add_argument("--documents", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    arguments = parser.parse_args()
+
+    documents = build_documents(arguments.documents)
+    results = {name: measure(read_path, documents, arguments.repeats) for name, read_path in read_paths.items()}
+    if arguments.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{arguments.documents} documents, best of {arguments.repeats}")
+    for name, result in results.items():
+        print(
+            f"{name:<32} {result['milliseconds']:>9.1f} ms"
+            f" {result['retainedObjects']:>9} objects {result['peakKilobytes']:>10.1f} KiB peak"
+        )
+
+
+if __name__ == "__main__":
+    main()
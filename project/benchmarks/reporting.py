@@ -0,0 +1,53 @@
+import json
+import math
+import os
+import platform
+import subprocess
+import time
+from typing import List, Optional
+
+RESULTS_DIRECTORY = os.path.join(os.path.dirname(__file__), "results")
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+def summarize_latencies(latencies: List[float], elapsed: float) -> dict:
+    sorted_latencies = sorted(latencies)
+    return {
+        "requests": len(sorted_latencies),
+        "p50Milliseconds": percentile(sorted_latencies, 0.50) * 1000,
+        "p99Milliseconds": percentile(sorted_latencies, 0.99) * 1000,
+        "requestsPerSecond": len(sorted_latencies) / elapsed if elapsed else 0.0,
+    }
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def build_metadata(**settings) -> dict:
+    return {
+        "commit": get_commit(),
+        "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        **settings,
+    }
+
+
+def write_results(kind: str, results: dict, output: Optional[str] = None) -> str:
+    output = output or os.path.join(RESULTS_DIRECTORY, f"{kind}-{results['metadata']['commit']}.json")
+    with open(output, "w") as results_file:
+        json.dump(results, results_file, indent=2)
+    return output
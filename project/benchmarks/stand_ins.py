@@ -0,0 +1,118 @@
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import pymongo
+import redis
+from motor.motor_asyncio import AsyncIOMotorClient
+from redis.asyncio import Redis as AsyncRedis, BlockingConnectionPool as AsyncBlockingConnectionPool
+
+from project.src.infrastructure.mongo_connection import MongoConnection, AsyncMongoConnection, \
+    _get_mongo_pool_options
+from project.src.infrastructure.redis_connection import RedisConnection, AsyncRedisConnection, \
+    _get_redis_pool_options
+
+MOCK = "mock"
+LOCAL = "local"
+STARTUP_TIMEOUT = 30
+
+
+def _install(mongo_client, async_mongo_client, redis_client, async_redis_client):
+    MongoConnection.connection = mongo_client
+    AsyncMongoConnection.connection = async_mongo_client
+    RedisConnection.connection = redis_client
+    AsyncRedisConnection.connection = async_redis_client
+
+
+def _reset():
+    for connection_class in (MongoConnection, AsyncMongoConnection, RedisConnection, AsyncRedisConnection):
+        connection_class.reset()
+
+
+@contextmanager
+def mock_stores() -> Iterator[None]:
+    try:
+        import fakeredis
+        import mongomock
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError as error:
+        raise SystemExit(f"{error.name} is missing: pip install -r benchmarks/requirements.txt") from error
+    redis_server = fakeredis.FakeServer()
+    async_mongo_client = AsyncMongoMockClient()
+    _install(
+        mongomock.MongoClient(),
+        async_mongo_client,
+        fakeredis.FakeRedis(server=redis_server),
+        fakeredis.FakeAsyncRedis(server=redis_server),
+    )
+    try:
+        yield
+    finally:
+        _reset()
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _wait_until_ready(ping, process: subprocess.Popen, name: str):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"{name} exited with code {process.returncode}")
+        try:
+            ping()
+            return
+        except Exception:
+            time.sleep(0.2)
+    raise SystemExit(f"{name} did not start in {STARTUP_TIMEOUT}s")
+
+
+@contextmanager
+def local_stores() -> Iterator[None]:
+    mongod, redis_server = shutil.which("mongod"), shutil.which("redis-server")
+    if not mongod or not redis_server:
+        raise SystemExit("mongod and redis-server must be on PATH to use local stores")
+    mongo_port, redis_port = _free_port(), _free_port()
+    with tempfile.TemporaryDirectory() as database_path:
+        mongo_process = subprocess.Popen(
+            [mongod, "--dbpath", database_path, "--port", str(mongo_port), "--bind_ip", "127.0.0.1", "--quiet"],
+            stdout=subprocess.DEVNULL,
+        )
+        redis_process = subprocess.Popen(
+            [redis_server, "--port", str(redis_port), "--save", "", "--appendonly", "no"],
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            mongo_url = f"mongodb://127.0.0.1:{mongo_port}"
+            mongo_options = _get_mongo_pool_options()
+            redis_options = {**_get_redis_pool_options(), "host": "127.0.0.1", "port": redis_port, "password": None}
+            mongo_client = pymongo.MongoClient(mongo_url, **mongo_options)
+            redis_client = redis.Redis(connection_pool=redis.ConnectionPool(**redis_options))
+            _wait_until_ready(lambda: mongo_client.admin.command("ping"), mongo_process, "mongod")
+            _wait_until_ready(redis_client.ping, redis_process, "redis-server")
+            _install(
+                mongo_client,
+                AsyncIOMotorClient(mongo_url, event_listeners=[AsyncMongoConnection.pool_statistics], **mongo_options),
+                redis_client,
+                AsyncRedis(connection_pool=AsyncBlockingConnectionPool(
+                    timeout=AsyncRedisConnection.POOL_TIMEOUT, **redis_options)),
+            )
+            yield
+        finally:
+            _reset()
+            for process in (mongo_process, redis_process):
+                process.terminate()
+                process.wait()
+
+
+stores = {
+    MOCK: mock_stores,
+    LOCAL: local_stores,
+}
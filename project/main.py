@@ -1,13 +1,88 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from prometheus_client import make_asgi_app, CollectorRegistry, multiprocess
 from starlette.middleware.cors import CORSMiddleware
 
-from src.routes.router import route
+from project.src.infrastructure.mongo_connection import AsyncMongoConnection
+from project.src.infrastructure.pool_statistics import export_pool_statistics
+from project.src.infrastructure.process_pool import ValidationProcessPool
+from project.src.infrastructure.redis_connection import AsyncRedisConnection
+from project.src.repository.async_repository_actions import AsyncContactIndexes, AsyncSoftDeleteContact, \
+    AsyncContactArchive
+from project.src.routes.metrics_middleware import MetricsMiddleware, get_route_template
+from project.src.routes.router import route
+from project.src.services.service_actions import AsyncReadiness, AsyncRegistrationQueue, AsyncContactsReadModel, \
+    AsyncArchiveContacts
+from project.src.services.utilities.env_config import config
+from project.src.services.utilities.metrics import http_validation_errors
+
+HOST = config("HOST", default="localhost")
+PORT = config("PORT", default=5656, cast=int)
+WORKERS = config("WORKERS", default=os.cpu_count() or 1, cast=int)
+BACKLOG = config("BACKLOG", default=2048, cast=int)
+GRACEFUL_SHUTDOWN_TIMEOUT = config("GRACEFUL_SHUTDOWN_TIMEOUT", default=30, cast=int)
+SHUTDOWN_TIMEOUT = config("SHUTDOWN_TIMEOUT", default=5, cast=float)
+POOL_STATISTICS_INTERVAL = config("POOL_STATISTICS_INTERVAL", default=5, cast=float)
+PROMETHEUS_MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    readiness_service = AsyncReadiness(mongo_connection, redis_connection, AsyncMongoConnection.pool_statistics)
+    if not await readiness_service.warm_up():
+        raise RuntimeError("MongoDB or Redis did not answer the warm-up ping")
+    await AsyncContactIndexes(mongo_connection).ensure_indexes()
+    soft_delete_repository = AsyncSoftDeleteContact(redis_connection)
+    tombstones_listener = asyncio.create_task(
+        soft_delete_repository.listen_for_tombstones(AsyncContactArchive(mongo_connection).stream_ids))
+    pool_statistics_exporter = asyncio.create_task(export_pool_statistics(
+        AsyncMongoConnection.pool_statistics, redis_connection.connection_pool, POOL_STATISTICS_INTERVAL))
+    read_model_follower = asyncio.create_task(
+        AsyncContactsReadModel(mongo_connection, redis_connection).follow_changes())
+    archiver = asyncio.create_task(AsyncArchiveContacts(mongo_connection, redis_connection).archive_continuously())
+    registration_flusher = None
+    if AsyncRegistrationQueue.ENABLED:
+        registration_flusher = asyncio.create_task(
+            AsyncRegistrationQueue(mongo_connection, redis_connection).flush_continuously())
+    yield
+    if registration_flusher:
+        await AsyncRegistrationQueue.close()
+        await asyncio.wait({registration_flusher}, timeout=SHUTDOWN_TIMEOUT)
+        registration_flusher.cancel()
+    tombstones_listener.cancel()
+    pool_statistics_exporter.cancel()
+    read_model_follower.cancel()
+    archiver.cancel()
+    await asyncio.wait(
+        {tombstones_listener, pool_statistics_exporter, read_model_follower, archiver}, timeout=SHUTDOWN_TIMEOUT)
+    ValidationProcessPool.shutdown()
+    mongo_connection.close()
+    await redis_connection.aclose()
+    await redis_connection.connection_pool.disconnect()
+    AsyncMongoConnection.reset()
+    AsyncRedisConnection.reset()
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def make_metrics_app():
+    if not PROMETHEUS_MULTIPROC_DIR:
+        return make_asgi_app()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return make_asgi_app(registry)
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 app.add_middleware(
@@ -16,10 +91,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request, exception):
+    http_validation_errors.labels(request.method, get_route_template(request.scope)).inc()
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content=jsonable_encoder({"status": '1004', 'validation_error': exception}),
@@ -27,10 +104,14 @@ async def validation_exception_handler(request, exception):
 
 
 app.include_router(route)
+app.mount("/metrics", make_metrics_app())
 
 if __name__ == "__main__":
     uvicorn.run(
-        app,
-        host="localhost",
-        port=5656,
+        "project.main:app",
+        host=HOST,
+        port=PORT,
+        workers=WORKERS,
+        backlog=BACKLOG,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT,
     )
@@ -0,0 +1,37 @@
+import argparse
+import asyncio
+import sys
+
+from project.src.core.interfaces.services_interfaces import InterfaceArchive
+from project.src.infrastructure.mongo_connection import AsyncMongoConnection
+from project.src.infrastructure.redis_connection import AsyncRedisConnection
+from project.src.services.service_actions import AsyncArchiveContacts
+
+
+def report(archive_result: dict):
+    print(f"archived: {archive_result.get('archived')}")
+    for state, count in archive_result.get("stored", {}).items():
+        print(f"{state}: {count}")
+
+
+async def run(every: float) -> int:
+    archive_service: InterfaceArchive = AsyncArchiveContacts(
+        AsyncMongoConnection.get_singleton_connection(), AsyncRedisConnection.get_singleton_connection())
+    while True:
+        report(await archive_service.archive())
+        if not every:
+            return 0
+        await asyncio.sleep(every)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Move contacts deleted more than ARCHIVE_RETENTION_DAYS ago to the archive collection.")
+    parser.add_argument("--retention-days", type=float, default=AsyncArchiveContacts.RETENTION_DAYS)
+    parser.add_argument("--every", type=float, default=0, help="keep archiving every N seconds")
+    arguments = parser.parse_args()
+    AsyncArchiveContacts.RETENTION_DAYS = arguments.retention_days
+    return asyncio.run(run(arguments.every))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
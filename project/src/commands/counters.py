@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import sys
+
+from project.src.core.interfaces.services_interfaces import InterfaceReconciliation
+from project.src.infrastructure.mongo_connection import AsyncMongoConnection
+from project.src.infrastructure.redis_connection import AsyncRedisConnection
+from project.src.services.service_actions import AsyncReconcileCounters
+
+
+async def reconcile(attempts: int, retry_delay: float) -> dict:
+    reconciliation_service: InterfaceReconciliation = AsyncReconcileCounters(
+        AsyncMongoConnection.get_singleton_connection(), AsyncRedisConnection.get_singleton_connection())
+    for attempt in range(1, attempts + 1):
+        reconciliation_result = await reconciliation_service.reconcile()
+        if reconciliation_result.get("corrected"):
+            break
+        print(f"attempt {attempt}: counters changed while counting, retrying")
+        await asyncio.sleep(retry_delay)
+    return reconciliation_result
+
+
+def report(reconciliation_result: dict):
+    drift = reconciliation_result.get("drift", {})
+    print(f"contacts: {reconciliation_result.get('countContacts', 0)}")
+    if not drift:
+        print("drift: none")
+    for field, difference in drift.items():
+        print(f"drift: {field} {difference:+d}")
+    print(f"corrected: {reconciliation_result.get('corrected')}")
+
+
+async def run(attempts: int, retry_delay: float, every: float) -> int:
+    while True:
+        reconciliation_result = await reconcile(attempts, retry_delay)
+        report(reconciliation_result)
+        if not every:
+            return 0 if reconciliation_result.get("corrected") else 1
+        await asyncio.sleep(every)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Recompute the contact counters from MongoDB and correct the drift in Redis.")
+    parser.add_argument("--attempts", type=int, default=5, help="retries while writes keep changing the counters")
+    parser.add_argument("--retry-delay", type=float, default=0.5)
+    parser.add_argument("--every", type=float, default=0, help="keep reconciling every N seconds")
+    arguments = parser.parse_args()
+    return asyncio.run(run(arguments.attempts, arguments.retry_delay, arguments.every))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from project.src.core.enum.contact_file_format import ContactFileFormat
+from project.src.core.interfaces.services_interfaces import InterfaceImport
+from project.src.infrastructure.mongo_connection import AsyncMongoConnection
+from project.src.infrastructure.process_pool import ValidationProcessPool
+from project.src.infrastructure.redis_connection import AsyncRedisConnection
+from project.src.services.service_actions import AsyncImportContacts
+
+READ_SIZE = 1 << 16
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as contacts_file:
+        while True:
+            chunk = await asyncio.to_thread(contacts_file.read, READ_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def report(progress: dict, errors_limit: int, reported_errors: int) -> int:
+    for row_error in progress.get("errors")[:max(errors_limit - reported_errors, 0)]:
+        messages = "; ".join(f"{error.get('field')}: {error.get('message')}" for error in row_error.get("errors"))
+        print(f"row {row_error.get('row')}: {messages}")
+    print(
+        f"rows: {progress.get('rows')} imported: {progress.get('imported')} "
+        f"duplicates: {progress.get('duplicates')} failed: {progress.get('failed')}"
+    )
+    return reported_errors + len(progress.get("errors"))
+
+
+async def run(path: Path, file_format: ContactFileFormat, errors_limit: int) -> int:
+    import_service: InterfaceImport = AsyncImportContacts(
+        AsyncMongoConnection.get_singleton_connection(),
+        AsyncRedisConnection.get_singleton_connection(),
+        ValidationProcessPool.get_singleton_pool(),
+    )
+    progress: Optional[dict] = None
+    reported_errors = 0
+    try:
+        async for progress in import_service.import_contacts(read_file(path), file_format):
+            reported_errors = report(progress, errors_limit, reported_errors)
+    finally:
+        ValidationProcessPool.shutdown()
+    if progress is None:
+        print("rows: 0")
+        return 0
+    return 0 if not progress.get("failed") else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import contacts from a CSV, vCard or NDJSON file.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=list(ContactFileFormat.__members__), help="defaults to the file extension")
+    parser.add_argument("--errors", type=int, default=100, help="maximum number of row errors to print")
+    arguments = parser.parse_args()
+    file_format = arguments.format or arguments.path.suffix.lstrip(".").lower()
+    if file_format not in ContactFileFormat.__members__:
+        parser.error(f"unknown format {file_format!r}, use --format")
+    return asyncio.run(run(arguments.path, ContactFileFormat[file_format], arguments.errors))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import argparse
+import sys
+from typing import List
+
+from project.src.infrastructure.mongo_connection import MongoConnection
+from project.src.repository.repository_actions import ContactIndexes
+from project.src.repository.utilities.build_contact_keys import build_name_prefix_filter, build_page_sort, \
+    build_after_filter, build_page_cursor, build_phone_filter
+
+COLLECTION_SCAN_STAGE = "COLLSCAN"
+BLOCKING_SORT_STAGE = "SORT"
+
+name_prefix_filter = build_name_prefix_filter("a")
+
+checked_queries = {
+    "list contacts": ({}, build_page_sort({})),
+    "list contacts by prefix": (name_prefix_filter, build_page_sort(name_prefix_filter)),
+    "list contacts by prefix after a cursor": (
+        build_after_filter(name_prefix_filter, build_page_cursor(name_prefix_filter, "id", "ana")),
+        build_page_sort(name_prefix_filter),
+    ),
+    "search contacts": ({"searchKeys": {"$all": ["an"]}}, None),
+    "find contacts by phone": (build_phone_filter("+55 11 91234-5678"), [("_id", 1)]),
+    "find contacts by phone suffix": (build_phone_filter("5678", 4), [("_id", 1)]),
+}
+
+index_sorted_queries = {"list contacts", "list contacts by prefix", "list contacts by prefix after a cursor"}
+
+
+def find_plan_problems(query_name: str, plan_stages: List[str]) -> List[str]:
+    plan_problems = [COLLECTION_SCAN_STAGE] if COLLECTION_SCAN_STAGE in plan_stages else []
+    if query_name in index_sorted_queries and BLOCKING_SORT_STAGE in plan_stages:
+        plan_problems.append(BLOCKING_SORT_STAGE)
+    return plan_problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Create the contact indexes and check that list queries use them.")
+    parser.add_argument("--backfill", action="store_true", help="store firstNameKey, searchKeys and phoneKeys on contacts that miss them")
+    parser.add_argument("--check", action="store_true", help="fail when a list query falls back to a COLLSCAN or a blocking SORT")
+    arguments = parser.parse_args()
+
+    mongo_connection = MongoConnection.get_singleton_connection()
+    indexes_repository = ContactIndexes(mongo_connection)
+    print(f"indexes: {', '.join(indexes_repository.ensure_indexes())}")
+    if arguments.backfill:
+        print(f"backfilled name keys: {indexes_repository.backfill_name_keys()}")
+        print(f"backfilled search keys: {indexes_repository.backfill_search_keys()}")
+        print(f"backfilled phone keys: {indexes_repository.backfill_phone_keys()}")
+    if not arguments.check:
+        return 0
+
+    exit_code = 0
+    for query_name, (filter_fields, sort) in checked_queries.items():
+        plan_stages = indexes_repository.get_plan_stages(filter_fields, sort)
+        print(f"{query_name}: {' <- '.join(plan_stages)}")
+        if find_plan_problems(query_name, plan_stages):
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
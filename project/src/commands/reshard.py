@@ -0,0 +1,34 @@
+import argparse
+import sys
+
+from project.src.infrastructure.mongo_connection import MongoConnection
+from project.src.repository.async_repository_actions import AsyncContactArchive
+from project.src.repository.repository_actions import ContactResharding
+from project.src.repository.utilities.contact_partitions import PARTITIONS_COUNT, RESHARD_FROM_COUNT, \
+    PARTITION_SCOPE, COLLECTION_SCOPE, DATABASE_SCOPE
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Move contacts to the partition they hash to after CONTACTS_PARTITIONS changes.")
+    parser.add_argument("--from", dest="from_count", type=int, default=RESHARD_FROM_COUNT, help="current number of partitions")
+    parser.add_argument("--to", dest="to_count", type=int, default=PARTITIONS_COUNT, help="new number of partitions")
+    parser.add_argument("--scope", choices=[COLLECTION_SCOPE, DATABASE_SCOPE], default=PARTITION_SCOPE)
+    parser.add_argument("--batch-size", type=int, default=ContactResharding.BATCH_SIZE)
+    arguments = parser.parse_args()
+    if arguments.from_count < 1 or arguments.to_count < 1:
+        parser.error("--from and --to must be at least 1, set CONTACTS_RESHARD_FROM or pass --from")
+
+    for collection_name in (ContactResharding.COLLECTION, AsyncContactArchive.COLLECTION):
+        resharding_repository = ContactResharding(
+            MongoConnection.get_singleton_connection(), arguments.from_count, arguments.to_count, arguments.scope,
+            collection_name)
+        resharding_repository.BATCH_SIZE = arguments.batch_size
+        if collection_name == ContactResharding.COLLECTION:
+            print(f"indexes: {', '.join(resharding_repository.ensure_target_indexes())}")
+        for partition_name, scanned_contacts, moved_contacts in resharding_repository.reshard():
+            print(f"{partition_name}: scanned {scanned_contacts} moved {moved_contacts}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
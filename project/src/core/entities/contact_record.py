@@ -0,0 +1,23 @@
+from typing import Optional, Tuple
+
+
+class ContactRecord:
+    __slots__ = ("contactId", "firstName", "lastName", "email", "address", "phones", "active")
+
+    def __init__(
+            self,
+            contactId: str,
+            firstName: Optional[str] = None,
+            lastName: Optional[str] = None,
+            email: Optional[str] = None,
+            address: Optional[str] = None,
+            phones: Tuple[Tuple[str, str], ...] = (),
+            active: Optional[bool] = None,
+    ):
+        self.contactId = contactId
+        self.firstName = firstName
+        self.lastName = lastName
+        self.email = email
+        self.address = address
+        self.phones = phones
+        self.active = active
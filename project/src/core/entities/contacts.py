@@ -28,6 +28,11 @@ class ContactOptionalParameters(BaseModel):
     _max_3_phones = validator('phoneList', allow_reuse=True)(assert_have_max_of_3)
 
 
+class ContactBulkUpdateParameters(BaseModel):
+    contactId: str
+    updates: ContactOptionalParameters
+
+
 class Contact(PhoneList):
     contactId: str
     name: Name
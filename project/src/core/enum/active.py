@@ -4,3 +4,4 @@ from enum import Enum
 class ActiveCondition(Enum):
     ACTIVE: dict = {'active': True}
     INACTIVE: dict = {'active': False}
+    NOT_ACTIVE: dict = {'active': {'$ne': True}}
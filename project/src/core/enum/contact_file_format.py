@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ContactFileFormat(Enum):
+    ndjson: str = "ndjson"
+    csv: str = "csv"
+    vcf: str = "vcf"
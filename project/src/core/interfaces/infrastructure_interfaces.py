@@ -9,6 +9,11 @@ class MongoConnectionInterface(ABC):
     def get_singleton_connection(cls) -> any:
         pass
 
+    @classmethod
+    @abstractmethod
+    def reset(cls):
+        pass
+
 
 class RedisConnectionInterface(ABC):
     connection: any
@@ -17,3 +22,8 @@ class RedisConnectionInterface(ABC):
     @abstractmethod
     def get_singleton_connection(cls) -> any:
         pass
+
+    @classmethod
+    @abstractmethod
+    def reset(cls):
+        pass
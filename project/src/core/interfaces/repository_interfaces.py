@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Any, List, Dict, Tuple
 
 
 class InterfaceMongo(ABC):
@@ -14,29 +15,69 @@ class InterfaceMongo(ABC):
         pass
 
     @abstractmethod
-    def find_all(self, filter_fields: dict = {}) -> list:
+    def update_one_with_pipeline(self, identity: str, pipeline: list) -> bool:
         pass
 
     @abstractmethod
-    def find(self, filter_fields: dict = {}) -> list:
+    def upsert_one(self, identity: str, filter_fields: dict, update: dict) -> bool:
         pass
 
     @abstractmethod
-    def find_one(self, identity: str, filter_fields: dict = {}) -> dict:
+    def find_one_and_update(self, identity: str, filter_fields: dict, pipeline: list, projection: Optional[dict] = None) -> Optional[dict]:
         pass
 
     @abstractmethod
-    def aggregate(self, pipeline: list) -> dict:
+    def find_all(self, filter_fields: dict = {}, projection: Optional[dict] = None) -> list:
+        pass
+
+    @abstractmethod
+    def find_page(self, filter_fields: dict = {}, after: Optional[str] = None, limit: int = 0, projection: Optional[dict] = None) -> list:
+        pass
+
+    @abstractmethod
+    def find(self, filter_fields: dict = {}, projection: Optional[dict] = None) -> list:
+        pass
+
+    @abstractmethod
+    def find_one(self, identity: str, filter_fields: dict = {}, projection: Optional[dict] = None) -> dict:
+        pass
+
+    @abstractmethod
+    def aggregate(self, pipeline: list) -> list:
         pass
 
     @abstractmethod
     def delete_one(self, identity: str) -> bool:
         pass
 
+    @abstractmethod
+    def delete_many(self, filter_fields: dict) -> int:
+        pass
+
+    @abstractmethod
+    def insert_many(self, documents: List[dict]) -> List[bool]:
+        pass
+
+    @abstractmethod
+    def bulk_write(self, operations_per_contact: List[Tuple[str, Any]]) -> List[bool]:
+        pass
+
+    @abstractmethod
+    def create_indexes(self, indexes: list) -> list:
+        pass
+
+    @abstractmethod
+    def explain(self, filter_fields: dict = {}, sort: Optional[list] = None) -> dict:
+        pass
+
+    @abstractmethod
+    def ping(self) -> bool:
+        pass
+
 
 class InterfaceRedis(ABC):
     @abstractmethod
-    def insert(self, key: str) -> bool:
+    def insert(self, key: str, expire_seconds: Optional[int] = None) -> bool:
         pass
 
     @abstractmethod
@@ -46,3 +87,202 @@ class InterfaceRedis(ABC):
     @abstractmethod
     def verify_if_exists(self, key: str) -> bool:
         pass
+
+    @abstractmethod
+    def insert_many(self, keys: List[str], expire_seconds: Optional[int] = None) -> bool:
+        pass
+
+    @abstractmethod
+    def exclude_many(self, keys: List[str]) -> bool:
+        pass
+
+    @abstractmethod
+    def verify_if_exists_many(self, keys: List[str]) -> List[bool]:
+        pass
+
+    @abstractmethod
+    def get_value(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def set_value(self, key: str, value: str, expire_seconds: Optional[int] = None, only_if_absent: bool = False) -> bool:
+        pass
+
+    @abstractmethod
+    def set_value_if_unchanged(self, key: str, value: str, expire_seconds: Optional[int], expected: str) -> bool:
+        pass
+
+    @abstractmethod
+    def get_counter(self, key: str, seed: int, expire_seconds: Optional[int] = None) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    def increment_many(self, keys: List[str], seed: int, expire_seconds: Optional[int] = None) -> bool:
+        pass
+
+    @abstractmethod
+    def start_transaction(self) -> Any:
+        pass
+
+    @abstractmethod
+    def execute_transaction(self, transaction: Any) -> Optional[list]:
+        pass
+
+    @abstractmethod
+    def get_hash_counters(self, key: str) -> Optional[Dict[str, int]]:
+        pass
+
+    @abstractmethod
+    def increment_hash(self, key: str, increments: Dict[str, int]) -> bool:
+        pass
+
+    @abstractmethod
+    def increment_hash_if_unchanged(self, key: str, expected: Dict[str, int], increments: Dict[str, int]) -> bool:
+        pass
+
+    @abstractmethod
+    def ping(self) -> bool:
+        pass
+
+
+class InterfaceAsyncMongo(ABC):
+    DATABASE: str
+    COLLECTION: str
+
+    @abstractmethod
+    async def insert_one(self, data: dict) -> bool:
+        pass
+
+    @abstractmethod
+    async def update_one(self, identity: str, fields_to_update: dict) -> bool:
+        pass
+
+    @abstractmethod
+    async def update_one_with_pipeline(self, identity: str, pipeline: list) -> bool:
+        pass
+
+    @abstractmethod
+    async def upsert_one(self, identity: str, filter_fields: dict, update: dict) -> bool:
+        pass
+
+    @abstractmethod
+    async def find_one_and_update(self, identity: str, filter_fields: dict, pipeline: list, projection: Optional[dict] = None) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def find_all(self, filter_fields: dict = {}, projection: Optional[dict] = None) -> Any:
+        pass
+
+    @abstractmethod
+    def find_page(self, filter_fields: dict = {}, after: Optional[str] = None, limit: int = 0, projection: Optional[dict] = None) -> Any:
+        pass
+
+    @abstractmethod
+    def find(self, filter_fields: dict = {}, projection: Optional[dict] = None) -> Any:
+        pass
+
+    @abstractmethod
+    async def find_one(self, identity: str, filter_fields: dict = {}, projection: Optional[dict] = None) -> dict:
+        pass
+
+    @abstractmethod
+    async def aggregate(self, pipeline: list) -> list:
+        pass
+
+    @abstractmethod
+    async def delete_one(self, identity: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def delete_many(self, filter_fields: dict) -> int:
+        pass
+
+    @abstractmethod
+    async def insert_many(self, documents: List[dict]) -> List[bool]:
+        pass
+
+    @abstractmethod
+    async def bulk_write(self, operations_per_contact: List[Tuple[str, Any]]) -> List[bool]:
+        pass
+
+    @abstractmethod
+    async def create_indexes(self, indexes: list) -> list:
+        pass
+
+    @abstractmethod
+    async def explain(self, filter_fields: dict = {}, sort: Optional[list] = None) -> dict:
+        pass
+
+    @abstractmethod
+    async def ping(self) -> bool:
+        pass
+
+
+class InterfaceAsyncRedis(ABC):
+    @abstractmethod
+    async def insert(self, key: str, expire_seconds: Optional[int] = None) -> bool:
+        pass
+
+    @abstractmethod
+    async def exclude(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def verify_if_exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def insert_many(self, keys: List[str], expire_seconds: Optional[int] = None) -> bool:
+        pass
+
+    @abstractmethod
+    async def exclude_many(self, keys: List[str]) -> bool:
+        pass
+
+    @abstractmethod
+    async def verify_if_exists_many(self, keys: List[str]) -> List[bool]:
+        pass
+
+    @abstractmethod
+    async def get_value(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    async def set_value(self, key: str, value: str, expire_seconds: Optional[int] = None, only_if_absent: bool = False) -> bool:
+        pass
+
+    @abstractmethod
+    async def set_value_if_unchanged(self, key: str, value: str, expire_seconds: Optional[int], expected: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_counter(self, key: str, seed: int, expire_seconds: Optional[int] = None) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def increment_many(self, keys: List[str], seed: int, expire_seconds: Optional[int] = None) -> bool:
+        pass
+
+    @abstractmethod
+    def start_transaction(self) -> Any:
+        pass
+
+    @abstractmethod
+    async def execute_transaction(self, transaction: Any) -> Optional[list]:
+        pass
+
+    @abstractmethod
+    async def get_hash_counters(self, key: str) -> Optional[Dict[str, int]]:
+        pass
+
+    @abstractmethod
+    async def increment_hash(self, key: str, increments: Dict[str, int]) -> bool:
+        pass
+
+    @abstractmethod
+    async def increment_hash_if_unchanged(self, key: str, expected: Dict[str, int], increments: Dict[str, int]) -> bool:
+        pass
+
+    @abstractmethod
+    async def ping(self) -> bool:
+        pass
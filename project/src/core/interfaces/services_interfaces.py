@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Optional, Iterator, AsyncIterator, List
 
 
 class InterfaceDelete(ABC):
@@ -10,7 +10,7 @@ class InterfaceDelete(ABC):
 
 class InterfaceDetail(ABC):
     @abstractmethod
-    def get_detail(self, value: Any) -> dict:
+    def get_detail(self, value: Any, fields: Optional[List[str]] = None) -> dict:
         pass
 
 
@@ -20,6 +20,24 @@ class InterfaceList(ABC):
         pass
 
 
+class InterfacePage(ABC):
+    @abstractmethod
+    def get_page(
+            self,
+            optional_filter: Optional[Any] = None,
+            after: Optional[str] = None,
+            limit: int = 0,
+            fields: Optional[List[str]] = None,
+    ) -> dict:
+        pass
+
+
+class InterfaceStream(ABC):
+    @abstractmethod
+    def stream(self, optional_filter: Optional[Any] = None, fields: Optional[List[str]] = None) -> Iterator[str]:
+        pass
+
+
 class InterfaceRegister(ABC):
     @abstractmethod
     def register(self, value: Any) -> dict:
@@ -30,3 +48,81 @@ class InterfaceUpdate(ABC):
     @abstractmethod
     def update(self, identity: str, updates: Any) -> dict:
         pass
+
+
+class InterfaceBulkRegister(ABC):
+    @abstractmethod
+    def register_many(self, values: List[Any]) -> dict:
+        pass
+
+
+class InterfaceBulkUpdate(ABC):
+    @abstractmethod
+    def update_many(self, updates: List[Any]) -> dict:
+        pass
+
+
+class InterfaceBulkDelete(ABC):
+    @abstractmethod
+    def delete_many(self, values: List[Any]) -> dict:
+        pass
+
+
+class InterfaceEntityTag(ABC):
+    @abstractmethod
+    def get_list_tag(self, *request_parts: Any, from_read_model: bool = False) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def get_contact_tag(self, identity: str, *request_parts: Any, from_read_model: bool = False) -> Optional[str]:
+        pass
+
+
+class InterfaceReadiness(ABC):
+    @abstractmethod
+    def warm_up(self) -> bool:
+        pass
+
+    @abstractmethod
+    def check(self) -> dict:
+        pass
+
+
+class InterfaceSearch(ABC):
+    @abstractmethod
+    def search(
+            self,
+            query: str,
+            after: Optional[str] = None,
+            limit: int = 0,
+            fields: Optional[List[str]] = None,
+    ) -> dict:
+        pass
+
+
+class InterfaceReconciliation(ABC):
+    @abstractmethod
+    def reconcile(self) -> dict:
+        pass
+
+
+class InterfaceArchive(ABC):
+    @abstractmethod
+    def archive(self) -> dict:
+        pass
+
+
+class InterfaceExport(ABC):
+    @abstractmethod
+    def export(self, export_format: Any, after: Optional[str] = None, compress: bool = False) -> AsyncIterator[bytes]:
+        pass
+
+
+class InterfaceImport(ABC):
+    @abstractmethod
+    def import_contacts(self, chunks: AsyncIterator[bytes], file_format: Any) -> AsyncIterator[dict]:
+        pass
+
+    @abstractmethod
+    def import_summary(self, chunks: AsyncIterator[bytes], file_format: Any) -> dict:
+        pass
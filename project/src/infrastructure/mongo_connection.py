@@ -1,20 +1,74 @@
+import os
+
 import pymongo
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from project.src.infrastructure.pool_statistics import MongoPoolStatistics
 from project.src.services.utilities.env_config import config
 from project.src.core.interfaces.infrastructure_interfaces import MongoConnectionInterface
 
 
+def _get_mongo_host() -> str:
+    # host = f'{config(MongoConnection)}'
+    host = f"mongodb://{config('MONGO_USER')}:{config('MONGO_PASS')}@{config('MONGO_HOST')}:{config('MONGO_PORT')}"
+    return host
+
+
+def _get_mongo_pool_options() -> dict:
+    return {
+        "maxPoolSize": config("MONGO_MAX_POOL_SIZE", default=100, cast=int),
+        "minPoolSize": config("MONGO_MIN_POOL_SIZE", default=10, cast=int),
+        "maxIdleTimeMS": config("MONGO_MAX_IDLE_TIME_MS", default=300000, cast=int),
+        "waitQueueTimeoutMS": config("MONGO_WAIT_QUEUE_TIMEOUT_MS", default=1000, cast=int),
+        "connectTimeoutMS": config("MONGO_CONNECT_TIMEOUT_MS", default=2000, cast=int),
+        "socketTimeoutMS": config("MONGO_SOCKET_TIMEOUT_MS", default=5000, cast=int),
+        "serverSelectionTimeoutMS": config("MONGO_SERVER_SELECTION_TIMEOUT_MS", default=2000, cast=int),
+    }
+
+
 class MongoConnection(MongoConnectionInterface):
     connection: any = None
+    pool_statistics = MongoPoolStatistics()
 
     @classmethod
     def get_singleton_connection(cls) -> pymongo.MongoClient:
         if cls.connection is None:
             try:
-                # host = f'{config(MongoConnection)}'
-                host = f"mongodb://{config('MONGO_USER')}:{config('MONGO_PASS')}@{config('MONGO_HOST')}:{config('MONGO_PORT')}"
-                connection = pymongo.MongoClient(host)
+                connection = pymongo.MongoClient(
+                    _get_mongo_host(), event_listeners=[cls.pool_statistics], **_get_mongo_pool_options())
+                cls.connection = connection
+            except Exception as error:
+                raise error
+
+        return cls.connection
+
+    @classmethod
+    def reset(cls):
+        cls.connection = None
+        cls.pool_statistics.reset()
+
+
+class AsyncMongoConnection(MongoConnectionInterface):
+    connection: any = None
+    pool_statistics = MongoPoolStatistics()
+
+    @classmethod
+    def get_singleton_connection(cls) -> AsyncIOMotorClient:
+        if cls.connection is None:
+            try:
+                connection = AsyncIOMotorClient(
+                    _get_mongo_host(), event_listeners=[cls.pool_statistics], **_get_mongo_pool_options())
                 cls.connection = connection
             except Exception as error:
                 raise error
 
         return cls.connection
+
+    @classmethod
+    def reset(cls):
+        cls.connection = None
+        cls.pool_statistics.reset()
+
+
+os.register_at_fork(after_in_child=MongoConnection.reset)
+os.register_at_fork(after_in_child=AsyncMongoConnection.reset)
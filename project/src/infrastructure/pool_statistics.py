@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+from pymongo import monitoring
+from redis.asyncio import ConnectionPool
+
+from project.src.services.utilities.metrics import mongo_pool_connections, redis_pool_connections
+
+
+class MongoPoolStatistics(monitoring.ConnectionPoolListener):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = dict.fromkeys(
+            ("created", "closed", "checkOutStarted", "checkedOut", "checkOutFailed", "checkedIn", "cleared"), 0)
+
+    def _count(self, counter: str):
+        with self.lock:
+            self.counters[counter] += 1
+
+    def reset(self):
+        with self.lock:
+            self.counters = dict.fromkeys(self.counters, 0)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            counters = dict(self.counters)
+        return {
+            "open": counters["created"] - counters["closed"],
+            "inUse": counters["checkedOut"] - counters["checkedIn"],
+            "waiting": counters["checkOutStarted"] - counters["checkedOut"] - counters["checkOutFailed"],
+            "checkOutFailed": counters["checkOutFailed"],
+            "cleared": counters["cleared"],
+        }
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._count("cleared")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._count("created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._count("closed")
+
+    def connection_check_out_started(self, event):
+        self._count("checkOutStarted")
+
+    def connection_check_out_failed(self, event):
+        self._count("checkOutFailed")
+
+    def connection_checked_out(self, event):
+        self._count("checkedOut")
+
+    def connection_checked_in(self, event):
+        self._count("checkedIn")
+
+
+def redis_pool_statistics(connection_pool: ConnectionPool) -> dict:
+    available_connections = len(connection_pool._available_connections)
+    in_use_connections = len(connection_pool._in_use_connections)
+    return {
+        "open": available_connections + in_use_connections,
+        "inUse": in_use_connections,
+        "maxConnections": connection_pool.max_connections,
+    }
+
+
+async def export_pool_statistics(mongo_pool_statistics: MongoPoolStatistics, redis_connection_pool: ConnectionPool, interval: float):
+    while True:
+        for state, connections in mongo_pool_statistics.snapshot().items():
+            mongo_pool_connections.labels(state).set(connections)
+        for state, connections in redis_pool_statistics(redis_connection_pool).items():
+            redis_pool_connections.labels(state).set(connections)
+        await asyncio.sleep(interval)
@@ -0,0 +1,31 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from project.src.services.utilities.env_config import config
+
+
+class ValidationProcessPool:
+    pool: Optional[ProcessPoolExecutor] = None
+    WORKERS: int = config("IMPORT_WORKERS", default=os.cpu_count() or 1, cast=int)
+
+    @classmethod
+    def get_singleton_pool(cls) -> ProcessPoolExecutor:
+        if cls.pool is None:
+            cls.pool = ProcessPoolExecutor(max_workers=cls.WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+        return cls.pool
+
+    @classmethod
+    def shutdown(cls):
+        if cls.pool is not None:
+            cls.pool.shutdown(wait=False, cancel_futures=True)
+        cls.reset()
+
+    @classmethod
+    def reset(cls):
+        cls.pool = None
+
+
+os.register_at_fork(after_in_child=ValidationProcessPool.reset)
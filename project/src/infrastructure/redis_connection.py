@@ -1,9 +1,26 @@
+import os
+
 from redis.client import Redis
+from redis.connection import ConnectionPool
+from redis.asyncio import Redis as AsyncRedis, BlockingConnectionPool as AsyncBlockingConnectionPool
 
 from project.src.core.interfaces.infrastructure_interfaces import RedisConnectionInterface
 from project.src.services.utilities.env_config import config
 
 
+def _get_redis_pool_options() -> dict:
+    return {
+        "host": config("REDIS_HOST"),
+        "port": config("REDIS_PORT"),
+        "password": config("REDIS_PASS"),
+        "db": config("REDIS_DB"),
+        "max_connections": config("REDIS_MAX_CONNECTIONS", default=50, cast=int),
+        "socket_connect_timeout": config("REDIS_SOCKET_CONNECT_TIMEOUT", default=2, cast=float),
+        "socket_timeout": config("REDIS_SOCKET_TIMEOUT", default=2, cast=float),
+        "health_check_interval": config("REDIS_HEALTH_CHECK_INTERVAL", default=30, cast=int),
+    }
+
+
 class RedisConnection(RedisConnectionInterface):
     connection: any = None
 
@@ -11,11 +28,7 @@ class RedisConnection(RedisConnectionInterface):
     def get_singleton_connection(cls) -> Redis:
         if cls.connection is None:
             try:
-                connection = Redis(
-                    host=config("REDIS_HOST"),
-                    port=config("REDIS_PORT"),
-                    password=config("REDIS_PASS"),
-                    db=config("REDIS_DB"))
+                connection = Redis(connection_pool=ConnectionPool(**_get_redis_pool_options()))
 
                 cls.connection = connection
 
@@ -23,3 +36,34 @@ class RedisConnection(RedisConnectionInterface):
                 raise error
 
         return cls.connection
+
+    @classmethod
+    def reset(cls):
+        cls.connection = None
+
+
+class AsyncRedisConnection(RedisConnectionInterface):
+    connection: any = None
+    POOL_TIMEOUT: float = config("REDIS_POOL_TIMEOUT", default=1, cast=float)
+
+    @classmethod
+    def get_singleton_connection(cls) -> AsyncRedis:
+        if cls.connection is None:
+            try:
+                connection_pool = AsyncBlockingConnectionPool(timeout=cls.POOL_TIMEOUT, **_get_redis_pool_options())
+                connection = AsyncRedis(connection_pool=connection_pool)
+
+                cls.connection = connection
+
+            except Exception as error:
+                raise error
+
+        return cls.connection
+
+    @classmethod
+    def reset(cls):
+        cls.connection = None
+
+
+os.register_at_fork(after_in_child=RedisConnection.reset)
+os.register_at_fork(after_in_child=AsyncRedisConnection.reset)
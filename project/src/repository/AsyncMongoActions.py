@@ -0,0 +1,222 @@
+import asyncio
+from typing import Optional, List, Callable, Awaitable, Tuple, Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCursor, AsyncIOMotorCollection
+from pymongo import ReturnDocument, ASCENDING
+from pymongo.errors import DuplicateKeyError, BulkWriteError, PyMongoError
+
+from project.src.core.interfaces.repository_interfaces import InterfaceAsyncMongo
+from project.src.repository.utilities.build_contact_keys import build_page_sort, build_after_filter
+from project.src.repository.utilities.contact_partitions import build_partition_names, find_partition, \
+    group_positions_by_partition, PARTITIONS_COUNT, RESHARD_FROM_COUNT
+from project.src.repository.utilities.convert_write_errors_to_statuses import convert_write_errors_to_statuses
+from project.src.repository.utilities.merge_partition_cursors import AsyncMergedCursor
+from project.src.repository.utilities.time_repository_call import time_async_call, time_cursor, MONGO
+
+
+class AsyncMongoActions(InterfaceAsyncMongo):
+    DATABASE: str = "contact_list"
+    COLLECTION: str = "contacts"
+
+    def __init__(self, infrastructure: AsyncIOMotorClient):
+        connection = infrastructure
+        self.partitions = [
+            connection[database][collection]
+            for database, collection in build_partition_names(self.DATABASE, self.COLLECTION, PARTITIONS_COUNT)
+        ]
+        self.previous_partitions = [
+            connection[database][collection]
+            for database, collection in build_partition_names(self.DATABASE, self.COLLECTION, RESHARD_FROM_COUNT)
+        ] if RESHARD_FROM_COUNT else []
+        partitions_names = {collection.full_name for collection in self.partitions}
+        self.scatter_partitions = self.partitions + [
+            collection for collection in self.previous_partitions if collection.full_name not in partitions_names]
+        self.collection = self.partitions[0]
+
+    @time_async_call(MONGO)
+    async def insert_one(self, data: dict) -> bool:
+        try:
+            collection = await self._locate(data.get("_id"))
+            if not await collection.insert_one(data):
+                return False
+            return True
+        except DuplicateKeyError:
+            return False
+
+    @time_async_call(MONGO)
+    async def update_one(self, identity: str, fields_to_update: dict) -> bool:
+        collection = await self._locate(identity)
+        update_result = await collection.update_one({"_id": identity}, {"$set": fields_to_update})
+        return update_result.modified_count > 0
+
+    @time_async_call(MONGO)
+    async def update_one_with_pipeline(self, identity: str, pipeline: list) -> bool:
+        collection = await self._locate(identity)
+        update_result = await collection.update_one({"_id": identity}, pipeline)
+        return update_result.modified_count > 0
+
+    @time_async_call(MONGO)
+    async def upsert_one(self, identity: str, filter_fields: dict, update: dict) -> bool:
+        try:
+            collection = await self._locate(identity)
+            await collection.update_one({"_id": identity, **filter_fields}, update, upsert=True)
+            return True
+        except DuplicateKeyError:
+            return False
+
+    @time_async_call(MONGO)
+    async def find_one_and_update(self, identity: str, filter_fields: dict, pipeline: list, projection: Optional[dict] = None) -> Optional[dict]:
+        collection = await self._locate(identity)
+        return await collection.find_one_and_update(
+            {"_id": identity, **filter_fields}, pipeline, projection, return_document=ReturnDocument.BEFORE)
+
+    @time_cursor(MONGO)
+    def find_all(self, filter_fields: dict = {}, projection: Optional[dict] = None) -> AsyncIOMotorCursor:
+        return self._scatter_find(filter_fields, projection)
+
+    @time_cursor(MONGO)
+    def find_page(self, filter_fields: dict = {}, after: Optional[str] = None, limit: int = 0, projection: Optional[dict] = None) -> AsyncIOMotorCursor:
+        page_sort = build_page_sort(filter_fields)
+        if projection is not None:
+            projection = {**projection, **{field: 1 for field, _ in page_sort}}
+        if after is not None:
+            filter_fields = build_after_filter(filter_fields, after)
+        if len(self.scatter_partitions) == 1:
+            return self.collection.find(filter_fields, projection).sort(page_sort).limit(limit)
+        return AsyncMergedCursor([
+            collection.find(filter_fields, projection).sort(page_sort).limit(limit)
+            for collection in self.scatter_partitions
+        ], limit, page_sort)
+
+    @time_cursor(MONGO)
+    def find(self, filter_fields: dict = {}, projection: Optional[dict] = None) -> AsyncIOMotorCursor:
+        return self._scatter_find(filter_fields, projection)
+
+    @time_async_call(MONGO)
+    async def find_one(self, identity: str, filter_fields: dict = {}, projection: Optional[dict] = None) -> dict:
+        previous_collection = self._previous_partition(identity)
+        if previous_collection is not None:
+            contact_as_dict = await previous_collection.find_one({"_id": identity, **filter_fields}, projection)
+            if contact_as_dict is not None:
+                return contact_as_dict
+        return await self._partition(identity).find_one({"_id": identity, **filter_fields}, projection)
+
+    @time_async_call(MONGO)
+    async def aggregate(self, pipeline: list) -> list:
+        results_per_partition = await asyncio.gather(*(
+            collection.aggregate(pipeline).to_list(length=None) for collection in self.scatter_partitions))
+        return [result for results in results_per_partition for result in results]
+
+    @time_async_call(MONGO)
+    async def delete_one(self, identity: str) -> bool:
+        collection = await self._locate(identity)
+        if not await collection.find_one_and_delete({"_id": identity}):
+            return False
+        return True
+
+    @time_async_call(MONGO)
+    async def delete_many(self, filter_fields: dict) -> int:
+        delete_results = await asyncio.gather(*(
+            collection.delete_many(filter_fields) for collection in self.scatter_partitions))
+        return sum(delete_result.deleted_count for delete_result in delete_results)
+
+    @time_async_call(MONGO)
+    async def insert_many(self, documents: List[dict]) -> List[bool]:
+        if not documents:
+            return []
+        return await self._write_partitioned(
+            [document.get("_id") for document in documents], documents, self._insert_partition)
+
+    @time_async_call(MONGO)
+    async def bulk_write(self, operations_per_contact: List[Tuple[str, Any]]) -> List[bool]:
+        if not operations_per_contact:
+            return []
+        return await self._write_partitioned(
+            [identity for identity, _ in operations_per_contact],
+            [operation for _, operation in operations_per_contact],
+            self._bulk_write_partition,
+        )
+
+    @time_async_call(MONGO)
+    async def create_indexes(self, indexes: list) -> list:
+        indexes_per_partition = await asyncio.gather(*(
+            collection.create_indexes(indexes) for collection in self.partitions))
+        return indexes_per_partition[0]
+
+    @time_async_call(MONGO)
+    async def explain(self, filter_fields: dict = {}, sort: Optional[list] = None) -> dict:
+        cursor = self.collection.find(filter_fields)
+        if sort:
+            cursor = cursor.sort(sort)
+        return await cursor.explain()
+
+    @time_async_call(MONGO)
+    async def ping(self) -> bool:
+        try:
+            await self.collection.database.command("ping")
+            return True
+        except PyMongoError:
+            return False
+
+    def _partition(self, identity: str) -> AsyncIOMotorCollection:
+        return self.partitions[find_partition(identity, len(self.partitions))]
+
+    def _previous_partition(self, identity: str) -> Optional[AsyncIOMotorCollection]:
+        if not self.previous_partitions:
+            return None
+        previous_collection = self.previous_partitions[find_partition(identity, len(self.previous_partitions))]
+        if previous_collection.full_name == self._partition(identity).full_name:
+            return None
+        return previous_collection
+
+    async def _locate(self, identity: str) -> AsyncIOMotorCollection:
+        collection = self._partition(identity)
+        previous_collection = self._previous_partition(identity)
+        if previous_collection is None:
+            return collection
+        contact_as_dict = await previous_collection.find_one({"_id": identity})
+        if contact_as_dict is not None:
+            try:
+                await collection.insert_one(contact_as_dict)
+            except DuplicateKeyError:
+                pass
+            await previous_collection.delete_one({"_id": identity})
+        return collection
+
+    def _scatter_find(self, filter_fields: dict, projection: Optional[dict]):
+        if len(self.scatter_partitions) == 1:
+            return self.collection.find(filter_fields, projection)
+        return AsyncMergedCursor([
+            collection.find(filter_fields, projection).sort("_id", ASCENDING)
+            for collection in self.scatter_partitions
+        ])
+
+    async def _write_partitioned(self, identities: List[str], items: list, write: Callable[[AsyncIOMotorCollection, list], Awaitable[List[bool]]]) -> List[bool]:
+        if self.previous_partitions:
+            await asyncio.gather(*(self._locate(identity) for identity in identities))
+        positions_per_partition = group_positions_by_partition(identities, len(self.partitions))
+        statuses_per_partition = await asyncio.gather(*(
+            write(self.partitions[partition], [items[position] for position in positions])
+            for partition, positions in positions_per_partition.items()
+        ))
+        statuses = [False] * len(items)
+        for positions, partition_statuses in zip(positions_per_partition.values(), statuses_per_partition):
+            for position, status in zip(positions, partition_statuses):
+                statuses[position] = status
+        return statuses
+
+    @staticmethod
+    async def _insert_partition(collection: AsyncIOMotorCollection, documents: List[dict]) -> List[bool]:
+        try:
+            await collection.insert_many(documents, ordered=False)
+            return convert_write_errors_to_statuses(len(documents))
+        except BulkWriteError as error:
+            return convert_write_errors_to_statuses(len(documents), error.details)
+
+    @staticmethod
+    async def _bulk_write_partition(collection: AsyncIOMotorCollection, operations: list) -> List[bool]:
+        try:
+            await collection.bulk_write(operations, ordered=False)
+            return convert_write_errors_to_statuses(len(operations))
+        except BulkWriteError as error:
+            return convert_write_errors_to_statuses(len(operations), error.details)
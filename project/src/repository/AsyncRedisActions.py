@@ -0,0 +1,186 @@
+from typing import Optional, List, Dict
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ConnectionError, TimeoutError, WatchError
+
+from project.src.core.interfaces.repository_interfaces import InterfaceAsyncRedis
+from project.src.repository.utilities.convert_hash_to_counters import convert_hash_to_counters
+from project.src.repository.utilities.time_repository_call import time_async_call, REDIS
+
+
+class AsyncRedisActions(InterfaceAsyncRedis):
+    def __init__(self, infrastructure: Redis):
+        connection: Redis = infrastructure
+        self.connection = connection
+
+    @time_async_call(REDIS)
+    async def insert(self, key: str, expire_seconds: Optional[int] = None) -> bool:
+        try:
+            await self.connection.set(key, 1, ex=expire_seconds)
+            return True
+        except ConnectionError:
+            return False
+
+    @time_async_call(REDIS)
+    async def exclude(self, key: str) -> bool:
+        try:
+            await self.connection.delete(key)
+            return True
+        except ConnectionError:
+            return False
+
+    @time_async_call(REDIS)
+    async def verify_if_exists(self, key: str) -> bool:
+        try:
+            number_of_names_that_exists = await self.connection.exists(key)
+            doest_exists = number_of_names_that_exists == 0
+            exists = not doest_exists
+            return exists
+        except ConnectionError:
+            return False
+
+    @time_async_call(REDIS)
+    async def insert_many(self, keys: List[str], expire_seconds: Optional[int] = None) -> bool:
+        if not keys:
+            return True
+        try:
+            if not expire_seconds:
+                await self.connection.mset({key: 1 for key in keys})
+                return True
+            pipeline = self.connection.pipeline(transaction=False)
+            for key in keys:
+                pipeline.set(key, 1, ex=expire_seconds)
+            await pipeline.execute()
+            return True
+        except ConnectionError:
+            return False
+
+    @time_async_call(REDIS)
+    async def exclude_many(self, keys: List[str]) -> bool:
+        if not keys:
+            return True
+        try:
+            await self.connection.delete(*keys)
+            return True
+        except ConnectionError:
+            return False
+
+    @time_async_call(REDIS)
+    async def verify_if_exists_many(self, keys: List[str]) -> List[bool]:
+        if not keys:
+            return []
+        try:
+            values = await self.connection.mget(keys)
+            return [value is not None for value in values]
+        except ConnectionError:
+            return [False] * len(keys)
+
+    @time_async_call(REDIS)
+    async def get_value(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.connection.get(key)
+        except ConnectionError:
+            return None
+
+    @time_async_call(REDIS)
+    async def set_value(self, key: str, value: str, expire_seconds: Optional[int] = None, only_if_absent: bool = False) -> bool:
+        try:
+            return bool(await self.connection.set(key, value, ex=expire_seconds, nx=only_if_absent))
+        except ConnectionError:
+            return False
+
+    @time_async_call(REDIS)
+    async def set_value_if_unchanged(self, key: str, value: str, expire_seconds: Optional[int], expected: str) -> bool:
+        try:
+            async with self.connection.pipeline(transaction=True) as pipeline:
+                await pipeline.watch(key)
+                if await pipeline.get(key) != expected.encode():
+                    return False
+                pipeline.multi()
+                pipeline.set(key, value, ex=expire_seconds)
+                await pipeline.execute()
+            return True
+        except (ConnectionError, WatchError):
+            return False
+
+    @time_async_call(REDIS)
+    async def get_counter(self, key: str, seed: int, expire_seconds: Optional[int] = None) -> Optional[int]:
+        try:
+            pipeline = self.connection.pipeline(transaction=False)
+            pipeline.set(key, seed, nx=True, ex=expire_seconds)
+            pipeline.get(key)
+            _, value = await pipeline.execute()
+            return int(value)
+        except ConnectionError:
+            return None
+
+    @time_async_call(REDIS)
+    async def increment_many(self, keys: List[str], seed: int, expire_seconds: Optional[int] = None) -> bool:
+        if not keys:
+            return True
+        try:
+            pipeline = self.connection.pipeline(transaction=True)
+            for key in keys:
+                pipeline.set(key, seed, nx=True)
+                pipeline.incr(key)
+                if expire_seconds:
+                    pipeline.expire(key, expire_seconds)
+            await pipeline.execute()
+            return True
+        except ConnectionError:
+            return False
+
+    @time_async_call(REDIS)
+    async def get_hash_counters(self, key: str) -> Optional[Dict[str, int]]:
+        try:
+            return convert_hash_to_counters(await self.connection.hgetall(key))
+        except ConnectionError:
+            return None
+
+    @time_async_call(REDIS)
+    async def increment_hash(self, key: str, increments: Dict[str, int]) -> bool:
+        if not increments:
+            return True
+        try:
+            pipeline = self.connection.pipeline(transaction=True)
+            for field, increment in increments.items():
+                pipeline.hincrby(key, field, increment)
+            await pipeline.execute()
+            return True
+        except ConnectionError:
+            return False
+
+    @time_async_call(REDIS)
+    async def increment_hash_if_unchanged(self, key: str, expected: Dict[str, int], increments: Dict[str, int]) -> bool:
+        try:
+            async with self.connection.pipeline(transaction=True) as pipeline:
+                await pipeline.watch(key)
+                if convert_hash_to_counters(await pipeline.hgetall(key)) != expected:
+                    return False
+                pipeline.multi()
+                for field, increment in increments.items():
+                    pipeline.hincrby(key, field, increment)
+                await pipeline.execute()
+            return True
+        except (ConnectionError, WatchError):
+            return False
+
+    def start_transaction(self) -> Pipeline:
+        return self.connection.pipeline(transaction=True)
+
+    @time_async_call(REDIS)
+    async def execute_transaction(self, transaction: Pipeline) -> Optional[list]:
+        if not len(transaction):
+            return []
+        try:
+            return await transaction.execute()
+        except ConnectionError:
+            return None
+
+    @time_async_call(REDIS)
+    async def ping(self) -> bool:
+        try:
+            return bool(await self.connection.ping())
+        except (ConnectionError, TimeoutError):
+            return False
@@ -1,7 +1,16 @@
-from pymongo import MongoClient
-from pymongo.errors import DuplicateKeyError
+from typing import Optional, List, Callable, Tuple, Any
+
+from pymongo import ReturnDocument, MongoClient, ASCENDING
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError, BulkWriteError, PyMongoError
 
 from project.src.core.interfaces.repository_interfaces import InterfaceMongo
+from project.src.repository.utilities.build_contact_keys import build_page_sort, build_after_filter
+from project.src.repository.utilities.contact_partitions import build_partition_names, find_partition, \
+    group_positions_by_partition, PARTITIONS_COUNT, RESHARD_FROM_COUNT
+from project.src.repository.utilities.convert_write_errors_to_statuses import convert_write_errors_to_statuses
+from project.src.repository.utilities.merge_partition_cursors import MergedCursor
+from project.src.repository.utilities.time_repository_call import time_call, time_cursor, MONGO
 
 
 class MongoActions(InterfaceMongo):
@@ -10,34 +19,189 @@ class MongoActions(InterfaceMongo):
 
     def __init__(self, infrastructure: MongoClient):
         connection = infrastructure
-        database = connection[self.DATABASE]
-        self.collection = database[self.COLLECTION]
+        self.partitions = [
+            connection[database][collection]
+            for database, collection in build_partition_names(self.DATABASE, self.COLLECTION, PARTITIONS_COUNT)
+        ]
+        self.previous_partitions = [
+            connection[database][collection]
+            for database, collection in build_partition_names(self.DATABASE, self.COLLECTION, RESHARD_FROM_COUNT)
+        ] if RESHARD_FROM_COUNT else []
+        partitions_names = {collection.full_name for collection in self.partitions}
+        self.scatter_partitions = self.partitions + [
+            collection for collection in self.previous_partitions if collection.full_name not in partitions_names]
+        self.collection = self.partitions[0]
 
+    @time_call(MONGO)
     def insert_one(self, data: dict) -> bool:
         try:
-            if not self.collection.insert_one(data):
+            if not self._locate(data.get("_id")).insert_one(data):
                 return False
             return True
         except DuplicateKeyError:
             return False
 
+    @time_call(MONGO)
     def update_one(self, identity: str, fields_to_update: dict) -> bool:
-        update_result = self.collection.update_one({"_id": identity}, {"$set": fields_to_update})
+        update_result = self._locate(identity).update_one({"_id": identity}, {"$set": fields_to_update})
+        return update_result.modified_count > 0
+
+    @time_call(MONGO)
+    def update_one_with_pipeline(self, identity: str, pipeline: list) -> bool:
+        update_result = self._locate(identity).update_one({"_id": identity}, pipeline)
         return update_result.modified_count > 0
 
-    def find_all(self, filter_fields: dict = {}) -> list:
-        return self.collection.find(filter_fields)
+    @time_call(MONGO)
+    def upsert_one(self, identity: str, filter_fields: dict, update: dict) -> bool:
+        try:
+            self._locate(identity).update_one({"_id": identity, **filter_fields}, update, upsert=True)
+            return True
+        except DuplicateKeyError:
+            return False
+
+    @time_call(MONGO)
+    def find_one_and_update(self, identity: str, filter_fields: dict, pipeline: list, projection: Optional[dict] = None) -> Optional[dict]:
+        return self._locate(identity).find_one_and_update(
+            {"_id": identity, **filter_fields}, pipeline, projection, return_document=ReturnDocument.BEFORE)
+
+    @time_cursor(MONGO)
+    def find_all(self, filter_fields: dict = {}, projection: Optional[dict] = None) -> list:
+        return self._scatter_find(filter_fields, projection)
 
-    def find(self, filter_fields: dict = {}) -> list:
-        return self.collection.find(filter_fields)
+    @time_cursor(MONGO)
+    def find_page(self, filter_fields: dict = {}, after: Optional[str] = None, limit: int = 0, projection: Optional[dict] = None) -> list:
+        page_sort = build_page_sort(filter_fields)
+        if projection is not None:
+            projection = {**projection, **{field: 1 for field, _ in page_sort}}
+        if after is not None:
+            filter_fields = build_after_filter(filter_fields, after)
+        if len(self.scatter_partitions) == 1:
+            return self.collection.find(filter_fields, projection).sort(page_sort).limit(limit)
+        return MergedCursor([
+            collection.find(filter_fields, projection).sort(page_sort).limit(limit)
+            for collection in self.scatter_partitions
+        ], limit, page_sort)
 
-    def find_one(self, identity: str, filter_fields: dict = {}) -> dict:
-        return self.collection.find_one({"_id": identity, **filter_fields})
+    @time_cursor(MONGO)
+    def find(self, filter_fields: dict = {}, projection: Optional[dict] = None) -> list:
+        return self._scatter_find(filter_fields, projection)
 
-    def aggregate(self, pipeline: list) -> dict:
-        pass
+    @time_call(MONGO)
+    def find_one(self, identity: str, filter_fields: dict = {}, projection: Optional[dict] = None) -> dict:
+        previous_collection = self._previous_partition(identity)
+        if previous_collection is not None:
+            contact_as_dict = previous_collection.find_one({"_id": identity, **filter_fields}, projection)
+            if contact_as_dict is not None:
+                return contact_as_dict
+        return self._partition(identity).find_one({"_id": identity, **filter_fields}, projection)
 
+    @time_call(MONGO)
+    def aggregate(self, pipeline: list) -> list:
+        return [result for collection in self.scatter_partitions for result in collection.aggregate(pipeline)]
+
+    @time_call(MONGO)
     def delete_one(self, identity: str) -> bool:
-        if not self.collection.find_one_and_delete({"_id": identity}):
+        if not self._locate(identity).find_one_and_delete({"_id": identity}):
             return False
         return True
+
+    @time_call(MONGO)
+    def delete_many(self, filter_fields: dict) -> int:
+        return sum(collection.delete_many(filter_fields).deleted_count for collection in self.scatter_partitions)
+
+    @time_call(MONGO)
+    def insert_many(self, documents: List[dict]) -> List[bool]:
+        if not documents:
+            return []
+        return self._write_partitioned(
+            [document.get("_id") for document in documents], documents, self._insert_partition)
+
+    @time_call(MONGO)
+    def bulk_write(self, operations_per_contact: List[Tuple[str, Any]]) -> List[bool]:
+        if not operations_per_contact:
+            return []
+        return self._write_partitioned(
+            [identity for identity, _ in operations_per_contact],
+            [operation for _, operation in operations_per_contact],
+            self._bulk_write_partition,
+        )
+
+    @time_call(MONGO)
+    def create_indexes(self, indexes: list) -> list:
+        indexes_per_partition = [collection.create_indexes(indexes) for collection in self.partitions]
+        return indexes_per_partition[0]
+
+    @time_call(MONGO)
+    def explain(self, filter_fields: dict = {}, sort: Optional[list] = None) -> dict:
+        cursor = self.collection.find(filter_fields)
+        if sort:
+            cursor = cursor.sort(sort)
+        return cursor.explain()
+
+    @time_call(MONGO)
+    def ping(self) -> bool:
+        try:
+            self.collection.database.command("ping")
+            return True
+        except PyMongoError:
+            return False
+
+    def _partition(self, identity: str) -> Collection:
+        return self.partitions[find_partition(identity, len(self.partitions))]
+
+    def _previous_partition(self, identity: str) -> Optional[Collection]:
+        if not self.previous_partitions:
+            return None
+        previous_collection = self.previous_partitions[find_partition(identity, len(self.previous_partitions))]
+        if previous_collection.full_name == self._partition(identity).full_name:
+            return None
+        return previous_collection
+
+    def _locate(self, identity: str) -> Collection:
+        collection = self._partition(identity)
+        previous_collection = self._previous_partition(identity)
+        if previous_collection is None:
+            return collection
+        contact_as_dict = previous_collection.find_one({"_id": identity})
+        if contact_as_dict is not None:
+            try:
+                collection.insert_one(contact_as_dict)
+            except DuplicateKeyError:
+                pass
+            previous_collection.delete_one({"_id": identity})
+        return collection
+
+    def _scatter_find(self, filter_fields: dict, projection: Optional[dict]):
+        if len(self.scatter_partitions) == 1:
+            return self.collection.find(filter_fields, projection)
+        return MergedCursor([
+            collection.find(filter_fields, projection).sort("_id", ASCENDING)
+            for collection in self.scatter_partitions
+        ])
+
+    def _write_partitioned(self, identities: List[str], items: list, write: Callable[[Collection, list], List[bool]]) -> List[bool]:
+        if self.previous_partitions:
+            for identity in identities:
+                self._locate(identity)
+        statuses = [False] * len(items)
+        for partition, positions in group_positions_by_partition(identities, len(self.partitions)).items():
+            partition_statuses = write(self.partitions[partition], [items[position] for position in positions])
+            for position, status in zip(positions, partition_statuses):
+                statuses[position] = status
+        return statuses
+
+    @staticmethod
+    def _insert_partition(collection: Collection, documents: List[dict]) -> List[bool]:
+        try:
+            collection.insert_many(documents, ordered=False)
+            return convert_write_errors_to_statuses(len(documents))
+        except BulkWriteError as error:
+            return convert_write_errors_to_statuses(len(documents), error.details)
+
+    @staticmethod
+    def _bulk_write_partition(collection: Collection, operations: list) -> List[bool]:
+        try:
+            collection.bulk_write(operations, ordered=False)
+            return convert_write_errors_to_statuses(len(operations))
+        except BulkWriteError as error:
+            return convert_write_errors_to_statuses(len(operations), error.details)
@@ -1,7 +1,11 @@
-from redis.client import Redis
-from redis.exceptions import ConnectionError
+from typing import Optional, List, Dict
+
+from redis.client import Redis, Pipeline
+from redis.exceptions import ConnectionError, TimeoutError, WatchError
 
 from project.src.core.interfaces.repository_interfaces import InterfaceRedis
+from project.src.repository.utilities.convert_hash_to_counters import convert_hash_to_counters
+from project.src.repository.utilities.time_repository_call import time_call, REDIS
 
 
 class RedisActions(InterfaceRedis):
@@ -9,13 +13,15 @@ class RedisActions(InterfaceRedis):
         connection: Redis = infrastructure
         self.connection = connection
 
-    def insert(self, key: str) -> bool:
+    @time_call(REDIS)
+    def insert(self, key: str, expire_seconds: Optional[int] = None) -> bool:
         try:
-            self.connection.set(key, 1)
+            self.connection.set(key, 1, ex=expire_seconds)
             return True
         except ConnectionError:
             return False
 
+    @time_call(REDIS)
     def exclude(self, key: str) -> bool:
         try:
             self.connection.delete(key)
@@ -23,6 +29,7 @@ class RedisActions(InterfaceRedis):
         except ConnectionError:
             return False
 
+    @time_call(REDIS)
     def verify_if_exists(self, key: str) -> bool:
         try:
             number_of_names_that_exists = self.connection.exists(key)
@@ -31,3 +38,148 @@ class RedisActions(InterfaceRedis):
             return exists
         except ConnectionError:
             return False
+
+    @time_call(REDIS)
+    def insert_many(self, keys: List[str], expire_seconds: Optional[int] = None) -> bool:
+        if not keys:
+            return True
+        try:
+            if not expire_seconds:
+                self.connection.mset({key: 1 for key in keys})
+                return True
+            pipeline = self.connection.pipeline(transaction=False)
+            for key in keys:
+                pipeline.set(key, 1, ex=expire_seconds)
+            pipeline.execute()
+            return True
+        except ConnectionError:
+            return False
+
+    @time_call(REDIS)
+    def exclude_many(self, keys: List[str]) -> bool:
+        if not keys:
+            return True
+        try:
+            self.connection.delete(*keys)
+            return True
+        except ConnectionError:
+            return False
+
+    @time_call(REDIS)
+    def verify_if_exists_many(self, keys: List[str]) -> List[bool]:
+        if not keys:
+            return []
+        try:
+            values = self.connection.mget(keys)
+            return [value is not None for value in values]
+        except ConnectionError:
+            return [False] * len(keys)
+
+    @time_call(REDIS)
+    def get_value(self, key: str) -> Optional[bytes]:
+        try:
+            return self.connection.get(key)
+        except ConnectionError:
+            return None
+
+    @time_call(REDIS)
+    def set_value(self, key: str, value: str, expire_seconds: Optional[int] = None, only_if_absent: bool = False) -> bool:
+        try:
+            return bool(self.connection.set(key, value, ex=expire_seconds, nx=only_if_absent))
+        except ConnectionError:
+            return False
+
+    @time_call(REDIS)
+    def set_value_if_unchanged(self, key: str, value: str, expire_seconds: Optional[int], expected: str) -> bool:
+        try:
+            with self.connection.pipeline(transaction=True) as pipeline:
+                pipeline.watch(key)
+                if pipeline.get(key) != expected.encode():
+                    return False
+                pipeline.multi()
+                pipeline.set(key, value, ex=expire_seconds)
+                pipeline.execute()
+            return True
+        except (ConnectionError, WatchError):
+            return False
+
+    @time_call(REDIS)
+    def get_counter(self, key: str, seed: int, expire_seconds: Optional[int] = None) -> Optional[int]:
+        try:
+            pipeline = self.connection.pipeline(transaction=False)
+            pipeline.set(key, seed, nx=True, ex=expire_seconds)
+            pipeline.get(key)
+            _, value = pipeline.execute()
+            return int(value)
+        except ConnectionError:
+            return None
+
+    @time_call(REDIS)
+    def increment_many(self, keys: List[str], seed: int, expire_seconds: Optional[int] = None) -> bool:
+        if not keys:
+            return True
+        try:
+            pipeline = self.connection.pipeline(transaction=True)
+            for key in keys:
+                pipeline.set(key, seed, nx=True)
+                pipeline.incr(key)
+                if expire_seconds:
+                    pipeline.expire(key, expire_seconds)
+            pipeline.execute()
+            return True
+        except ConnectionError:
+            return False
+
+    @time_call(REDIS)
+    def get_hash_counters(self, key: str) -> Optional[Dict[str, int]]:
+        try:
+            return convert_hash_to_counters(self.connection.hgetall(key))
+        except ConnectionError:
+            return None
+
+    @time_call(REDIS)
+    def increment_hash(self, key: str, increments: Dict[str, int]) -> bool:
+        if not increments:
+            return True
+        try:
+            pipeline = self.connection.pipeline(transaction=True)
+            for field, increment in increments.items():
+                pipeline.hincrby(key, field, increment)
+            pipeline.execute()
+            return True
+        except ConnectionError:
+            return False
+
+    @time_call(REDIS)
+    def increment_hash_if_unchanged(self, key: str, expected: Dict[str, int], increments: Dict[str, int]) -> bool:
+        try:
+            with self.connection.pipeline(transaction=True) as pipeline:
+                pipeline.watch(key)
+                if convert_hash_to_counters(pipeline.hgetall(key)) != expected:
+                    return False
+                pipeline.multi()
+                for field, increment in increments.items():
+                    pipeline.hincrby(key, field, increment)
+                pipeline.execute()
+            return True
+        except (ConnectionError, WatchError):
+            return False
+
+    def start_transaction(self) -> Pipeline:
+        return self.connection.pipeline(transaction=True)
+
+    @time_call(REDIS)
+    def execute_transaction(self, transaction: Pipeline) -> Optional[list]:
+        if not len(transaction):
+            return []
+        try:
+            return transaction.execute()
+        except ConnectionError:
+            return None
+
+    @time_call(REDIS)
+    def ping(self) -> bool:
+        try:
+            return bool(self.connection.ping())
+        except (ConnectionError, TimeoutError):
+            return False
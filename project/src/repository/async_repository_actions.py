@@ -0,0 +1,515 @@
+import asyncio
+import re
+import time
+from datetime import datetime, timezone
+from typing import Union, Dict, Tuple, Iterable, Callable, Awaitable
+from typing import List, AsyncIterator, Optional
+from uuid import uuid4
+
+from pymongo import UpdateOne, ReplaceOne
+from pymongo.errors import PyMongoError
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ConnectionError
+
+from project.src.core.entities.active import Active
+from project.src.core.entities.address import Address
+from project.src.core.entities.contact_record import ContactRecord
+from project.src.core.entities.contacts import Contact
+from project.src.core.entities.email import Email
+from project.src.core.entities.name import LastName, FirstName
+from project.src.core.entities.phones import PhoneList
+from project.src.core.enum.active import ActiveCondition
+from project.src.repository.AsyncMongoActions import AsyncMongoActions
+from project.src.repository.AsyncRedisActions import AsyncRedisActions
+from project.src.repository.utilities.bloom_filter import BloomFilter
+from project.src.repository.utilities.build_counter_increments import merge_increments, \
+    convert_counters_to_count, SEEDED_FIELD
+from project.src.repository.utilities.build_search_pipeline import build_search_pipeline
+from project.src.repository.utilities.build_statistics_pipeline import build_statistics_pipeline, \
+    unpack_statistics, count_facets, statistics_facets
+from project.src.repository.utilities.convert_contact_to_dict import convert_contact_to_dict, \
+    convert_contact_to_registration
+from project.src.repository.utilities.convert_dict_to_record import convert_dict_to_record
+from project.src.repository.utilities.contact_indexes import contact_indexes
+from project.src.repository.utilities.convert_updates_to_dict import convert_updates_to_pipeline, \
+    build_deactivation_pipeline
+from project.src.services.utilities.env_config import config
+from project.src.services.utilities.metrics import soft_delete_checks_skipped, soft_delete_checks_redis, \
+    soft_delete_filter_items, soft_delete_filter_memory_bytes, soft_delete_filter_false_positive_rate, \
+    soft_delete_filter_estimated_false_positive_rate
+
+
+class AsyncGetContact(AsyncMongoActions):
+
+    async def get(self, identity: str, projection: Optional[dict] = None) -> Optional[ContactRecord]:
+        contact_detail_as_json = await self.find_one(identity, ActiveCondition.ACTIVE.value, projection)
+        if not contact_detail_as_json:
+            return
+        contact_detail = convert_dict_to_record(contact_detail_as_json)
+        return contact_detail
+
+    async def get_document(self, identity: str, projection: Optional[dict] = None) -> Optional[dict]:
+        return await self.find_one(identity, ActiveCondition.ACTIVE.value, projection)
+
+    async def get_documents(self, identities: List[str], projection: Optional[dict] = None) -> List[dict]:
+        list_of_contacts = self.find({"_id": {"$in": identities}, **ActiveCondition.ACTIVE.value}, projection)
+        return [contact_as_dict async for contact_as_dict in list_of_contacts]
+
+    async def get_many(self, identities: List[str], projection: Optional[dict] = None) -> List[ContactRecord]:
+        list_of_contacts = self.find({"_id": {"$in": identities}, **ActiveCondition.ACTIVE.value}, projection)
+        list_of_contacts_return = [
+            convert_dict_to_record(contact_as_dict)
+            async for contact_as_dict in list_of_contacts
+        ]
+        return list_of_contacts_return
+
+
+class AsyncGetContactList(AsyncMongoActions):
+    STREAM_BATCH_SIZE: int = config("CONTACTS_STREAM_BATCH_SIZE", default=1000, cast=int)
+
+    async def get_page(self, optional_filter: Optional[dict] = {}, after: Optional[str] = None, limit: int = 0, projection: Optional[dict] = None) -> List[dict]:
+        list_of_contacts = self.find_page(
+            {**optional_filter, **ActiveCondition.ACTIVE.value}, after, limit, projection)
+        list_of_contacts_return = [
+            contact_as_dict
+            async for contact_as_dict in list_of_contacts
+        ]
+        return list_of_contacts_return
+
+    async def stream(self, optional_filter: Optional[dict] = {}, projection: Optional[dict] = None, after: Optional[str] = None) -> AsyncIterator[dict]:
+        list_of_contacts = self.find_page({**optional_filter, **ActiveCondition.ACTIVE.value}, after, 0, projection)
+        async for contact_as_dict in list_of_contacts.batch_size(self.STREAM_BATCH_SIZE):
+            yield contact_as_dict
+
+
+class AsyncGetContactSearch(AsyncMongoActions):
+    async def search(self, prefix_keys: List[str], word_keys: List[str], after: Optional[Tuple[int, str]] = None, limit: int = 0, projection: Optional[dict] = None) -> List[dict]:
+        search_results = await self.aggregate(build_search_pipeline(
+            prefix_keys, word_keys, after, limit, projection))
+        if len(self.scatter_partitions) == 1:
+            return search_results
+        search_results.sort(key=lambda contact_as_dict: (-contact_as_dict.get("searchScore"), contact_as_dict.get("_id")))
+        return search_results[:limit]
+
+
+class AsyncGetContactStatistics(AsyncMongoActions):
+    async def count(self, optional_filter: Optional[dict] = {}) -> dict:
+        facets_result = await self.aggregate(build_statistics_pipeline(optional_filter, count_facets))
+        return unpack_statistics(facets_result)
+
+    async def statistics(self, optional_filter: Optional[dict] = {}) -> dict:
+        facets_result = await self.aggregate(build_statistics_pipeline(optional_filter, statistics_facets))
+        return unpack_statistics(facets_result)
+
+
+class AsyncSetNewContact(AsyncMongoActions):
+    async def register(self, contact: Contact) -> bool:
+        contact_as_json = convert_contact_to_dict(contact)
+        insert_status = await self.insert_one(contact_as_json)
+        return insert_status
+
+    async def register_many(self, contacts: List[Contact]) -> List[bool]:
+        contacts_as_json = [convert_contact_to_dict(contact) for contact in contacts]
+        insert_statuses = await self.insert_many(contacts_as_json)
+        return insert_statuses
+
+    async def upsert(self, contact: Contact) -> bool:
+        registration = convert_contact_to_registration(contact, datetime.now(timezone.utc))
+        return await self.upsert_one(contact.contactId, ActiveCondition.NOT_ACTIVE.value, registration)
+
+    async def upsert_many(self, contacts: List[Contact]) -> List[bool]:
+        registered_at = datetime.now(timezone.utc)
+        operations = [
+            (contact.contactId, UpdateOne(
+                {"_id": contact.contactId, **ActiveCondition.NOT_ACTIVE.value},
+                convert_contact_to_registration(contact, registered_at),
+                upsert=True,
+            ))
+            for contact in contacts
+        ]
+        return await self.bulk_write(operations)
+
+
+class AsyncSoftDeleteContact(AsyncRedisActions):
+    FILTER_ENABLED: bool = config("SOFT_DELETE_FILTER_ENABLED", default=True, cast=bool)
+    FILTER_CAPACITY: int = config("SOFT_DELETE_FILTER_CAPACITY", default=1000000, cast=int)
+    FILTER_FALSE_POSITIVE_RATE: float = config("SOFT_DELETE_FILTER_FALSE_POSITIVE_RATE", default=0.01, cast=float)
+    FILTER_CHECK_INTERVAL: float = config("SOFT_DELETE_FILTER_CHECK_INTERVAL", default=30, cast=float)
+    TOMBSTONE_TTL: int = config("SOFT_DELETE_TOMBSTONE_TTL", default=2592000, cast=int)
+    TOMBSTONES_CHANNEL: str = "soft_delete:tombstones"
+    TOMBSTONES_VERSION_KEY: str = "soft_delete:version"
+    TOMBSTONE_KEY_PATTERN: str = "?" * 32
+    tombstone_key_format = re.compile(r"[0-9a-f]{32}")
+    tombstones: Optional[BloomFilter] = None
+    tombstones_version: int = 0
+    list_archived_ids: Optional[Callable[[], AsyncIterator[str]]] = None
+
+    async def verify_if_contact_was_deleted(self, contact: Union[Contact, ContactRecord]) -> bool:
+        contact_id = contact.contactId
+        if not self._may_be_deleted(contact_id):
+            soft_delete_checks_skipped.inc()
+            return False
+        soft_delete_checks_redis.inc()
+        exists = await self.verify_if_exists(contact_id)
+        return exists
+
+    async def delete_contact_from_redis(self, contact: Union[Contact, ContactRecord]) -> bool:
+        contact_id = contact.contactId
+        exclude = await self.exclude(contact_id)
+        return exclude
+
+    async def add_contact_to_redis(self, contact: Union[Contact, ContactRecord]) -> bool:
+        contact_id = contact.contactId
+        add = await self.insert(contact_id, self.TOMBSTONE_TTL or None)
+        await self._publish_tombstones([contact_id])
+        return add
+
+    async def verify_if_contacts_were_deleted(self, contacts: List[Union[Contact, ContactRecord]]) -> List[bool]:
+        contacts_ids = [contact.contactId for contact in contacts if self._may_be_deleted(contact.contactId)]
+        soft_delete_checks_skipped.inc(len(contacts) - len(contacts_ids))
+        soft_delete_checks_redis.inc(len(contacts_ids))
+        exists_per_contact = dict(zip(contacts_ids, await self.verify_if_exists_many(contacts_ids)))
+        exists = [exists_per_contact.get(contact.contactId, False) for contact in contacts]
+        return exists
+
+    async def delete_contacts_from_redis(self, contacts: List[Union[Contact, ContactRecord]]) -> bool:
+        contacts_ids = [contact.contactId for contact in contacts]
+        exclude = await self.exclude_many(contacts_ids)
+        return exclude
+
+    async def add_contacts_to_redis(self, contacts: List[Union[Contact, ContactRecord]]) -> bool:
+        contacts_ids = [contact.contactId for contact in contacts]
+        add = await self.insert_many(contacts_ids, self.TOMBSTONE_TTL or None)
+        await self._publish_tombstones(contacts_ids)
+        return add
+
+    def filter_possibly_deleted(self, contacts_ids: List[str]) -> List[str]:
+        return [contact_id for contact_id in contacts_ids if self._may_be_deleted(contact_id)]
+
+    def queue_tombstones(self, transaction: Pipeline, contacts_ids: List[str]) -> Optional[int]:
+        if not contacts_ids:
+            return None
+        if not self.TOMBSTONE_TTL:
+            transaction.mset({contact_id: 1 for contact_id in contacts_ids})
+        else:
+            for contact_id in contacts_ids:
+                transaction.set(contact_id, 1, ex=self.TOMBSTONE_TTL)
+        transaction.incr(self.TOMBSTONES_VERSION_KEY)
+        return len(transaction) - 1
+
+    def queue_tombstones_removal(self, transaction: Pipeline, contacts_ids: List[str]):
+        if contacts_ids:
+            transaction.delete(*contacts_ids)
+
+    async def load_tombstones(self):
+        if not self.FILTER_ENABLED:
+            return
+        tombstones_version = int(await self.get_value(self.TOMBSTONES_VERSION_KEY) or 0)
+        tombstones = BloomFilter(self.FILTER_CAPACITY, self.FILTER_FALSE_POSITIVE_RATE)
+        async for key in self.connection.scan_iter(match=self.TOMBSTONE_KEY_PATTERN, count=1000):
+            contact_id = key.decode()
+            if self.tombstone_key_format.fullmatch(contact_id):
+                tombstones.add(contact_id)
+        if self.list_archived_ids is not None:
+            async for contact_id in self.list_archived_ids():
+                tombstones.add(contact_id)
+        AsyncSoftDeleteContact.tombstones = tombstones
+        AsyncSoftDeleteContact.tombstones_version = tombstones_version
+        self._export_filter_metrics()
+
+    async def listen_for_tombstones(self, list_archived_ids: Optional[Callable[[], AsyncIterator[str]]] = None):
+        if not self.FILTER_ENABLED:
+            return
+        self.list_archived_ids = list_archived_ids
+        while True:
+            try:
+                await self._follow_tombstones()
+            except (ConnectionError, PyMongoError):
+                AsyncSoftDeleteContact.tombstones = None
+                await asyncio.sleep(self.FILTER_CHECK_INTERVAL)
+
+    async def _follow_tombstones(self):
+        async with self.connection.pubsub() as pubsub:
+            await pubsub.subscribe(self.TOMBSTONES_CHANNEL)
+            await self.load_tombstones()
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=self.FILTER_CHECK_INTERVAL)
+                if message is None:
+                    await self._check_tombstones_version()
+                    continue
+                version, _, contacts_ids = message.get("data").decode().partition(":")
+                if int(version) > self.tombstones_version + 1:
+                    await self.load_tombstones()
+                    continue
+                self.tombstones.update(contacts_ids.split(","))
+                AsyncSoftDeleteContact.tombstones_version = max(self.tombstones_version, int(version))
+                self._export_filter_metrics()
+
+    async def _check_tombstones_version(self):
+        tombstones_version = int(await self.get_value(self.TOMBSTONES_VERSION_KEY) or 0)
+        if tombstones_version != self.tombstones_version:
+            await self.load_tombstones()
+
+    async def _publish_tombstones(self, contacts_ids: List[str]):
+        if not contacts_ids:
+            return
+        try:
+            version = await self.connection.incr(self.TOMBSTONES_VERSION_KEY)
+        except ConnectionError:
+            return
+        await self.publish_tombstones(contacts_ids, version)
+
+    async def replace_tombstones_with_archive(self, contacts_ids: List[str]) -> bool:
+        if not contacts_ids:
+            return True
+        transaction = self.start_transaction()
+        self.queue_tombstones_removal(transaction, contacts_ids)
+        transaction.incr(self.TOMBSTONES_VERSION_KEY)
+        transaction_results = await self.execute_transaction(transaction)
+        if transaction_results is None:
+            return False
+        await self.publish_tombstones(contacts_ids, transaction_results[-1])
+        return True
+
+    async def publish_tombstones(self, contacts_ids: List[str], version: int):
+        if self.tombstones is not None:
+            self.tombstones.update(contacts_ids)
+        try:
+            await self.connection.publish(self.TOMBSTONES_CHANNEL, f"{version}:{','.join(contacts_ids)}")
+        except ConnectionError:
+            return
+
+    def _may_be_deleted(self, contact_id: str) -> bool:
+        return self.tombstones is None or contact_id in self.tombstones
+
+    def _export_filter_metrics(self):
+        soft_delete_filter_items.set(self.tombstones.items_count)
+        soft_delete_filter_memory_bytes.set(self.tombstones.memory_bytes)
+        soft_delete_filter_false_positive_rate.set(self.tombstones.false_positive_rate)
+        soft_delete_filter_estimated_false_positive_rate.set(self.tombstones.estimated_false_positive_rate)
+
+
+class AsyncInactiveContacts(AsyncMongoActions):
+    async def get_expired(self, deleted_before: datetime, after: Optional[str] = None, limit: int = 0) -> List[dict]:
+        expired_contacts = self.find_page(
+            {**ActiveCondition.INACTIVE.value, "deletedAt": {"$lt": deleted_before}}, after, limit)
+        return [contact_as_dict async for contact_as_dict in expired_contacts]
+
+    async def purge(self, identities: List[str], deleted_before: datetime) -> int:
+        return await self.delete_many({
+            "_id": {"$in": identities}, **ActiveCondition.INACTIVE.value, "deletedAt": {"$lt": deleted_before}})
+
+    async def get_existing_ids(self, identities: List[str]) -> List[str]:
+        existent_contacts = self.find({"_id": {"$in": identities}}, {"_id": 1})
+        return [contact_as_dict.get("_id") async for contact_as_dict in existent_contacts]
+
+    async def restore(self, contacts: List[dict]) -> List[bool]:
+        return await self.insert_many(contacts)
+
+    async def count_by_state(self) -> Dict[str, int]:
+        groups = await self.aggregate([{"$group": {"_id": "$active", "Count": {"$sum": 1}}}])
+        counts = {"active": 0, "inactive": 0}
+        for group in groups:
+            counts["active" if group.get("_id") is True else "inactive"] += group.get("Count")
+        return counts
+
+
+class AsyncContactArchive(AsyncMongoActions):
+    COLLECTION: str = "contacts_archive"
+    STREAM_BATCH_SIZE: int = config("CONTACTS_STREAM_BATCH_SIZE", default=1000, cast=int)
+
+    async def archive(self, contacts: List[dict]) -> List[bool]:
+        return await self.bulk_write([
+            (contact_as_dict.get("_id"), ReplaceOne({"_id": contact_as_dict.get("_id")}, contact_as_dict, upsert=True))
+            for contact_as_dict in contacts
+        ])
+
+    async def get_many(self, identities: List[str]) -> List[dict]:
+        archived_contacts = self.find({"_id": {"$in": identities}})
+        return [contact_as_dict async for contact_as_dict in archived_contacts]
+
+    async def discard(self, identities: List[str]) -> int:
+        if not identities:
+            return 0
+        return await self.delete_many({"_id": {"$in": identities}})
+
+    async def stream_ids(self) -> AsyncIterator[str]:
+        archived_contacts = self.find({}, {"_id": 1})
+        async for contact_as_dict in archived_contacts.batch_size(self.STREAM_BATCH_SIZE):
+            yield contact_as_dict.get("_id")
+
+    async def count(self) -> int:
+        counts = await self.aggregate([{"$count": "Count"}])
+        return sum(count.get("Count") for count in counts)
+
+
+class AsyncSetExistentContact(AsyncMongoActions):
+    COUNTED_FIELDS: dict = {"active": 1, "phones.type": 1}
+    RETURNING_PREVIOUS_CONCURRENCY: int = config("BULK_RETURNING_PREVIOUS_CONCURRENCY", default=16, cast=int)
+
+    async def update_contact(self, contact_id: str, updates: List[Union[FirstName, LastName, Email, Address, Active, PhoneList]]) -> bool:
+        updates_pipeline = convert_updates_to_pipeline(updates)
+        return await self.update_one_with_pipeline(contact_id, updates_pipeline)
+
+    async def update_contacts(self, updates_per_contact: Dict[str, list]) -> Dict[str, bool]:
+        contacts_ids = list(updates_per_contact)
+        existent_contacts = self.find({"_id": {"$in": contacts_ids}}, {"_id": 1})
+        existent_contacts_ids = {contact_as_dict.get("_id") async for contact_as_dict in existent_contacts}
+        operations = [
+            (contact_id, UpdateOne({"_id": contact_id}, convert_updates_to_pipeline(updates)))
+            for contact_id, updates in updates_per_contact.items()
+        ]
+        update_statuses = await self.bulk_write(operations)
+        return {
+            contact_id: update_status and contact_id in existent_contacts_ids
+            for contact_id, update_status in zip(contacts_ids, update_statuses)
+        }
+
+    async def deactivate_contact(self, contact_id: str) -> Optional[dict]:
+        deactivation_pipeline = build_deactivation_pipeline(datetime.now(timezone.utc))
+        return await self.find_one_and_update(
+            contact_id, ActiveCondition.ACTIVE.value, deactivation_pipeline, self.COUNTED_FIELDS)
+
+    async def deactivate_contacts(self, contacts_ids: List[str]) -> Dict[str, Optional[dict]]:
+        previous_contacts = await self._gather_limited(
+            self.deactivate_contact(contact_id) for contact_id in contacts_ids)
+        return dict(zip(contacts_ids, previous_contacts))
+
+    async def update_contact_returning_previous(self, contact_id: str, updates: List[Union[FirstName, LastName, Email, Address, Active, PhoneList]], filter_fields: Optional[dict] = {}) -> Optional[dict]:
+        updates_pipeline = convert_updates_to_pipeline(updates)
+        return await self.find_one_and_update(contact_id, filter_fields, updates_pipeline, self.COUNTED_FIELDS)
+
+    async def update_contacts_returning_previous(self, updates_per_contact: Dict[str, list], filter_fields: Optional[dict] = {}) -> Dict[str, Optional[dict]]:
+        previous_contacts = await self._gather_limited(
+            self.update_contact_returning_previous(contact_id, updates, filter_fields)
+            for contact_id, updates in updates_per_contact.items()
+        )
+        return dict(zip(updates_per_contact, previous_contacts))
+
+    async def _gather_limited(self, calls: Iterable[Awaitable]) -> list:
+        semaphore = asyncio.Semaphore(self.RETURNING_PREVIOUS_CONCURRENCY)
+
+        async def call_limited(call: Awaitable):
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(*(call_limited(call) for call in calls))
+
+
+class AsyncContactIndexes(AsyncMongoActions):
+    async def ensure_indexes(self) -> list:
+        return await self.create_indexes(contact_indexes)
+
+
+class AsyncContactDetailCache(AsyncRedisActions):
+    KEY_PREFIX: str = "contact:detail:"
+    TTL: int = config("CONTACT_DETAIL_CACHE_TTL", default=300, cast=int)
+    NEGATIVE_TTL: int = config("CONTACT_DETAIL_NEGATIVE_CACHE_TTL", default=30, cast=int)
+    LEASE_TTL: int = config("CONTACT_DETAIL_CACHE_LEASE_TTL", default=10, cast=int)
+    LEASE_PREFIX: str = "lease:"
+
+    async def get(self, contact_id: str) -> Optional[bytes]:
+        cached_contact_detail = await self.get_value(self.KEY_PREFIX + contact_id)
+        if cached_contact_detail is None or cached_contact_detail.startswith(self.LEASE_PREFIX.encode()):
+            return None
+        return cached_contact_detail
+
+    async def take_lease(self, contact_id: str) -> Optional[str]:
+        lease = self.LEASE_PREFIX + uuid4().hex
+        if not await self.set_value(self.KEY_PREFIX + contact_id, lease, self.LEASE_TTL):
+            return None
+        return lease
+
+    async def set(self, contact_id: str, contact_detail_as_json: str, lease: str, found: bool = True) -> bool:
+        expire_seconds = self.TTL if found else self.NEGATIVE_TTL
+        return await self.set_value_if_unchanged(self.KEY_PREFIX + contact_id, contact_detail_as_json, expire_seconds, lease)
+
+    async def invalidate(self, contact_id: str) -> bool:
+        return await self.exclude(self.KEY_PREFIX + contact_id)
+
+    async def invalidate_many(self, contacts_ids: List[str]) -> bool:
+        return await self.exclude_many([self.KEY_PREFIX + contact_id for contact_id in contacts_ids])
+
+    def queue_invalidation(self, transaction: Pipeline, contacts_ids: List[str]):
+        if contacts_ids:
+            transaction.delete(*(self.KEY_PREFIX + contact_id for contact_id in contacts_ids))
+
+
+class AsyncContactVersions(AsyncRedisActions):
+    GLOBAL_KEY: str = "contacts:version"
+    KEY_PREFIX: str = "contact:version:"
+    TTL: int = config("CONTACT_VERSION_TTL", default=86400, cast=int)
+
+    async def get_global_version(self) -> Optional[int]:
+        return await self.get_counter(self.GLOBAL_KEY, self._seed())
+
+    async def get_contact_version(self, contact_id: str) -> Optional[int]:
+        return await self.get_counter(self.KEY_PREFIX + contact_id, self._seed(), self.TTL)
+
+    async def bump(self, contacts_ids: List[str]) -> bool:
+        transaction = self.start_transaction()
+        self.queue_bump(transaction, contacts_ids)
+        return await self.execute_transaction(transaction) is not None
+
+    def queue_bump(self, transaction: Pipeline, contacts_ids: List[str]) -> int:
+        seed = self._seed()
+        transaction.set(self.GLOBAL_KEY, seed, nx=True)
+        transaction.incr(self.GLOBAL_KEY)
+        global_version_index = len(transaction) - 1
+        for contact_id in contacts_ids:
+            transaction.set(self.KEY_PREFIX + contact_id, seed, nx=True)
+            transaction.incr(self.KEY_PREFIX + contact_id)
+            transaction.expire(self.KEY_PREFIX + contact_id, self.TTL)
+        return global_version_index
+
+    @staticmethod
+    def _seed() -> int:
+        return time.time_ns() // 1000
+
+
+class AsyncContactChanges(AsyncRedisActions):
+    ENABLED: bool = config("READ_MODEL_ENABLED", default=False, cast=bool)
+    CHANNEL: str = "contacts:changes"
+
+    async def publish_changes(self, contacts_ids: List[str], version: int):
+        if not self.ENABLED or not contacts_ids:
+            return
+        try:
+            await self.connection.publish(self.CHANNEL, f"{version}:{','.join(contacts_ids)}")
+        except ConnectionError:
+            return
+
+    async def follow_changes(self, timeout: float) -> AsyncIterator[Optional[Tuple[int, List[str]]]]:
+        async with self.connection.pubsub() as pubsub:
+            await pubsub.subscribe(self.CHANNEL)
+            yield None
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+                if message is None:
+                    yield None
+                    continue
+                version, _, contacts_ids = message.get("data").decode().partition(":")
+                yield int(version), contacts_ids.split(",")
+
+
+class AsyncContactCounters(AsyncRedisActions):
+    KEY: str = "contacts:counters"
+
+    async def get(self) -> Optional[dict]:
+        counters = await self.get_hash_counters(self.KEY)
+        if not counters or SEEDED_FIELD not in counters:
+            return None
+        return convert_counters_to_count(counters)
+
+    async def get_counters(self) -> Optional[Dict[str, int]]:
+        return await self.get_hash_counters(self.KEY)
+
+    async def increment(self, increments_list: Iterable[Dict[str, int]]) -> bool:
+        return await self.increment_hash(self.KEY, merge_increments(increments_list))
+
+    def queue_increment(self, transaction: Pipeline, increments_list: Iterable[Dict[str, int]]):
+        for field, increment in merge_increments(increments_list).items():
+            transaction.hincrby(self.KEY, field, increment)
+
+    async def correct(self, current: Dict[str, int], drift: Dict[str, int]) -> bool:
+        return await self.increment_hash_if_unchanged(self.KEY, current, drift)
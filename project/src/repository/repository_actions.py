@@ -1,10 +1,13 @@
-from typing import Dict, Type, Callable, Union
-from typing import List, Iterator, Optional
+from typing import Union, Dict, Tuple
+from typing import List, Iterator, Optional, Callable
 
-from pydantic import BaseModel
+from pymongo import UpdateOne, MongoClient
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
 
 from project.src.core.entities.active import Active
 from project.src.core.entities.address import Address
+from project.src.core.entities.contact_record import ContactRecord
 from project.src.core.entities.contacts import Contact
 from project.src.core.entities.email import Email
 from project.src.core.entities.name import LastName, FirstName
@@ -12,81 +15,194 @@ from project.src.core.entities.phones import PhoneList
 from project.src.core.enum.active import ActiveCondition
 from project.src.repository.MongoActions import MongoActions
 from project.src.repository.RedisActions import RedisActions
-from project.src.repository.utilities.convert_dict_to_contact import convert_dict_to_contact
+from project.src.repository.utilities.build_contact_keys import build_name_key, build_phone_keys
+from project.src.repository.utilities.build_search_keys import build_search_fields, SEARCH_FIELDS
+from project.src.repository.utilities.contact_partitions import build_partition_names, find_partition, \
+    PARTITION_SCOPE
+from project.src.repository.utilities.build_statistics_pipeline import build_statistics_pipeline, \
+    unpack_statistics, count_facets, statistics_facets
+from project.src.repository.utilities.convert_contact_to_dict import convert_contact_to_dict
+from project.src.repository.utilities.convert_dict_to_record import convert_dict_to_record
+from project.src.repository.utilities.contact_indexes import contact_indexes, find_plan_stages
+from project.src.repository.utilities.convert_updates_to_dict import convert_updates_to_pipeline
+from project.src.services.utilities.env_config import config
 
 
 class GetContact(MongoActions):
 
-    def get(self, identity: str) -> Optional[Contact]:
-        contact_detail_as_json = self.find_one(identity, ActiveCondition.ACTIVE.value)
+    def get(self, identity: str, projection: Optional[dict] = None) -> Optional[ContactRecord]:
+        contact_detail_as_json = self.find_one(identity, ActiveCondition.ACTIVE.value, projection)
         if not contact_detail_as_json:
             return
-        contact_detail = convert_dict_to_contact(contact_detail_as_json)
+        contact_detail = convert_dict_to_record(contact_detail_as_json)
         return contact_detail
 
+    def get_document(self, identity: str, projection: Optional[dict] = None) -> Optional[dict]:
+        return self.find_one(identity, ActiveCondition.ACTIVE.value, projection)
+
 
 class GetContactList(MongoActions):
-    def get(self, optional_filter: Optional[dict] = {}) -> List[Contact]:
-        list_of_contacts: Iterator[dict] = self.find_all({**optional_filter, **ActiveCondition.ACTIVE.value})
+    STREAM_BATCH_SIZE: int = config("CONTACTS_STREAM_BATCH_SIZE", default=1000, cast=int)
+
+    def get(self, optional_filter: Optional[dict] = {}, projection: Optional[dict] = None) -> List[ContactRecord]:
+        list_of_contacts: Iterator[dict] = self.find_all({**optional_filter, **ActiveCondition.ACTIVE.value}, projection)
         list_of_contacts_return = [
-            convert_dict_to_contact(contact_as_dict)
+            convert_dict_to_record(contact_as_dict)
             for contact_as_dict in list_of_contacts
         ]
         return list_of_contacts_return
 
+    def get_page(self, optional_filter: Optional[dict] = {}, after: Optional[str] = None, limit: int = 0, projection: Optional[dict] = None) -> List[dict]:
+        list_of_contacts = self.find_page(
+            {**optional_filter, **ActiveCondition.ACTIVE.value}, after, limit, projection)
+        list_of_contacts_return = list(list_of_contacts)
+        return list_of_contacts_return
+
+    def stream(self, optional_filter: Optional[dict] = {}, projection: Optional[dict] = None) -> Iterator[dict]:
+        list_of_contacts = self.find_all({**optional_filter, **ActiveCondition.ACTIVE.value}, projection)
+        for contact_as_dict in list_of_contacts.batch_size(self.STREAM_BATCH_SIZE):
+            yield contact_as_dict
+
+
+class GetContactStatistics(MongoActions):
+    def count(self, optional_filter: Optional[dict] = {}) -> dict:
+        facets_result = self.aggregate(build_statistics_pipeline(optional_filter, count_facets))
+        return unpack_statistics(facets_result)
+
+    def statistics(self, optional_filter: Optional[dict] = {}) -> dict:
+        facets_result = self.aggregate(build_statistics_pipeline(optional_filter, statistics_facets))
+        return unpack_statistics(facets_result)
+
 
 class SetNewContact(MongoActions):
     def register(self, contact: Contact) -> bool:
-        contact_as_json = {
-            "_id": contact.contactId,
-            "firstName": contact.name.firstName,
-            "lastName": contact.name.lastName,
-            "email": contact.email.email,
-            "address": contact.address.full_address,
-            "phones": [{
-                "type": phone.type.value,
-                "number": phone.number,
-            } for phone in contact.phoneList],
-            **ActiveCondition.ACTIVE.value,
-        }
+        contact_as_json = convert_contact_to_dict(contact)
         insert_status = self.insert_one(contact_as_json)
         return insert_status
 
 
 class SoftDeleteContact(RedisActions):
-    def verify_if_contact_was_deleted(self, contact: Contact) -> bool:
+    TOMBSTONE_TTL: int = config("SOFT_DELETE_TOMBSTONE_TTL", default=2592000, cast=int)
+
+    def verify_if_contact_was_deleted(self, contact: Union[Contact, ContactRecord]) -> bool:
         contact_id = contact.contactId
         exists = self.verify_if_exists(contact_id)
         return exists
 
-    def delete_contact_from_redis(self, contact: Contact) -> bool:
+    def delete_contact_from_redis(self, contact: Union[Contact, ContactRecord]) -> bool:
         contact_id = contact.contactId
         exclude = self.exclude(contact_id)
         return exclude
 
-    def add_contact_to_redis(self, contact: Contact) -> bool:
+    def add_contact_to_redis(self, contact: Union[Contact, ContactRecord]) -> bool:
         contact_id = contact.contactId
-        add = self.insert(contact_id)
+        add = self.insert(contact_id, self.TOMBSTONE_TTL or None)
         return add
 
 
 class SetExistentContact(MongoActions):
-    updates_per_entity_methods: Dict[Type[BaseModel], Callable[[BaseModel], dict]] = {
-        FirstName: lambda entity_name: {"firstName": entity_name.firstName},
-        LastName: lambda entity_name: {"lastName": entity_name.lastName},
-        Address: lambda entity_address: {"address": entity_address.full_address},
-        Active: lambda entity_active: {"active": entity_active.is_active},
-        Email: lambda entity_email: {"email": entity_email.email},
-        PhoneList: lambda entity_phone_list: {"phones": [{
-            "type": phone.type.value,
-            "number": phone.number,
-        } for phone in entity_phone_list.phoneList]},
-    }
-
     def update_contact(self, contact_id: str, updates: List[Union[FirstName, LastName, Email, Address, Active, PhoneList]]) -> bool:
-        updates_json = {}
-        for unique_update in updates:
-            update_method = self.updates_per_entity_methods.get(type(unique_update))
-            unique_update_json: dict = update_method(unique_update)
-            updates_json.update(unique_update_json)
-        return self.update_one(contact_id, updates_json)
\ No newline at end of file
+        updates_pipeline = convert_updates_to_pipeline(updates)
+        return self.update_one_with_pipeline(contact_id, updates_pipeline)
+
+
+class ContactIndexes(MongoActions):
+    BACKFILL_BATCH_SIZE: int = 1000
+
+    def ensure_indexes(self) -> list:
+        return self.create_indexes(contact_indexes)
+
+    def backfill_name_keys(self) -> int:
+        return self._backfill(
+            {"firstNameKey": {"$exists": False}},
+            {"firstName": 1},
+            lambda contact_as_dict: {"firstNameKey": build_name_key(contact_as_dict.get("firstName", ""))},
+        )
+
+    def backfill_search_keys(self) -> int:
+        return self._backfill(
+            {"searchKeys": {"$exists": False}},
+            dict.fromkeys(SEARCH_FIELDS, 1),
+            build_search_fields,
+        )
+
+    def backfill_phone_keys(self) -> int:
+        return self._backfill(
+            {"phoneKeys": {"$exists": False}},
+            {"phones.number": 1},
+            lambda contact_as_dict: {"phoneKeys": build_phone_keys(
+                phone.get("number") for phone in contact_as_dict.get("phones", []))},
+        )
+
+    def _backfill(self, filter_fields: dict, projection: dict, build_fields: Callable[[dict], dict]) -> int:
+        contacts_to_backfill = self.find(filter_fields, projection)
+        updated_contacts = 0
+        operations = []
+        for contact_as_dict in contacts_to_backfill.batch_size(self.BACKFILL_BATCH_SIZE):
+            contact_id = contact_as_dict.get("_id")
+            operations.append((contact_id, UpdateOne({"_id": contact_id}, {"$set": build_fields(contact_as_dict)})))
+            if len(operations) >= self.BACKFILL_BATCH_SIZE:
+                updated_contacts += sum(self.bulk_write(operations))
+                operations = []
+        updated_contacts += sum(self.bulk_write(operations))
+        return updated_contacts
+
+    def get_plan_stages(self, filter_fields: dict, sort: Optional[list] = None) -> List[str]:
+        explain_result = self.explain({**filter_fields, **ActiveCondition.ACTIVE.value}, sort)
+        winning_plan = explain_result.get("queryPlanner", {}).get("winningPlan", {})
+        return find_plan_stages(winning_plan)
+
+
+class ContactResharding(MongoActions):
+    BATCH_SIZE: int = 1000
+    DUPLICATE_KEY_ERROR: int = 11000
+
+    def __init__(self, infrastructure: MongoClient, from_count: int, to_count: int, scope: str = PARTITION_SCOPE, collection_name: str = MongoActions.COLLECTION):
+        super().__init__(infrastructure)
+        self.source_partitions = [
+            infrastructure[database][collection]
+            for database, collection in build_partition_names(self.DATABASE, collection_name, from_count, scope)
+        ]
+        self.target_partitions = [
+            infrastructure[database][collection]
+            for database, collection in build_partition_names(self.DATABASE, collection_name, to_count, scope)
+        ]
+
+    def ensure_target_indexes(self) -> list:
+        indexes_per_partition = [collection.create_indexes(contact_indexes) for collection in self.target_partitions]
+        return indexes_per_partition[0]
+
+    def reshard(self) -> Iterator[Tuple[str, int, int]]:
+        for source_collection in self.source_partitions:
+            scanned_contacts = 0
+            moved_contacts = 0
+            contacts_to_move: List[dict] = []
+            for contact_as_dict in source_collection.find().batch_size(self.BATCH_SIZE):
+                scanned_contacts += 1
+                target_collection = self._target_partition(contact_as_dict.get("_id"))
+                if target_collection.full_name != source_collection.full_name:
+                    contacts_to_move.append(contact_as_dict)
+                if scanned_contacts % self.BATCH_SIZE == 0:
+                    moved_contacts += self._move(source_collection, contacts_to_move)
+                    contacts_to_move = []
+                    yield source_collection.full_name, scanned_contacts, moved_contacts
+            moved_contacts += self._move(source_collection, contacts_to_move)
+            yield source_collection.full_name, scanned_contacts, moved_contacts
+
+    def _target_partition(self, identity: str) -> Collection:
+        return self.target_partitions[find_partition(identity, len(self.target_partitions))]
+
+    def _move(self, source_collection: Collection, contacts_to_move: List[dict]) -> int:
+        contacts_per_target: Dict[str, List[dict]] = {}
+        for contact_as_dict in contacts_to_move:
+            contacts_per_target.setdefault(self._target_partition(contact_as_dict.get("_id")).full_name, []).append(contact_as_dict)
+        target_per_name = {collection.full_name: collection for collection in self.target_partitions}
+        for target_name, contacts in contacts_per_target.items():
+            try:
+                target_per_name[target_name].insert_many(contacts, ordered=False)
+            except BulkWriteError as error:
+                if any(write_error.get("code") != self.DUPLICATE_KEY_ERROR for write_error in error.details.get("writeErrors", [])):
+                    raise
+        if contacts_to_move:
+            source_collection.delete_many({"_id": {"$in": [contact_as_dict.get("_id") for contact_as_dict in contacts_to_move]}})
+        return len(contacts_to_move)
@@ -0,0 +1,41 @@
+import math
+from hashlib import blake2b
+from typing import Iterable, Iterator
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, false_positive_rate: float):
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.bits_count = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hashes_count = max(1, round(self.bits_count / capacity * math.log(2)))
+        self.bits = bytearray(math.ceil(self.bits_count / 8))
+        self.items_count = 0
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.items_count += 1
+
+    def update(self, keys: Iterable[str]):
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        filled_ratio = 1 - math.exp(-self.hashes_count * self.items_count / self.bits_count)
+        return filled_ratio ** self.hashes_count
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = blake2b(key.encode(), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], "little")
+        second_hash = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hashes_count):
+            yield (first_hash + index * second_hash) % self.bits_count
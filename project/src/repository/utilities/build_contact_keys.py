@@ -0,0 +1,66 @@
+import re
+import sys
+from typing import Iterable, List, Optional, Tuple
+
+from pymongo import ASCENDING
+
+non_digit_pattern = re.compile(r"\D")
+
+PAGE_CURSOR_SEPARATOR = ":"
+
+
+def build_name_key(name: str) -> str:
+    return name.casefold()
+
+
+def build_prefix_range(lower_bound: str) -> dict:
+    key_range = {"$gte": lower_bound}
+    last_character = ord(lower_bound[-1])
+    if last_character < sys.maxunicode:
+        key_range["$lt"] = lower_bound[:-1] + chr(last_character + 1)
+    return key_range
+
+
+def build_name_prefix_filter(prefix: str) -> dict:
+    return {"firstNameKey": build_prefix_range(build_name_key(prefix))}
+
+
+def build_page_sort(filter_fields: dict) -> List[Tuple[str, int]]:
+    if "firstNameKey" in filter_fields:
+        return [("firstNameKey", ASCENDING), ("_id", ASCENDING)]
+    return [("_id", ASCENDING)]
+
+
+def build_page_cursor(filter_fields: dict, contact_id: str, name_key: str) -> str:
+    if "firstNameKey" in filter_fields:
+        return f"{name_key}{PAGE_CURSOR_SEPARATOR}{contact_id}"
+    return contact_id
+
+
+def build_after_filter(filter_fields: dict, after: str) -> dict:
+    if "firstNameKey" not in filter_fields:
+        return {**filter_fields, "_id": {"$gt": after}}
+    name_key, _, contact_id = after.rpartition(PAGE_CURSOR_SEPARATOR)
+    return {**filter_fields, "$or": [
+        {"firstNameKey": {"$gt": name_key}},
+        {"firstNameKey": name_key, "_id": {"$gt": contact_id}},
+    ]}
+
+
+def build_phone_key(number: str) -> str:
+    return non_digit_pattern.sub("", number or "")[::-1]
+
+
+def build_phone_keys(numbers: Iterable[str]) -> List[str]:
+    return sorted({phone_key for phone_key in map(build_phone_key, numbers) if phone_key})
+
+
+def build_phone_filter(number: str, suffix_digits: Optional[int] = None) -> Optional[dict]:
+    phone_key = build_phone_key(number)
+    if not phone_key:
+        return None
+    if suffix_digits is None:
+        return {"phoneKeys": phone_key}
+    if len(phone_key) < suffix_digits:
+        return None
+    return {"phoneKeys": build_prefix_range(phone_key[:suffix_digits])}
@@ -0,0 +1,50 @@
+from typing import Dict, Iterable
+
+CONTACTS_FIELD = "countContacts"
+PHONE_TYPE_FIELD_PREFIX = "countType:"
+SEEDED_FIELD = "seeded"
+
+
+def build_contact_increments(phones_types: Iterable[str], sign: int) -> Dict[str, int]:
+    increments = {CONTACTS_FIELD: sign}
+    for phone_type in phones_types:
+        phone_type_field = PHONE_TYPE_FIELD_PREFIX + phone_type
+        increments[phone_type_field] = increments.get(phone_type_field, 0) + sign
+    return increments
+
+
+def build_document_increments(contact_as_dict: dict, sign: int) -> Dict[str, int]:
+    return build_contact_increments((phone.get("type") for phone in contact_as_dict.get("phones", [])), sign)
+
+
+def merge_increments(increments_list: Iterable[Dict[str, int]]) -> Dict[str, int]:
+    merged_increments: Dict[str, int] = {}
+    for increments in increments_list:
+        for field, increment in increments.items():
+            merged_increments[field] = merged_increments.get(field, 0) + increment
+    return {field: increment for field, increment in merged_increments.items() if increment}
+
+
+def convert_count_to_counters(contacts_count: dict) -> Dict[str, int]:
+    counters = {CONTACTS_FIELD: contacts_count.get("countContacts", 0), SEEDED_FIELD: 1}
+    for phone_type_group in contacts_count.get("countType", []):
+        counters[PHONE_TYPE_FIELD_PREFIX + phone_type_group.get("_id")] = phone_type_group.get("Count")
+    return counters
+
+
+def convert_counters_to_count(counters: Dict[str, int]) -> dict:
+    return {
+        "countContacts": counters.get(CONTACTS_FIELD, 0),
+        "countType": [{
+            "_id": field[len(PHONE_TYPE_FIELD_PREFIX):],
+            "Count": count,
+        } for field, count in counters.items() if field.startswith(PHONE_TYPE_FIELD_PREFIX)],
+    }
+
+
+def build_counters_drift(expected: Dict[str, int], current: Dict[str, int]) -> Dict[str, int]:
+    return {
+        field: expected.get(field, 0) - current.get(field, 0)
+        for field in sorted(set(expected) | set(current))
+        if expected.get(field, 0) != current.get(field, 0)
+    }
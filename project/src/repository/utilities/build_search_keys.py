@@ -0,0 +1,52 @@
+import re
+import unicodedata
+from typing import Dict, List, Tuple
+
+from project.src.services.utilities.env_config import config
+
+SEARCH_FIELDS: Tuple[str, ...] = ("firstName", "lastName", "email", "address")
+SEARCH_MIN_GRAM: int = config("SEARCH_MIN_GRAM", default=2, cast=int)
+SEARCH_MAX_GRAM: int = config("SEARCH_MAX_GRAM", default=15, cast=int)
+WORD_MARKER = "$"
+
+word_pattern = re.compile(r"\w+")
+
+
+def fold_text(text: str) -> str:
+    decomposed_text = unicodedata.normalize("NFKD", text)
+    return "".join(character for character in decomposed_text if not unicodedata.combining(character)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return word_pattern.findall(fold_text(text or ""))
+
+
+def build_field_search_keys(text: str) -> List[str]:
+    search_keys = set()
+    for word in tokenize(text):
+        search_keys.update(word[:size] for size in range(SEARCH_MIN_GRAM, min(len(word), SEARCH_MAX_GRAM) + 1))
+        search_keys.add(word + WORD_MARKER)
+    return sorted(search_keys)
+
+
+def build_search_fields(contact_fields: Dict[str, str]) -> dict:
+    search_fields = {
+        field: build_field_search_keys(contact_fields.get(field, ""))
+        for field in SEARCH_FIELDS
+    }
+    search_keys = sorted(set().union(*search_fields.values()))
+    return {"searchFields": search_fields, "searchKeys": search_keys}
+
+
+def build_search_keys_refresh() -> dict:
+    return {"$set": {"searchKeys": {"$setUnion": [
+        {"$ifNull": [f"$searchFields.{field}", []]}
+        for field in SEARCH_FIELDS
+    ]}}}
+
+
+def build_query_keys(query: str) -> Tuple[List[str], List[str]]:
+    words = [word for word in dict.fromkeys(tokenize(query)) if len(word) >= SEARCH_MIN_GRAM]
+    prefix_keys = sorted({word[:SEARCH_MAX_GRAM] for word in words}, key=len, reverse=True)
+    word_keys = [word + WORD_MARKER for word in words]
+    return prefix_keys, word_keys
@@ -0,0 +1,31 @@
+from typing import List, Optional, Tuple
+
+from project.src.core.enum.active import ActiveCondition
+
+
+def build_search_pipeline(
+        prefix_keys: List[str],
+        word_keys: List[str],
+        after: Optional[Tuple[int, str]],
+        limit: int,
+        projection: dict,
+) -> list:
+    pipeline = [
+        {"$match": {**ActiveCondition.ACTIVE.value, "searchKeys": {"$all": prefix_keys}}},
+        {"$addFields": {"searchScore": {"$size": {"$filter": {
+            "input": {"$literal": word_keys},
+            "cond": {"$in": ["$$this", "$searchKeys"]},
+        }}}}},
+    ]
+    if after is not None:
+        after_score, after_id = after
+        pipeline.append({"$match": {"$or": [
+            {"searchScore": {"$lt": after_score}},
+            {"searchScore": after_score, "_id": {"$gt": after_id}},
+        ]}})
+    pipeline.extend([
+        {"$sort": {"searchScore": -1, "_id": 1}},
+        {"$limit": limit},
+        {"$project": {**projection, "searchScore": 1}},
+    ])
+    return pipeline
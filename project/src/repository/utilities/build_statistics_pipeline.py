@@ -0,0 +1,73 @@
+from typing import Callable, Dict, List, Optional
+
+from project.src.core.enum.active import ActiveCondition
+
+count_phones_by_type: List[dict] = [
+    {"$unwind": "$phones"},
+    {"$group": {"_id": "$phones.type", "Count": {"$sum": 1}}},
+]
+
+count_by_email_domain: List[dict] = [
+    {"$group": {
+        "_id": {"$toLower": {"$arrayElemAt": [{"$split": ["$email", "@"]}, 1]}},
+        "Count": {"$sum": 1},
+    }},
+    {"$sort": {"Count": -1, "_id": 1}},
+]
+
+count_by_first_letter: List[dict] = [
+    {"$group": {
+        "_id": {"$toUpper": {"$substrCP": ["$firstName", 0, 1]}},
+        "Count": {"$sum": 1},
+    }},
+    {"$sort": {"_id": 1}},
+]
+
+count_facets: Dict[str, List[dict]] = {
+    "countType": count_phones_by_type,
+}
+
+statistics_facets: Dict[str, List[dict]] = {
+    "countType": count_phones_by_type,
+    "countEmailDomain": count_by_email_domain,
+    "countFirstLetter": count_by_first_letter,
+}
+
+
+def build_statistics_pipeline(optional_filter: dict, facets: Dict[str, List[dict]]) -> List[dict]:
+    pipeline = [
+        {"$match": {**optional_filter, **ActiveCondition.ACTIVE.value}},
+        {"$facet": {"countContacts": [{"$count": "Count"}], **facets}},
+    ]
+    return pipeline
+
+
+facets_sort_keys: Dict[str, Callable[[dict], tuple]] = {
+    "countEmailDomain": lambda group: (-group.get("Count"), group.get("_id") or ""),
+    "countFirstLetter": lambda group: (group.get("_id") or "",),
+}
+
+
+def merge_facet_groups(groups_per_partition: List[List[dict]], facet: str) -> List[dict]:
+    counts: Dict[Optional[str], int] = {}
+    for groups in groups_per_partition:
+        for group in groups:
+            counts[group.get("_id")] = counts.get(group.get("_id"), 0) + group.get("Count")
+    merged_groups = [{"_id": group_id, "Count": count} for group_id, count in counts.items()]
+    if facet in facets_sort_keys:
+        merged_groups.sort(key=facets_sort_keys[facet])
+    return merged_groups
+
+
+def unpack_statistics(facets_result: List[dict]) -> dict:
+    if not facets_result:
+        return {}
+    statistics = facets_result[0]
+    if len(facets_result) > 1:
+        statistics = {
+            facet: merge_facet_groups([partition_result.get(facet, []) for partition_result in facets_result], facet)
+            for facet in statistics
+        }
+    count_contacts = statistics.get("countContacts")
+    statistics["countContacts"] = count_contacts[0].get("Count") if count_contacts else 0
+    return statistics
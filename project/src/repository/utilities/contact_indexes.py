@@ -0,0 +1,20 @@
+from typing import List
+
+from pymongo import IndexModel, ASCENDING
+
+contact_indexes: List[IndexModel] = [
+    IndexModel([("active", ASCENDING), ("_id", ASCENDING)], name="active_id"),
+    IndexModel([("active", ASCENDING), ("firstNameKey", ASCENDING), ("_id", ASCENDING)], name="active_first_name_key_id"),
+    IndexModel([("active", ASCENDING), ("searchKeys", ASCENDING), ("_id", ASCENDING)], name="active_search_keys_id"),
+    IndexModel([("active", ASCENDING), ("phoneKeys", ASCENDING), ("_id", ASCENDING)], name="active_phone_keys_id"),
+]
+
+
+def find_plan_stages(plan: dict) -> List[str]:
+    stages = [plan.get("stage")] if plan.get("stage") else []
+    for child_key in ("inputStage", "queryPlan"):
+        if isinstance(plan.get(child_key), dict):
+            stages.extend(find_plan_stages(plan.get(child_key)))
+    for child_plan in plan.get("inputStages", []):
+        stages.extend(find_plan_stages(child_plan))
+    return stages
@@ -0,0 +1,50 @@
+from hashlib import md5
+from typing import Dict, List, Tuple
+
+from project.src.services.utilities.env_config import config
+
+PARTITIONS_COUNT: int = config("CONTACTS_PARTITIONS", default=1, cast=int)
+RESHARD_FROM_COUNT: int = config("CONTACTS_RESHARD_FROM", default=0, cast=int)
+PARTITION_SCOPE: str = config("CONTACTS_PARTITION_SCOPE", default="collection")
+COLLECTION_SCOPE = "collection"
+DATABASE_SCOPE = "database"
+
+JUMP_HASH_MULTIPLIER = 2862933555777941757
+UINT64_MASK = (1 << 64) - 1
+
+
+def jump_hash(key: int, buckets_count: int) -> int:
+    bucket, next_bucket = -1, 0
+    while next_bucket < buckets_count:
+        bucket = next_bucket
+        key = (key * JUMP_HASH_MULTIPLIER + 1) & UINT64_MASK
+        next_bucket = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+def build_partition_key(identity: str) -> int:
+    try:
+        return int(identity[:16], 16)
+    except ValueError:
+        return int.from_bytes(md5(identity.encode()).digest()[:8], "big")
+
+
+def find_partition(identity: str, partitions_count: int) -> int:
+    if partitions_count <= 1:
+        return 0
+    return jump_hash(build_partition_key(identity), partitions_count)
+
+
+def build_partition_names(database: str, collection: str, partitions_count: int, scope: str = PARTITION_SCOPE) -> List[Tuple[str, str]]:
+    if partitions_count <= 1:
+        return [(database, collection)]
+    if scope == DATABASE_SCOPE:
+        return [(f"{database}_{partition}", collection) for partition in range(partitions_count)]
+    return [(database, f"{collection}_{partition}") for partition in range(partitions_count)]
+
+
+def group_positions_by_partition(identities: List[str], partitions_count: int) -> Dict[int, List[int]]:
+    positions_per_partition: Dict[int, List[int]] = {}
+    for position, identity in enumerate(identities):
+        positions_per_partition.setdefault(find_partition(identity, partitions_count), []).append(position)
+    return positions_per_partition
@@ -0,0 +1,76 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from project.src.repository.utilities.build_contact_keys import PAGE_CURSOR_SEPARATOR
+from project.src.repository.utilities.build_counter_increments import build_document_increments, \
+    convert_counters_to_count
+
+NAME_KEY_FIELD = "firstNameKey"
+NAME_RANGE_OPERATORS = {"$gte", "$lt"}
+
+
+class ContactsReadModel:
+    def __init__(self, documents: Iterable[dict] = ()):
+        self.documents: Dict[str, dict] = {document.get("_id"): document for document in documents}
+        self.ids: List[str] = sorted(self.documents)
+        self.name_index: List[Tuple[str, str]] = sorted(
+            (self._name_key(document), contact_id) for contact_id, document in self.documents.items())
+        self.counters: Dict[str, int] = {}
+        for document in self.documents.values():
+            self._count(document, 1)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def get(self, contact_id: str) -> Optional[dict]:
+        return self.documents.get(contact_id)
+
+    def put(self, document: dict):
+        contact_id = document.get("_id")
+        self.remove(contact_id)
+        self.documents[contact_id] = document
+        insort(self.ids, contact_id)
+        insort(self.name_index, (self._name_key(document), contact_id))
+        self._count(document, 1)
+
+    def remove(self, contact_id: str):
+        document = self.documents.pop(contact_id, None)
+        if document is None:
+            return
+        del self.ids[bisect_left(self.ids, contact_id)]
+        del self.name_index[bisect_left(self.name_index, (self._name_key(document), contact_id))]
+        self._count(document, -1)
+
+    @staticmethod
+    def supports_filter(optional_filter: Optional[dict]) -> bool:
+        if not optional_filter:
+            return True
+        name_range = optional_filter.get(NAME_KEY_FIELD)
+        return set(optional_filter) == {NAME_KEY_FIELD} and isinstance(name_range, dict) \
+            and "$gte" in name_range and set(name_range) <= NAME_RANGE_OPERATORS
+
+    def find_page(self, optional_filter: Optional[dict] = {}, after: Optional[str] = None, limit: int = 0) -> List[dict]:
+        if not optional_filter:
+            start = bisect_right(self.ids, after) if after is not None else 0
+            contacts_ids = self.ids[start:start + limit] if limit else self.ids[start:]
+            return [self.documents[contact_id] for contact_id in contacts_ids]
+        name_range = optional_filter.get(NAME_KEY_FIELD)
+        start = bisect_left(self.name_index, (name_range.get("$gte"),))
+        if after is not None:
+            name_key, _, contact_id = after.rpartition(PAGE_CURSOR_SEPARATOR)
+            start = max(start, bisect_right(self.name_index, (name_key, contact_id)))
+        end = bisect_left(self.name_index, (name_range.get("$lt"),)) if "$lt" in name_range else len(self.name_index)
+        if limit:
+            end = min(end, start + limit)
+        return [self.documents[contact_id] for _, contact_id in self.name_index[start:end]]
+
+    def count(self) -> dict:
+        return convert_counters_to_count(self.counters)
+
+    def _count(self, document: dict, sign: int):
+        for field, increment in build_document_increments(document, sign).items():
+            self.counters[field] = self.counters.get(field, 0) + increment
+
+    @staticmethod
+    def _name_key(document: dict) -> str:
+        return document.get(NAME_KEY_FIELD) or ""
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from project.src.core.entities.contacts import Contact
+from project.src.core.enum.active import ActiveCondition
+from project.src.repository.utilities.build_contact_keys import build_name_key, build_phone_keys
+from project.src.repository.utilities.build_search_keys import build_search_fields
+
+
+def convert_contact_to_dict(contact: Contact) -> dict:
+    contact_as_dict = {
+        "_id": contact.contactId,
+        "firstName": contact.name.firstName,
+        "firstNameKey": build_name_key(contact.name.firstName),
+        "lastName": contact.name.lastName,
+        "email": contact.email.email,
+        "address": contact.address.full_address,
+        "phones": [{
+            "type": phone.type.value,
+            "number": phone.number,
+        } for phone in contact.phoneList],
+        "phoneKeys": build_phone_keys(phone.number for phone in contact.phoneList),
+        **ActiveCondition.ACTIVE.value,
+    }
+    contact_as_dict.update(build_search_fields(contact_as_dict))
+    return contact_as_dict
+
+
+def convert_contact_to_registration(contact: Contact, registered_at: datetime) -> dict:
+    contact_as_dict = convert_contact_to_dict(contact)
+    contact_as_dict.pop("_id")
+    return {
+        "$set": contact_as_dict,
+        "$setOnInsert": {"createdAt": registered_at},
+        "$unset": {"deletedAt": ""},
+    }
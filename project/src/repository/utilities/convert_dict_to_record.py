@@ -0,0 +1,17 @@
+from project.src.core.entities.contact_record import ContactRecord
+
+
+def convert_dict_to_record(contact_as_dict: dict) -> ContactRecord:
+    contact = ContactRecord(
+        contact_as_dict.get("_id"),
+        contact_as_dict.get("firstName"),
+        contact_as_dict.get("lastName"),
+        contact_as_dict.get("email"),
+        contact_as_dict.get("address"),
+        tuple(
+            (phone.get("type"), phone.get("number"))
+            for phone in contact_as_dict.get("phones", ())
+        ),
+        contact_as_dict.get("active"),
+    )
+    return contact
@@ -0,0 +1,5 @@
+from typing import Dict
+
+
+def convert_hash_to_counters(hash_values: Dict[bytes, bytes]) -> Dict[str, int]:
+    return {field.decode(): int(value) for field, value in hash_values.items()}
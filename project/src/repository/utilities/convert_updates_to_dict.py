@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import Dict, Type, Callable, Union, Iterable
+
+from pydantic import BaseModel
+
+from project.src.core.entities.active import Active
+from project.src.core.entities.address import Address
+from project.src.core.entities.email import Email
+from project.src.core.entities.name import LastName, FirstName
+from project.src.core.entities.phones import PhoneList
+from project.src.core.enum.active import ActiveCondition
+from project.src.repository.utilities.build_contact_keys import build_name_key, build_phone_keys
+from project.src.repository.utilities.build_search_keys import build_field_search_keys, build_search_keys_refresh
+
+updates_per_entity_methods: Dict[Type[BaseModel], Callable[[BaseModel], dict]] = {
+    FirstName: lambda entity_name: {
+        "firstName": entity_name.firstName,
+        "firstNameKey": build_name_key(entity_name.firstName),
+        "searchFields.firstName": build_field_search_keys(entity_name.firstName),
+    },
+    LastName: lambda entity_name: {
+        "lastName": entity_name.lastName,
+        "searchFields.lastName": build_field_search_keys(entity_name.lastName),
+    },
+    Address: lambda entity_address: {
+        "address": entity_address.full_address,
+        "searchFields.address": build_field_search_keys(entity_address.full_address),
+    },
+    Active: lambda entity_active: {"active": entity_active.is_active},
+    Email: lambda entity_email: {
+        "email": entity_email.email,
+        "searchFields.email": build_field_search_keys(entity_email.email),
+    },
+    PhoneList: lambda entity_phone_list: {
+        "phones": [{
+            "type": phone.type.value,
+            "number": phone.number,
+        } for phone in entity_phone_list.phoneList],
+        "phoneKeys": build_phone_keys(phone.number for phone in entity_phone_list.phoneList),
+    },
+}
+
+
+def convert_updates_to_dict(updates: Iterable[Union[FirstName, LastName, Email, Address, Active, PhoneList]]) -> dict:
+    updates_json = {}
+    for unique_update in updates:
+        update_method = updates_per_entity_methods.get(type(unique_update))
+        unique_update_json: dict = update_method(unique_update)
+        updates_json.update(unique_update_json)
+    return updates_json
+
+
+def convert_updates_to_pipeline(updates: Iterable[Union[FirstName, LastName, Email, Address, Active, PhoneList]]) -> list:
+    updates_json = convert_updates_to_dict(updates)
+    pipeline = [{"$set": {field: {"$literal": value} for field, value in updates_json.items()}}]
+    if any(field.startswith("searchFields.") for field in updates_json):
+        pipeline.append(build_search_keys_refresh())
+    return pipeline
+
+
+def build_deactivation_pipeline(deleted_at: datetime) -> list:
+    return [{"$set": {**ActiveCondition.INACTIVE.value, "deletedAt": {"$literal": deleted_at}}}]
@@ -0,0 +1,9 @@
+from typing import List, Optional
+
+
+def convert_write_errors_to_statuses(operations_count: int, bulk_write_details: Optional[dict] = None) -> List[bool]:
+    statuses = [True] * operations_count
+    write_errors = (bulk_write_details or {}).get("writeErrors", [])
+    for write_error in write_errors:
+        statuses[write_error.get("index")] = False
+    return statuses
@@ -0,0 +1,81 @@
+import heapq
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from pymongo import ASCENDING
+
+
+def build_sort_key(page_sort: List[Tuple[str, int]]) -> Callable[[dict], tuple]:
+    return lambda document: tuple(document.get(field) for field, _ in page_sort)
+
+
+class MergedCursor:
+    def __init__(self, cursors: list, limit: int = 0, page_sort: List[Tuple[str, int]] = [("_id", ASCENDING)]):
+        self.cursors = cursors
+        self.limit = limit
+        self.sort_key = build_sort_key(page_sort)
+        self.documents: Optional[Iterator[dict]] = None
+
+    def batch_size(self, batch_size: int) -> "MergedCursor":
+        self.cursors = [cursor.batch_size(batch_size) for cursor in self.cursors]
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> dict:
+        if self.documents is None:
+            self.documents = self._merge()
+        return next(self.documents)
+
+    def _merge(self) -> Iterator[dict]:
+        last_key = None
+        yielded = 0
+        for document in heapq.merge(*self.cursors, key=self.sort_key):
+            document_key = self.sort_key(document)
+            if document_key == last_key:
+                continue
+            last_key = document_key
+            yield document
+            yielded += 1
+            if yielded == self.limit:
+                return
+
+
+class AsyncMergedCursor:
+    def __init__(self, cursors: list, limit: int = 0, page_sort: List[Tuple[str, int]] = [("_id", ASCENDING)]):
+        self.cursors = cursors
+        self.limit = limit
+        self.sort_key = build_sort_key(page_sort)
+        self.heads: Optional[List[tuple]] = None
+        self.last_key = None
+        self.yielded = 0
+
+    def batch_size(self, batch_size: int) -> "AsyncMergedCursor":
+        self.cursors = [cursor.batch_size(batch_size) for cursor in self.cursors]
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        if self.heads is None:
+            self.heads = []
+            self.cursors = [cursor.__aiter__() for cursor in self.cursors]
+            for position in range(len(self.cursors)):
+                await self._advance(position)
+        while self.heads and (not self.limit or self.yielded < self.limit):
+            document_key, position, document = heapq.heappop(self.heads)
+            await self._advance(position)
+            if document_key == self.last_key:
+                continue
+            self.last_key = document_key
+            self.yielded += 1
+            return document
+        raise StopAsyncIteration
+
+    async def _advance(self, position: int):
+        try:
+            document = await self.cursors[position].__anext__()
+        except StopAsyncIteration:
+            return
+        heapq.heappush(self.heads, (self.sort_key(document), position, document))
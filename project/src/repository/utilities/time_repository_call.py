@@ -0,0 +1,95 @@
+import functools
+import time
+from typing import Callable
+
+from project.src.services.utilities.metrics import repository_call_duration_seconds, repository_calls_in_flight
+
+MONGO = "mongo"
+REDIS = "redis"
+
+
+def time_call(store: str) -> Callable:
+    def decorator(method: Callable) -> Callable:
+        duration = repository_call_duration_seconds.labels(store, method.__name__)
+        in_flight = repository_calls_in_flight.labels(store)
+
+        @functools.wraps(method)
+        def timed_method(*args, **kwargs):
+            in_flight.inc()
+            started_at = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                duration.observe(time.perf_counter() - started_at)
+                in_flight.dec()
+        return timed_method
+    return decorator
+
+
+def time_async_call(store: str) -> Callable:
+    def decorator(method: Callable) -> Callable:
+        duration = repository_call_duration_seconds.labels(store, method.__name__)
+        in_flight = repository_calls_in_flight.labels(store)
+
+        @functools.wraps(method)
+        async def timed_method(*args, **kwargs):
+            in_flight.inc()
+            started_at = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                duration.observe(time.perf_counter() - started_at)
+                in_flight.dec()
+        return timed_method
+    return decorator
+
+
+class TimedCursor:
+    def __init__(self, cursor, duration):
+        self.cursor = cursor
+        self.duration = duration
+        self.elapsed = 0.0
+
+    def batch_size(self, batch_size: int) -> "TimedCursor":
+        self.cursor = self.cursor.batch_size(batch_size)
+        return self
+
+    def __getattr__(self, name: str):
+        return getattr(self.cursor, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        started_at = time.perf_counter()
+        try:
+            return next(self.cursor)
+        except StopIteration:
+            self.duration.observe(self.elapsed + time.perf_counter() - started_at)
+            raise
+        finally:
+            self.elapsed += time.perf_counter() - started_at
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        started_at = time.perf_counter()
+        try:
+            return await self.cursor.__anext__()
+        except StopAsyncIteration:
+            self.duration.observe(self.elapsed + time.perf_counter() - started_at)
+            raise
+        finally:
+            self.elapsed += time.perf_counter() - started_at
+
+
+def time_cursor(store: str) -> Callable:
+    def decorator(method: Callable) -> Callable:
+        duration = repository_call_duration_seconds.labels(store, method.__name__)
+
+        @functools.wraps(method)
+        def timed_method(*args, **kwargs) -> TimedCursor:
+            return TimedCursor(method(*args, **kwargs), duration)
+        return timed_method
+    return decorator
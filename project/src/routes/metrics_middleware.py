@@ -0,0 +1,53 @@
+import time
+
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from project.src.services.utilities.metrics import http_request_duration_seconds, http_responses, \
+    http_requests_in_flight
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def get_route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, excluded_prefix: str = "/metrics"):
+        self.app = app
+        self.excluded_prefix = excluded_prefix
+        self.route_metrics = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"].startswith(self.excluded_prefix):
+            await self.app(scope, receive, send)
+            return
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            http_requests_in_flight.dec()
+            duration, responses = self._get_route_metrics(scope["method"], get_route_template(scope), status_code)
+            duration.observe(elapsed)
+            responses.inc()
+
+    def _get_route_metrics(self, method: str, route: str, status_code: int) -> tuple:
+        route_metrics = self.route_metrics.get((method, route, status_code))
+        if route_metrics is None:
+            route_metrics = (
+                http_request_duration_seconds.labels(method, route),
+                http_responses.labels(method, route, str(status_code)),
+            )
+            self.route_metrics[(method, route, status_code)] = route_metrics
+        return route_metrics
@@ -1,71 +1,307 @@
-from fastapi import APIRouter
+from typing import Optional, List
 
-from project.src.core.entities.contacts import ContactParameters, ContactOptionalParameters
+from fastapi import APIRouter, Query, Body, Header, Response, Request
+from fastapi.responses import StreamingResponse, JSONResponse
+from starlette.status import HTTP_304_NOT_MODIFIED, HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
+
+from project.src.core.entities.contacts import ContactParameters, ContactOptionalParameters, \
+    ContactBulkUpdateParameters
+from project.src.core.enum.contact_file_format import ContactFileFormat
+from project.src.core.enum.status import Status
 from project.src.core.interfaces.services_interfaces import InterfaceRegister, InterfaceList, InterfaceDetail, \
-    InterfaceUpdate, InterfaceDelete
-from project.src.infrastructure.mongo_connection import MongoConnection
-from project.src.infrastructure.redis_connection import RedisConnection
-from project.src.services.service_actions import RegisterContact, ListsContacts, CountContacts, ContactDetail, \
-    UpdateContact, DeleteContact
+    InterfaceUpdate, InterfaceDelete, InterfacePage, InterfaceStream, InterfaceBulkRegister, InterfaceBulkUpdate, \
+    InterfaceBulkDelete, InterfaceEntityTag, InterfaceReadiness, InterfaceSearch, \
+    InterfaceExport, InterfaceImport
+from project.src.infrastructure.mongo_connection import AsyncMongoConnection
+from project.src.infrastructure.process_pool import ValidationProcessPool
+from project.src.infrastructure.redis_connection import AsyncRedisConnection
+from project.src.repository.utilities.build_contact_keys import build_name_prefix_filter, build_phone_filter
+from project.src.services.service_actions import AsyncRegisterContact, AsyncListsContacts, AsyncCountContacts, \
+    AsyncContactDetail, AsyncUpdateContact, AsyncDeleteContact, AsyncStatisticsContacts, AsyncContactsEntityTag, \
+    AsyncReadiness, AsyncSearchContacts, AsyncExportContacts, AsyncImportContacts
+from project.src.services.utilities.build_entity_tag import entity_tag_matches
+from project.src.services.utilities.convert_document_to_export import media_type_per_export_format
+from project.src.services.utilities.convert_document_to_json import split_contact_fields
 from project.src.services.utilities.env_config import config
 
 route = APIRouter(prefix=config("ROUTERS_PREFIX"))
 
+PAGE_SIZE = config("CONTACTS_PAGE_SIZE", default=100, cast=int)
+MAX_PAGE_SIZE = config("CONTACTS_MAX_PAGE_SIZE", default=1000, cast=int)
+PHONE_MIN_SUFFIX_DIGITS = config("PHONE_MIN_SUFFIX_DIGITS", default=4, cast=int)
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ETAG_HEADER = "ETag"
+
+
+def not_modified(entity_tag: Optional[str], if_none_match: Optional[str]) -> Optional[Response]:
+    if entity_tag and entity_tag_matches(if_none_match, entity_tag):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: entity_tag})
+    return None
+
+
+def tag_response(response: Response, entity_tag: Optional[str]):
+    if entity_tag:
+        response.headers[ETAG_HEADER] = entity_tag
+
 
 @route.post("/register")
-def register_contact(contact: ContactParameters):
-    mongo_connection = MongoConnection.get_singleton_connection()
-    redis_connection = RedisConnection.get_singleton_connection()
-    register_service: InterfaceRegister = RegisterContact(mongo_connection, redis_connection)
-    register_return = register_service.register(contact)
+async def register_contact(contact: ContactParameters):
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    register_service: InterfaceRegister = AsyncRegisterContact(mongo_connection, redis_connection)
+    register_return = await register_service.register(contact)
+    return register_return
+
+
+@route.post("/register/bulk")
+async def register_contacts(contacts: List[ContactParameters]):
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    register_service: InterfaceBulkRegister = AsyncRegisterContact(mongo_connection, redis_connection)
+    register_return = await register_service.register_many(contacts)
     return register_return
 
 
 @route.get("/contacts")
-def lists_contacts():
-    mongo_connection = MongoConnection.get_singleton_connection()
-    list_contact_service: InterfaceList = ListsContacts(mongo_connection)
-    contacts_list = list_contact_service.get_list()
+async def lists_contacts(
+        response: Response,
+        after: Optional[str] = None,
+        limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        stream: bool = False,
+        fields: Optional[str] = None,
+        if_none_match: Optional[str] = Header(None),
+):
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    entity_tag_service: InterfaceEntityTag = AsyncContactsEntityTag(redis_connection)
+    entity_tag = await entity_tag_service.get_list_tag(
+        "contacts", after, limit, stream, fields, from_read_model=not stream)
+    not_modified_response = not_modified(entity_tag, if_none_match)
+    if not_modified_response:
+        return not_modified_response
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    if stream:
+        stream_contact_service: InterfaceStream = AsyncListsContacts(mongo_connection)
+        contacts_stream = stream_contact_service.stream(fields=split_contact_fields(fields))
+        stream_response = StreamingResponse(contacts_stream, media_type=NDJSON_MEDIA_TYPE)
+        tag_response(stream_response, entity_tag)
+        return stream_response
+    list_contact_service: InterfacePage = AsyncListsContacts(mongo_connection)
+    contacts_list = await list_contact_service.get_page(after=after, limit=limit, fields=split_contact_fields(fields))
+    tag_response(response, entity_tag)
     return contacts_list
 
 
 @route.get("/count")
-def lists_phones():
-    mongo_connection = MongoConnection.get_singleton_connection()
-    count_contact_service: InterfaceList = CountContacts(mongo_connection)
-    contacts_list = count_contact_service.get_list()
+async def lists_phones(response: Response, if_none_match: Optional[str] = Header(None)):
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    entity_tag_service: InterfaceEntityTag = AsyncContactsEntityTag(redis_connection)
+    entity_tag = await entity_tag_service.get_list_tag("count", from_read_model=True)
+    not_modified_response = not_modified(entity_tag, if_none_match)
+    if not_modified_response:
+        return not_modified_response
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    count_contact_service: InterfaceList = AsyncCountContacts(mongo_connection, redis_connection)
+    contacts_list = await count_contact_service.get_list()
+    tag_response(response, entity_tag)
     return contacts_list
 
 
+@route.get("/stats")
+async def contacts_statistics(response: Response, if_none_match: Optional[str] = Header(None)):
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    entity_tag_service: InterfaceEntityTag = AsyncContactsEntityTag(redis_connection)
+    entity_tag = await entity_tag_service.get_list_tag("stats")
+    not_modified_response = not_modified(entity_tag, if_none_match)
+    if not_modified_response:
+        return not_modified_response
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    statistics_contact_service: InterfaceList = AsyncStatisticsContacts(mongo_connection)
+    contacts_statistics_result = await statistics_contact_service.get_list()
+    tag_response(response, entity_tag)
+    return contacts_statistics_result
+
+
 @route.get("/contact/{_id}")
-def contact_detail(_id: str):
-    mongo_connection = MongoConnection.get_singleton_connection()
-    get_contact_detail_service: InterfaceDetail = ContactDetail(mongo_connection)
-    contact_details = get_contact_detail_service.get_detail(_id)
+async def contact_detail(
+        _id: str,
+        response: Response,
+        fields: Optional[str] = None,
+        if_none_match: Optional[str] = Header(None),
+):
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    entity_tag_service: InterfaceEntityTag = AsyncContactsEntityTag(redis_connection)
+    entity_tag = await entity_tag_service.get_contact_tag(_id, fields, from_read_model=True)
+    not_modified_response = not_modified(entity_tag, if_none_match)
+    if not_modified_response:
+        return not_modified_response
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    get_contact_detail_service: InterfaceDetail = AsyncContactDetail(mongo_connection, redis_connection)
+    contact_details = await get_contact_detail_service.get_detail(_id, split_contact_fields(fields))
+    tag_response(response, entity_tag)
     return contact_details
 
 
+@route.get("/contact/by-phone/{number}")
+async def contacts_by_phone(
+        number: str,
+        response: Response,
+        suffix: Optional[int] = Query(None, ge=PHONE_MIN_SUFFIX_DIGITS),
+        after: Optional[str] = None,
+        limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        fields: Optional[str] = None,
+        if_none_match: Optional[str] = Header(None),
+):
+    filter_for_phone = build_phone_filter(number, suffix)
+    if not filter_for_phone:
+        return {'status': Status.ERROR.value}
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    entity_tag_service: InterfaceEntityTag = AsyncContactsEntityTag(redis_connection)
+    entity_tag = await entity_tag_service.get_list_tag("phone", number, suffix, after, limit, fields)
+    not_modified_response = not_modified(entity_tag, if_none_match)
+    if not_modified_response:
+        return not_modified_response
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    list_contact_service: InterfacePage = AsyncListsContacts(mongo_connection)
+    contacts_list_for_phone = await list_contact_service.get_page(
+        filter_for_phone, after, limit, split_contact_fields(fields))
+    tag_response(response, entity_tag)
+    return contacts_list_for_phone
+
+
+@route.put("/edit/bulk")
+async def contacts_update(updates: List[ContactBulkUpdateParameters]):
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    get_contact_update_service: InterfaceBulkUpdate = AsyncUpdateContact(mongo_connection, redis_connection)
+    contacts_updates = await get_contact_update_service.update_many(updates)
+    return contacts_updates
+
+
 @route.put("/edit/{_id}")
-def contact_update(_id: str, updates: ContactOptionalParameters):
-    mongo_connection = MongoConnection.get_singleton_connection()
-    get_contact_update_service: InterfaceUpdate = UpdateContact(mongo_connection)
-    contact_updates = get_contact_update_service.update(_id, updates)
+async def contact_update(_id: str, updates: ContactOptionalParameters):
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    get_contact_update_service: InterfaceUpdate = AsyncUpdateContact(mongo_connection, redis_connection)
+    contact_updates = await get_contact_update_service.update(_id, updates)
     return contact_updates
 
 
+@route.delete("/remove/bulk")
+async def delete_contacts(contacts_ids: List[str] = Body(...)):
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    get_contact_delete_service: InterfaceBulkDelete = AsyncDeleteContact(mongo_connection, redis_connection)
+    contacts_deleted = await get_contact_delete_service.delete_many(contacts_ids)
+    return contacts_deleted
+
+
 @route.delete("/remove/{_id}")
-def delete_contact(_id: str):
-    mongo_connection = MongoConnection.get_singleton_connection()
-    redis_connection = RedisConnection.get_singleton_connection()
-    get_contact_delete_service: InterfaceDelete = DeleteContact(mongo_connection, redis_connection)
-    contact_deleted = get_contact_delete_service.delete(_id)
+async def delete_contact(_id: str):
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    get_contact_delete_service: InterfaceDelete = AsyncDeleteContact(mongo_connection, redis_connection)
+    contact_deleted = await get_contact_delete_service.delete(_id)
     return contact_deleted
 
 
-@route.get("/contacts/{letter}")
-def list_contact_by_letter(letter: str):
-    mongo_connection = MongoConnection.get_singleton_connection()
-    list_contact_service: InterfaceList = ListsContacts(mongo_connection)
-    filter_for_letter = {"firstName": {"$regex": f"^{letter.upper()}|^{letter.lower()}"}}
-    contacts_list_for_letter = list_contact_service.get_list(filter_for_letter)
+@route.get("/contacts/{prefix}")
+async def list_contact_by_letter(
+        prefix: str,
+        response: Response,
+        after: Optional[str] = None,
+        limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        stream: bool = False,
+        fields: Optional[str] = None,
+        if_none_match: Optional[str] = Header(None),
+):
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    entity_tag_service: InterfaceEntityTag = AsyncContactsEntityTag(redis_connection)
+    entity_tag = await entity_tag_service.get_list_tag(
+        "contacts", prefix, after, limit, stream, fields, from_read_model=not stream)
+    not_modified_response = not_modified(entity_tag, if_none_match)
+    if not_modified_response:
+        return not_modified_response
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    filter_for_letter = build_name_prefix_filter(prefix)
+    if stream:
+        stream_contact_service: InterfaceStream = AsyncListsContacts(mongo_connection)
+        contacts_stream = stream_contact_service.stream(filter_for_letter, split_contact_fields(fields))
+        stream_response = StreamingResponse(contacts_stream, media_type=NDJSON_MEDIA_TYPE)
+        tag_response(stream_response, entity_tag)
+        return stream_response
+    list_contact_service: InterfacePage = AsyncListsContacts(mongo_connection)
+    contacts_list_for_letter = await list_contact_service.get_page(
+        filter_for_letter, after, limit, split_contact_fields(fields))
+    tag_response(response, entity_tag)
     return contacts_list_for_letter
+
+
+@route.get("/search")
+async def search_contacts(
+        response: Response,
+        q: str = Query(..., min_length=1),
+        after: Optional[str] = None,
+        limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        fields: Optional[str] = None,
+        if_none_match: Optional[str] = Header(None),
+):
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    entity_tag_service: InterfaceEntityTag = AsyncContactsEntityTag(redis_connection)
+    entity_tag = await entity_tag_service.get_list_tag("search", q, after, limit, fields)
+    not_modified_response = not_modified(entity_tag, if_none_match)
+    if not_modified_response:
+        return not_modified_response
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    search_contact_service: InterfaceSearch = AsyncSearchContacts(mongo_connection)
+    contacts_list = await search_contact_service.search(q, after, limit, split_contact_fields(fields))
+    tag_response(response, entity_tag)
+    return contacts_list
+
+
+@route.get("/export")
+async def export_contacts(
+        export_format: ContactFileFormat = Query(ContactFileFormat.ndjson, alias="format"),
+        after: Optional[str] = None,
+        gzip: bool = False,
+        if_none_match: Optional[str] = Header(None),
+):
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    entity_tag_service: InterfaceEntityTag = AsyncContactsEntityTag(redis_connection)
+    entity_tag = await entity_tag_service.get_list_tag("export", export_format.value, after, gzip)
+    not_modified_response = not_modified(entity_tag, if_none_match)
+    if not_modified_response:
+        return not_modified_response
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    export_service: InterfaceExport = AsyncExportContacts(mongo_connection)
+    export_stream = export_service.export(export_format, after, gzip)
+    headers = {"Content-Disposition": f'attachment; filename="contacts.{export_format.value}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    export_response = StreamingResponse(
+        export_stream, media_type=media_type_per_export_format.get(export_format), headers=headers)
+    tag_response(export_response, entity_tag)
+    return export_response
+
+
+@route.post("/import")
+async def import_contacts(
+        request: Request,
+        import_format: ContactFileFormat = Query(ContactFileFormat.ndjson, alias="format"),
+):
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    import_service: InterfaceImport = AsyncImportContacts(
+        mongo_connection, redis_connection, ValidationProcessPool.get_singleton_pool())
+    import_summary = await import_service.import_summary(request.stream(), import_format)
+    return import_summary
+
+
+@route.get("/ready")
+async def readiness():
+    mongo_connection = AsyncMongoConnection.get_singleton_connection()
+    redis_connection = AsyncRedisConnection.get_singleton_connection()
+    readiness_service: InterfaceReadiness = AsyncReadiness(
+        mongo_connection, redis_connection, AsyncMongoConnection.pool_statistics)
+    readiness_result = await readiness_service.check()
+    ready = readiness_result["status"] == Status.SUCCESS.value
+    return JSONResponse(readiness_result, status_code=HTTP_200_OK if ready else HTTP_503_SERVICE_UNAVAILABLE)
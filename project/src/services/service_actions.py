@@ -1,43 +1,88 @@
-from typing import Optional, List, Dict, Callable, Any
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone, timedelta
+from concurrent.futures import Executor
+from contextvars import ContextVar
+from typing import Optional, List, Dict, Callable, Any, Iterator, AsyncIterator, Awaitable, Tuple
 
 from pydantic import BaseModel
+from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import MongoClient
+from pymongo.errors import PyMongoError
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import ConnectionError
 
 from project.src.core.entities.active import Active
 from project.src.core.entities.address import Address
-from project.src.core.entities.contacts import Contact, ContactParameters, ContactOptionalParameters
+from project.src.core.entities.contacts import Contact, ContactParameters, ContactOptionalParameters, \
+    ContactBulkUpdateParameters
 from project.src.core.entities.email import Email
 from project.src.core.entities.name import FirstName, LastName
 from project.src.core.entities.phones import PhoneList, Phone
+from project.src.core.enum.contact_file_format import ContactFileFormat
 from project.src.core.enum.phone_type import PhoneType
 from project.src.core.enum.status import Status
 from project.src.core.interfaces.services_interfaces import InterfaceDetail, InterfaceList, InterfaceRegister, \
-    InterfaceDelete, InterfaceUpdate
+    InterfaceDelete, InterfaceUpdate, InterfacePage, InterfaceStream, InterfaceBulkRegister, InterfaceBulkUpdate, \
+    InterfaceBulkDelete, InterfaceEntityTag, InterfaceReadiness, InterfaceSearch, InterfaceReconciliation, \
+    InterfaceExport, InterfaceImport, InterfaceArchive
+from project.src.infrastructure.pool_statistics import MongoPoolStatistics, redis_pool_statistics
+from project.src.repository.AsyncMongoActions import AsyncMongoActions
+from project.src.repository.AsyncRedisActions import AsyncRedisActions
+from project.src.repository.async_repository_actions import AsyncGetContact, AsyncGetContactList, \
+    AsyncGetContactStatistics, AsyncSetNewContact, AsyncSoftDeleteContact, AsyncSetExistentContact, \
+    AsyncContactDetailCache, AsyncContactVersions, AsyncGetContactSearch, AsyncContactCounters, AsyncContactChanges, \
+    AsyncInactiveContacts, AsyncContactArchive
 from project.src.repository.repository_actions import GetContact, GetContactList, SetExistentContact, SetNewContact, \
-    SoftDeleteContact
+    SoftDeleteContact, GetContactStatistics
+from project.src.repository.utilities.build_contact_keys import build_page_cursor
+from project.src.repository.utilities.build_counter_increments import build_contact_increments, \
+    build_document_increments, build_counters_drift, convert_count_to_counters
+from project.src.repository.utilities.build_search_keys import build_query_keys
+from project.src.repository.utilities.contacts_read_model import ContactsReadModel, NAME_KEY_FIELD
+from project.src.services.utilities.build_entity_tag import build_entity_tag
+from project.src.services.utilities.compress_stream import compress_stream
+from project.src.services.utilities.convert_bulk_statuses import BULK_MAX_SIZE, convert_bulk_statuses_to_json
+from project.src.services.utilities.convert_document_to_export import EXPORT_FIELDS, \
+    render_methods_per_export_format, header_methods_per_export_format
+from project.src.services.utilities.convert_document_to_json import are_valid_contact_fields, \
+    build_contact_projection, convert_document_to_json
+from project.src.services.utilities.env_config import config
+from project.src.services.utilities.metrics import contact_detail_cache_hits, contact_detail_cache_misses, \
+    register_batch_size, register_queue_size, read_model_reads, read_model_contacts, read_model_staleness_seconds, \
+    contacts_stored, contacts_archived, contacts_restored
+from project.src.services.utilities.parse_contacts_file import parse_methods_per_file_format, batch_contact_rows
+from project.src.services.utilities.single_flight import single_flight, tagged_version
 from project.src.services.utilities.transform_parameters_to_contact import transform_parameters_to_contact
+from project.src.services.utilities.validate_contact_rows import validate_contact_rows, build_row_error
+
+logger = logging.getLogger(__name__)
 
 
 class ContactDetail(InterfaceDetail):
+    DETAIL_FIELDS: List[str] = ["contactId", "firstName", "lastName", "email", "address", "phoneList"]
+
     def __init__(self, infrastructure: MongoClient):
         self.infrastructure = infrastructure
 
-    def get_detail(self, _id: str) -> dict:
+    def get_detail(self, _id: str, fields: Optional[List[str]] = None) -> dict:
+        fields = fields or self.DETAIL_FIELDS
+        if not are_valid_contact_fields(fields):
+            return {"status": Status.ERROR.value}
         contact_detail_repository = GetContact(self.infrastructure)
-        contact_detail: Optional[Contact] = contact_detail_repository.get(_id)
+        contact_detail: Optional[dict] = contact_detail_repository.get_document(_id, build_contact_projection(fields))
+        return self._contact_to_json(contact_detail, fields)
+
+    @staticmethod
+    def _contact_to_json(contact_detail: Optional[dict], fields: List[str]) -> dict:
         if not contact_detail:
             return {"status": Status.ERROR.value}
         contact_as_json = {
-            "contactId": contact_detail.contactId,
-            "firstName": contact_detail.name.firstName,
-            "lastName": contact_detail.name.lastName,
-            "email": contact_detail.email.email,
-            "address": contact_detail.address.full_address,
-            "phoneList": [{
-                "number": phone.number,
-                "type": phone.type,
-            } for phone in contact_detail.phoneList],
+            **convert_document_to_json(contact_detail, fields),
             str(Status.SUCCESS.name).lower(): Status.SUCCESS.value,
         }
         return contact_as_json
@@ -49,55 +94,104 @@ class CountContacts(InterfaceList):
         self.infrastructure = infrastructure
 
     def get_list(self, optional_filter: Optional[dict] = {}) -> dict:
-        contacts_repository = GetContactList(self.infrastructure)
-        list_of_contacts: List[Contact] = contacts_repository.get(optional_filter)
-        phones_types_count = self._count_phones_types(list_of_contacts)
-        phones_types_result = [{
-            "_id": phone_type,
-            "Count": count
-        } for phone_type, count in phones_types_count.items()]
+        statistics_repository = GetContactStatistics(self.infrastructure)
+        contacts_count: dict = statistics_repository.count(optional_filter)
+        return self._count_to_json(contacts_count)
+
+    @classmethod
+    def _count_to_json(cls, contacts_count: dict) -> dict:
         return {
-            "countContacts": len(list_of_contacts),
-            "countType": phones_types_result,
+            "countContacts": contacts_count.get("countContacts", 0),
+            "countType": cls._count_phones_types(contacts_count.get("countType", [])),
             "status": Status.SUCCESS.value,
         }
 
     @staticmethod
-    def _count_phones_types(contact_list: List[Contact]) -> Dict[PhoneType, int]:
-        phones_types_count = {
+    def _count_phones_types(phones_types_groups: List[dict]) -> List[dict]:
+        phones_types_count: Dict[str, int] = {
             phone_type: 0
             for phone_type in PhoneType.__members__
         }
-        for contact in contact_list:
-            for phone in contact.phoneList:
-                phone_type = phone.type.value
-                phones_types_count.update({
-                    phone_type: phones_types_count.get(phone_type) + 1
-                })
-        return phones_types_count
+        for phone_type_group in phones_types_groups:
+            phones_types_count.update({
+                phone_type_group.get("_id"): phone_type_group.get("Count")
+            })
+        phones_types_result = [{
+            "_id": phone_type,
+            "Count": count
+        } for phone_type, count in phones_types_count.items()]
+        return phones_types_result
+
+
+class StatisticsContacts(CountContacts):
+
+    def get_list(self, optional_filter: Optional[dict] = {}) -> dict:
+        statistics_repository = GetContactStatistics(self.infrastructure)
+        contacts_statistics: dict = statistics_repository.statistics(optional_filter)
+        return self._statistics_to_json(contacts_statistics)
+
+    @classmethod
+    def _statistics_to_json(cls, contacts_statistics: dict) -> dict:
+        return {
+            "countContacts": contacts_statistics.get("countContacts", 0),
+            "countType": cls._count_phones_types(contacts_statistics.get("countType", [])),
+            "countEmailDomain": contacts_statistics.get("countEmailDomain", []),
+            "countFirstLetter": contacts_statistics.get("countFirstLetter", []),
+            "status": Status.SUCCESS.value,
+        }
 
 
-class ListsContacts(InterfaceList):
+class ListsContacts(InterfaceList, InterfacePage, InterfaceStream):
+    PAGE_SIZE: int = config("CONTACTS_PAGE_SIZE", default=100, cast=int)
+    LIST_FIELDS: List[str] = ["contactId", "firstName", "lastName", "email", "phoneList"]
 
     def __init__(self, infrastructure: MongoClient):
         self.infrastructure = infrastructure
 
     def get_list(self, optional_filter: Optional[dict] = {}) -> dict:
+        return self.get_page(optional_filter)
+
+    def get_page(
+            self,
+            optional_filter: Optional[dict] = {},
+            after: Optional[str] = None,
+            limit: int = PAGE_SIZE,
+            fields: Optional[List[str]] = None,
+    ) -> dict:
+        fields = fields or self.LIST_FIELDS
+        if not are_valid_contact_fields(fields):
+            return {'status': Status.ERROR.value}
         contacts_repository = GetContactList(self.infrastructure)
-        list_of_contacts: List[Contact] = contacts_repository.get(optional_filter)
-        list_of_contacts_return = [{
-            "contactId": contact.contactId,
-            "firstName": contact.name.firstName,
-            "lastName": contact.name.lastName,
-            "email": contact.email.email,
-            "phoneList": [{
-                "number": phone.number,
-                "type": phone.type,
-            } for phone in contact.phoneList]
-        } for contact in list_of_contacts]
+        list_of_contacts: List[dict] = contacts_repository.get_page(
+            optional_filter, after, limit + 1, build_contact_projection(fields))
+        return self._page_to_json(list_of_contacts, limit, fields, optional_filter)
+
+    @staticmethod
+    def _page_to_json(list_of_contacts: List[dict], limit: int, fields: List[str], optional_filter: Optional[dict] = {}) -> dict:
+        has_next_page = len(list_of_contacts) > limit
+        list_of_contacts_return = [
+            convert_document_to_json(contact, fields)
+            for contact in list_of_contacts[:limit]
+        ]
         if not list_of_contacts_return:
             return {'status': Status.ERROR.value}
-        return {'contactsList': list_of_contacts_return, 'status': Status.SUCCESS.value}
+        last_contact = list_of_contacts[len(list_of_contacts_return) - 1]
+        next_cursor = build_page_cursor(
+            optional_filter, last_contact.get("_id"), last_contact.get("firstNameKey")) if has_next_page else None
+        return {
+            'contactsList': list_of_contacts_return,
+            'nextCursor': next_cursor,
+            'status': Status.SUCCESS.value,
+        }
+
+    def stream(self, optional_filter: Optional[dict] = {}, fields: Optional[List[str]] = None) -> Iterator[str]:
+        fields = fields or self.LIST_FIELDS
+        if not are_valid_contact_fields(fields):
+            yield json.dumps({'status': Status.ERROR.value}) + "\n"
+            return
+        contacts_repository = GetContactList(self.infrastructure)
+        for contact in contacts_repository.stream(optional_filter, build_contact_projection(fields)):
+            yield json.dumps(convert_document_to_json(contact, fields)) + "\n"
 
 
 class RegisterContact(InterfaceRegister):
@@ -164,12 +258,12 @@ class DeleteContact(InterfaceDelete):
     def delete(self, contact_id: str) -> dict:
         update_repository = SetExistentContact(self.mongo_infrastructure)
         get_repository = GetContact(self.mongo_infrastructure)
-        contact = get_repository.get(contact_id)
+        contact = get_repository.get(contact_id, {"_id": 1})
         if not contact:
             return {'status': self.status_alias.get(False)}
         add_to_redis = self.redis_repository.add_contact_to_redis(contact)
-        update_repository.update_contact(contact_id, [Active(is_active=False)])
-        return {'status': self.status_alias.get(update_repository and add_to_redis)}
+        update_status = update_repository.update_contact(contact_id, [Active(is_active=False)])
+        return {'status': self.status_alias.get(all((update_status, add_to_redis)))}
 
 
 class UpdateContact(InterfaceUpdate):
@@ -202,3 +296,835 @@ class UpdateContact(InterfaceUpdate):
             update_wrapp_method = self.update_wrapp_methods_per_field.get(key)
             update_value = update_wrapp_method(updates_dict.get(key))
             yield update_value
+
+
+class AsyncContactDetail(ContactDetail):
+    def __init__(self, infrastructure: AsyncIOMotorClient, redis_infrastructure: AsyncRedis):
+        self.infrastructure = infrastructure
+        self.cache_repository = AsyncContactDetailCache(redis_infrastructure)
+
+    @single_flight("contact_detail")
+    async def get_detail(self, _id: str, fields: Optional[List[str]] = None) -> dict:
+        fields = fields or self.DETAIL_FIELDS
+        if not are_valid_contact_fields(fields):
+            return {"status": Status.ERROR.value}
+        read_model = AsyncContactsReadModel.get_warm_model("contact_detail")
+        if read_model is not None:
+            return self._contact_to_json(read_model.get(_id), fields)
+        cached_contact_detail = await self.cache_repository.get(_id)
+        if cached_contact_detail is not None:
+            contact_detail_cache_hits.inc()
+            return self._select_fields(json.loads(cached_contact_detail), fields)
+        contact_detail_cache_misses.inc()
+        lease = await self.cache_repository.take_lease(_id)
+        contact_detail_repository = AsyncGetContact(self.infrastructure)
+        contact_detail: Optional[dict] = await contact_detail_repository.get_document(
+            _id, build_contact_projection(self.DETAIL_FIELDS))
+        contact_as_json = self._contact_to_json(contact_detail, self.DETAIL_FIELDS)
+        if lease is not None:
+            await self.cache_repository.set(_id, json.dumps(contact_as_json), lease, found=contact_detail is not None)
+        return self._select_fields(contact_as_json, fields)
+
+    @staticmethod
+    def _select_fields(contact_as_json: dict, fields: List[str]) -> dict:
+        success_key = str(Status.SUCCESS.name).lower()
+        if success_key not in contact_as_json:
+            return contact_as_json
+        return {
+            **{field: contact_as_json.get(field) for field in fields},
+            success_key: contact_as_json.get(success_key),
+        }
+
+
+class AsyncCountContacts(CountContacts):
+    def __init__(self, infrastructure: AsyncIOMotorClient, redis_infrastructure: AsyncRedis):
+        super().__init__(infrastructure)
+        self.redis_infrastructure = redis_infrastructure
+
+    @single_flight("count_contacts")
+    async def get_list(self, optional_filter: Optional[dict] = {}) -> dict:
+        if optional_filter:
+            statistics_repository = AsyncGetContactStatistics(self.infrastructure)
+            contacts_count: dict = await statistics_repository.count(optional_filter)
+            return self._count_to_json(contacts_count)
+        read_model = AsyncContactsReadModel.get_warm_model("count_contacts")
+        if read_model is not None:
+            return self._count_to_json(read_model.count())
+        counters_repository = AsyncContactCounters(self.redis_infrastructure)
+        contacts_count = await counters_repository.get()
+        if contacts_count is None:
+            reconciliation_service = AsyncReconcileCounters(self.infrastructure, self.redis_infrastructure)
+            contacts_count = await reconciliation_service.reconcile()
+        return self._count_to_json(contacts_count)
+
+
+class AsyncReconcileCounters(InterfaceReconciliation):
+    def __init__(self, mongo_infrastructure: AsyncIOMotorClient, redis_infrastructure: AsyncRedis):
+        self.mongo_infrastructure = mongo_infrastructure
+        self.counters_repository = AsyncContactCounters(redis_infrastructure)
+
+    async def reconcile(self) -> dict:
+        current_counters = await self.counters_repository.get_counters()
+        statistics_repository = AsyncGetContactStatistics(self.mongo_infrastructure)
+        contacts_count: dict = await statistics_repository.count()
+        if current_counters is None:
+            return {**contacts_count, "drift": {}, "corrected": False, "status": Status.ERROR.value}
+        drift = build_counters_drift(convert_count_to_counters(contacts_count), current_counters)
+        corrected = await self.counters_repository.correct(current_counters, drift)
+        return {
+            **contacts_count,
+            "drift": drift,
+            "corrected": corrected,
+            "status": Status.SUCCESS.value if corrected else Status.ERROR.value,
+        }
+
+
+class AsyncStatisticsContacts(StatisticsContacts):
+    @single_flight("statistics_contacts")
+    async def get_list(self, optional_filter: Optional[dict] = {}) -> dict:
+        statistics_repository = AsyncGetContactStatistics(self.infrastructure)
+        contacts_statistics: dict = await statistics_repository.statistics(optional_filter)
+        return self._statistics_to_json(contacts_statistics)
+
+
+class AsyncListsContacts(ListsContacts):
+    async def get_list(self, optional_filter: Optional[dict] = {}) -> dict:
+        return await self.get_page(optional_filter)
+
+    @single_flight("list_contacts")
+    async def get_page(
+            self,
+            optional_filter: Optional[dict] = {},
+            after: Optional[str] = None,
+            limit: int = ListsContacts.PAGE_SIZE,
+            fields: Optional[List[str]] = None,
+    ) -> dict:
+        fields = fields or self.LIST_FIELDS
+        if not are_valid_contact_fields(fields):
+            return {'status': Status.ERROR.value}
+        read_model = AsyncContactsReadModel.get_warm_model("list_contacts") \
+            if ContactsReadModel.supports_filter(optional_filter) else None
+        if read_model is not None:
+            return self._page_to_json(read_model.find_page(optional_filter, after, limit + 1), limit, fields, optional_filter)
+        contacts_repository = AsyncGetContactList(self.infrastructure)
+        list_of_contacts: List[dict] = await contacts_repository.get_page(
+            optional_filter, after, limit + 1, build_contact_projection(fields))
+        return self._page_to_json(list_of_contacts, limit, fields, optional_filter)
+
+    async def stream(self, optional_filter: Optional[dict] = {}, fields: Optional[List[str]] = None) -> AsyncIterator[str]:
+        fields = fields or self.LIST_FIELDS
+        if not are_valid_contact_fields(fields):
+            yield json.dumps({'status': Status.ERROR.value}) + "\n"
+            return
+        contacts_repository = AsyncGetContactList(self.infrastructure)
+        async for contact in contacts_repository.stream(optional_filter, build_contact_projection(fields)):
+            yield json.dumps(convert_document_to_json(contact, fields)) + "\n"
+
+
+class AsyncContactsReadModel:
+    ENABLED: bool = config("READ_MODEL_ENABLED", default=False, cast=bool)
+    CHECK_INTERVAL: float = config("READ_MODEL_CHECK_INTERVAL", default=5, cast=float)
+    RESYNC_INTERVAL: float = config("READ_MODEL_RESYNC_INTERVAL", default=600, cast=float)
+    MAX_VERSIONS_GAP: int = 10000
+    SERVED = "served"
+    COLD = "cold"
+    model: Optional[ContactsReadModel] = None
+    version: int = 0
+    missing_versions: Optional[set] = None
+    overdue_versions: Optional[set] = None
+    awaited_version: int = 0
+    loaded_at: float = 0.0
+    checked_at: float = 0.0
+    synced_at: float = 0.0
+    apply_lock: Optional[asyncio.Lock] = None
+    pinned_version: ContextVar[Optional[int]] = ContextVar("read_model_pinned_version", default=None)
+
+    def __init__(self, mongo_infrastructure: AsyncIOMotorClient, redis_infrastructure: AsyncRedis):
+        self.list_repository = AsyncGetContactList(mongo_infrastructure)
+        self.contact_repository = AsyncGetContact(mongo_infrastructure)
+        self.changes_repository = AsyncContactChanges(redis_infrastructure)
+        self.versions_repository = AsyncContactVersions(redis_infrastructure)
+
+    @classmethod
+    def applied_version(cls) -> Optional[int]:
+        if not cls.ENABLED or cls.model is None:
+            return None
+        if cls.missing_versions:
+            return min(cls.missing_versions) - 1
+        return cls.version
+
+    @classmethod
+    def pin_version(cls) -> Optional[int]:
+        applied_version = cls.applied_version()
+        cls.pinned_version.set(applied_version)
+        return applied_version
+
+    @classmethod
+    def get_warm_model(cls, operation: str) -> Optional[ContactsReadModel]:
+        if not cls.ENABLED:
+            return None
+        pinned_version, applied_version = cls.pinned_version.get(), cls.applied_version()
+        model = cls.model if None not in (pinned_version, applied_version) and applied_version >= pinned_version else None
+        read_model_reads.labels(operation, cls.SERVED if model is not None else cls.COLD).inc()
+        return model
+
+    async def record_changes(self, contacts_ids: List[str], version: int):
+        if not self.ENABLED:
+            return
+        await self.changes_repository.publish_changes(contacts_ids, version)
+        if self.model is not None:
+            await self._apply_changes(version, contacts_ids)
+
+    async def follow_changes(self):
+        if not self.ENABLED:
+            return
+        self._reset()
+        while True:
+            try:
+                await self._follow_changes()
+            except (ConnectionError, PyMongoError):
+                AsyncContactsReadModel.model = None
+                await asyncio.sleep(self.CHECK_INTERVAL)
+
+    async def load(self):
+        cls = AsyncContactsReadModel
+        started_at = time.monotonic()
+        version = await self.versions_repository.get_global_version()
+        if version is None:
+            raise ConnectionError("contacts version is unavailable")
+        cls.model = ContactsReadModel([
+            document async for document in self.list_repository.stream(projection=self._build_projection())])
+        cls.version = cls.awaited_version = version
+        cls.missing_versions, cls.overdue_versions = set(), set()
+        cls.loaded_at = cls.checked_at = cls.synced_at = started_at
+        self._export_metrics()
+
+    @staticmethod
+    def _reset():
+        cls = AsyncContactsReadModel
+        cls.model = None
+        cls.version = cls.awaited_version = 0
+        cls.missing_versions, cls.overdue_versions = set(), set()
+        cls.loaded_at = cls.checked_at = cls.synced_at = 0.0
+        cls.apply_lock = asyncio.Lock()
+
+    async def _follow_changes(self):
+        async for change in self.changes_repository.follow_changes(self.CHECK_INTERVAL):
+            if change is not None:
+                await self._apply_changes(*change)
+            if change is None or time.monotonic() - self.checked_at >= self.CHECK_INTERVAL:
+                await self._check()
+
+    async def _check(self):
+        cls = AsyncContactsReadModel
+        now = time.monotonic()
+        if cls.model is None or now - cls.loaded_at >= self.RESYNC_INTERVAL \
+                or cls.missing_versions & cls.overdue_versions or cls.version < cls.awaited_version:
+            await self.load()
+            return
+        current_version = await self.versions_repository.get_global_version()
+        if current_version is None:
+            raise ConnectionError("contacts version is unavailable")
+        cls.overdue_versions = set(cls.missing_versions)
+        cls.awaited_version = current_version
+        cls.checked_at = now
+        if current_version == cls.version and not cls.missing_versions:
+            cls.synced_at = now
+        self._export_metrics()
+
+    async def _apply_changes(self, version: int, contacts_ids: List[str]):
+        cls = AsyncContactsReadModel
+        if version > cls.version + self.MAX_VERSIONS_GAP:
+            cls.awaited_version = max(cls.awaited_version, version)
+            return
+        if version > cls.version:
+            cls.missing_versions.update(range(cls.version + 1, version + 1))
+            cls.version = version
+        elif version not in cls.missing_versions:
+            return
+        async with self.apply_lock:
+            documents = await self.contact_repository.get_documents(contacts_ids, self._build_projection())
+            model = cls.model
+            if model is None:
+                return
+            for contact_id in set(contacts_ids) - {document.get("_id") for document in documents}:
+                model.remove(contact_id)
+            for document in documents:
+                model.put(document)
+            cls.missing_versions.discard(version)
+        self._export_metrics()
+
+    @staticmethod
+    def _build_projection() -> dict:
+        return {**build_contact_projection(ContactDetail.DETAIL_FIELDS), NAME_KEY_FIELD: 1}
+
+    def _export_metrics(self):
+        read_model_contacts.set(len(self.model))
+        read_model_staleness_seconds.set(time.monotonic() - self.synced_at)
+
+
+class AsyncExportContacts(InterfaceExport):
+    CHUNK_SIZE: int = config("CONTACTS_EXPORT_CHUNK_SIZE", default=500, cast=int)
+    GZIP_LEVEL: int = config("CONTACTS_EXPORT_GZIP_LEVEL", default=6, cast=int)
+
+    def __init__(self, infrastructure: AsyncIOMotorClient):
+        self.infrastructure = infrastructure
+
+    async def export(self, export_format: ContactFileFormat, after: Optional[str] = None, compress: bool = False) -> AsyncIterator[bytes]:
+        export_chunks = self._render_chunks(export_format, after)
+        if compress:
+            export_chunks = compress_stream(export_chunks, self.GZIP_LEVEL)
+        async for export_chunk in export_chunks:
+            yield export_chunk
+
+    async def _render_chunks(self, export_format: ContactFileFormat, after: Optional[str]) -> AsyncIterator[bytes]:
+        header_method = header_methods_per_export_format.get(export_format)
+        if header_method and after is None:
+            yield header_method().encode()
+        render_method = render_methods_per_export_format.get(export_format)
+        contacts_repository = AsyncGetContactList(self.infrastructure)
+        documents = []
+        async for document in contacts_repository.stream(projection=build_contact_projection(EXPORT_FIELDS), after=after):
+            documents.append(document)
+            if len(documents) >= self.CHUNK_SIZE:
+                yield render_method(documents).encode()
+                documents = []
+        if documents:
+            yield render_method(documents).encode()
+
+
+class AsyncSearchContacts(InterfaceSearch):
+    CURSOR_SEPARATOR = ":"
+
+    def __init__(self, infrastructure: AsyncIOMotorClient):
+        self.infrastructure = infrastructure
+
+    async def search(
+            self,
+            query: str,
+            after: Optional[str] = None,
+            limit: int = ListsContacts.PAGE_SIZE,
+            fields: Optional[List[str]] = None,
+    ) -> dict:
+        fields = fields or ListsContacts.LIST_FIELDS
+        prefix_keys, word_keys = build_query_keys(query)
+        search_cursor = self._parse_cursor(after)
+        if not are_valid_contact_fields(fields) or not prefix_keys or (after and not search_cursor):
+            return {'status': Status.ERROR.value}
+        search_repository = AsyncGetContactSearch(self.infrastructure)
+        list_of_contacts: List[dict] = await search_repository.search(
+            prefix_keys, word_keys, search_cursor, limit + 1, build_contact_projection(fields))
+        return self._search_to_json(list_of_contacts, limit, fields)
+
+    @classmethod
+    def _parse_cursor(cls, after: Optional[str]) -> Optional[tuple]:
+        score, separator, contact_id = (after or "").partition(cls.CURSOR_SEPARATOR)
+        if not separator or not score.isdigit() or not contact_id:
+            return None
+        return int(score), contact_id
+
+    @classmethod
+    def _search_to_json(cls, list_of_contacts: List[dict], limit: int, fields: List[str]) -> dict:
+        search_result = ListsContacts._page_to_json(list_of_contacts, limit, fields)
+        if search_result.get('nextCursor'):
+            last_contact = list_of_contacts[limit - 1]
+            search_result['nextCursor'] = f"{last_contact.get('searchScore')}{cls.CURSOR_SEPARATOR}{last_contact.get('_id')}"
+        return search_result
+
+
+class AsyncRegisterContact(RegisterContact, InterfaceBulkRegister):
+    def __init__(
+            self,
+            mongo_infrastructure: AsyncIOMotorClient,
+            redis_infrastructure: AsyncRedis,
+    ):
+        self.mongo_infrastructure = mongo_infrastructure
+        self.redis_repository = AsyncSoftDeleteContact(redis_infrastructure)
+        self.cache_repository = AsyncContactDetailCache(redis_infrastructure)
+        self.versions_repository = AsyncContactVersions(redis_infrastructure)
+        self.counters_repository = AsyncContactCounters(redis_infrastructure)
+        self.read_model = AsyncContactsReadModel(mongo_infrastructure, redis_infrastructure)
+
+    async def register(self, contact_parameters: ContactParameters) -> dict:
+        contact = transform_parameters_to_contact(contact_parameters)
+        register_status = await AsyncRegistrationQueue.submit(contact)
+        if register_status is None:
+            await self._restore_archived([contact])
+            register_status = await AsyncSetNewContact(self.mongo_infrastructure).upsert(contact)
+            if register_status:
+                await self._record_registrations([contact])
+        return_status = self.status_alias.get(register_status)
+        register_return = {"status": return_status}
+        return register_return
+
+    async def register_many(self, contacts_parameters: List[ContactParameters]) -> dict:
+        if len(contacts_parameters) > BULK_MAX_SIZE:
+            return {"status": Status.ERROR.value}
+        contacts = [transform_parameters_to_contact(contact_parameters) for contact_parameters in contacts_parameters]
+        register_statuses = await self.register_contacts(contacts)
+        contacts_ids = [contact.contactId for contact in contacts]
+        return convert_bulk_statuses_to_json(contacts_ids, register_statuses)
+
+    async def register_contacts(self, contacts: List[Contact]) -> List[bool]:
+        await self._restore_archived(contacts)
+        register_statuses = await AsyncSetNewContact(self.mongo_infrastructure).upsert_many(contacts)
+        await self._record_registrations([
+            contact for contact, register_status in zip(contacts, register_statuses)
+            if register_status
+        ])
+        return register_statuses
+
+    async def _restore_archived(self, contacts: List[Contact]):
+        contacts_ids = self.redis_repository.filter_possibly_deleted([contact.contactId for contact in contacts])
+        if not contacts_ids:
+            return
+        archive_repository = AsyncContactArchive(self.mongo_infrastructure)
+        archived_contacts = await archive_repository.get_many(contacts_ids)
+        if not archived_contacts:
+            return
+        await AsyncInactiveContacts(self.mongo_infrastructure).restore(archived_contacts)
+        await archive_repository.discard([contact_as_dict.get("_id") for contact_as_dict in archived_contacts])
+        contacts_restored.inc(len(archived_contacts))
+
+    async def _record_registrations(self, contacts: List[Contact]) -> bool:
+        if not contacts:
+            return True
+        contacts_ids = [contact.contactId for contact in contacts]
+        transaction = self.redis_repository.start_transaction()
+        self.redis_repository.queue_tombstones_removal(transaction, contacts_ids)
+        self.counters_repository.queue_increment(transaction, (
+            build_contact_increments((phone.type.value for phone in contact.phoneList), 1)
+            for contact in contacts
+        ))
+        self.cache_repository.queue_invalidation(transaction, contacts_ids)
+        version_index = self.versions_repository.queue_bump(transaction, contacts_ids)
+        transaction_results = await self.redis_repository.execute_transaction(transaction)
+        if transaction_results is None:
+            return False
+        await self.read_model.record_changes(contacts_ids, transaction_results[version_index])
+        return True
+
+
+class AsyncRegistrationQueue:
+    ENABLED: bool = config("REGISTER_WRITE_BEHIND", default=False, cast=bool)
+    CAPACITY: int = config("REGISTER_QUEUE_CAPACITY", default=10000, cast=int)
+    MAX_BATCH_SIZE: int = config("REGISTER_BATCH_MAX_SIZE", default=500, cast=int)
+    MAX_WAIT: float = config("REGISTER_BATCH_MAX_WAIT_MS", default=5, cast=float) / 1000
+    queue: Optional[asyncio.Queue] = None
+    flushing_queue: Optional[asyncio.Queue] = None
+
+    def __init__(self, mongo_infrastructure: AsyncIOMotorClient, redis_infrastructure: AsyncRedis):
+        self.register_service = AsyncRegisterContact(mongo_infrastructure, redis_infrastructure)
+
+    @classmethod
+    async def submit(cls, contact: Contact) -> Optional[bool]:
+        queue = cls.queue
+        if queue is None:
+            return None
+        registration = asyncio.get_running_loop().create_future()
+        await queue.put((contact, registration))
+        register_queue_size.set(queue.qsize())
+        if cls.flushing_queue is not queue and not registration.done():
+            registration.set_result(None)
+        return await registration
+
+    @classmethod
+    async def close(cls):
+        queue, cls.queue = cls.queue, None
+        if queue is not None and cls.flushing_queue is queue:
+            await queue.put(None)
+
+    async def flush_continuously(self):
+        queue = AsyncRegistrationQueue.queue = AsyncRegistrationQueue.flushing_queue = asyncio.Queue(maxsize=self.CAPACITY)
+        batch = []
+        try:
+            closing = False
+            while not closing or not queue.empty():
+                batch = []
+                closing = await self._collect_batch(queue, batch) or closing
+                await self._flush(batch)
+        finally:
+            AsyncRegistrationQueue.flushing_queue = None
+            if AsyncRegistrationQueue.queue is queue:
+                AsyncRegistrationQueue.queue = None
+            self._release(batch + self._drain(queue))
+
+    async def _collect_batch(self, queue: asyncio.Queue, batch: list) -> bool:
+        loop = asyncio.get_running_loop()
+        item = await queue.get()
+        deadline = loop.time() + self.MAX_WAIT
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= self.MAX_BATCH_SIZE:
+                break
+            if not queue.empty():
+                item = queue.get_nowait()
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+        register_queue_size.set(queue.qsize())
+        return item is None
+
+    @staticmethod
+    def _drain(queue: asyncio.Queue) -> list:
+        leftovers = []
+        while not queue.empty():
+            item = queue.get_nowait()
+            if item is not None:
+                leftovers.append(item)
+        register_queue_size.set(0)
+        return leftovers
+
+    @staticmethod
+    def _release(batch: List[Tuple[Contact, asyncio.Future]]):
+        for _, registration in batch:
+            if not registration.done():
+                registration.set_result(None)
+
+    async def _flush(self, batch: List[Tuple[Contact, asyncio.Future]]):
+        if not batch:
+            return
+        register_batch_size.observe(len(batch))
+        try:
+            register_statuses = await self.register_service.register_contacts([contact for contact, _ in batch])
+        except Exception as error:
+            for _, registration in batch:
+                if not registration.done():
+                    registration.set_exception(error)
+            return
+        for (_, registration), register_status in zip(batch, register_statuses):
+            if not registration.done():
+                registration.set_result(register_status)
+
+
+class AsyncImportContacts(InterfaceImport):
+    BATCH_SIZE: int = config("IMPORT_BATCH_SIZE", default=1000, cast=int)
+    BATCHES_IN_FLIGHT: int = config("IMPORT_BATCHES_IN_FLIGHT", default=4, cast=int)
+    MAX_REPORTED_ERRORS: int = config("IMPORT_MAX_REPORTED_ERRORS", default=1000, cast=int)
+
+    def __init__(
+            self,
+            mongo_infrastructure: AsyncIOMotorClient,
+            redis_infrastructure: AsyncRedis,
+            validation_pool: Executor,
+    ):
+        self.register_service = AsyncRegisterContact(mongo_infrastructure, redis_infrastructure)
+        self.validation_pool = validation_pool
+
+    async def import_contacts(self, chunks: AsyncIterator[bytes], file_format: ContactFileFormat) -> AsyncIterator[dict]:
+        loop = asyncio.get_running_loop()
+        first_row_per_contact: Dict[str, int] = {}
+        progress = {"rows": 0, "imported": 0, "duplicates": 0, "failed": 0}
+        validations = deque()
+        contact_rows = parse_methods_per_file_format.get(file_format)(chunks)
+        async for rows in batch_contact_rows(contact_rows, self.BATCH_SIZE):
+            validations.append(loop.run_in_executor(self.validation_pool, validate_contact_rows, rows))
+            if len(validations) >= self.BATCHES_IN_FLIGHT:
+                yield await self._write_batch(validations.popleft(), first_row_per_contact, progress)
+        while validations:
+            yield await self._write_batch(validations.popleft(), first_row_per_contact, progress)
+
+    async def import_summary(self, chunks: AsyncIterator[bytes], file_format: ContactFileFormat) -> dict:
+        import_summary = {"rows": 0, "imported": 0, "duplicates": 0, "failed": 0}
+        row_errors = []
+        async for progress in self.import_contacts(chunks, file_format):
+            import_summary.update({field: progress.get(field) for field in import_summary})
+            row_errors.extend(progress.get("errors")[:self.MAX_REPORTED_ERRORS - len(row_errors)])
+        unreported_errors = import_summary.get("duplicates") + import_summary.get("failed") - len(row_errors)
+        return {**import_summary, "errors": row_errors, "unreportedErrors": unreported_errors, "status": Status.SUCCESS.value}
+
+    async def _write_batch(
+            self,
+            validation: Awaitable[Tuple[List[Tuple[int, Contact]], List[dict]]],
+            first_row_per_contact: Dict[str, int],
+            progress: dict,
+    ) -> dict:
+        validated_contacts, row_errors = await validation
+        progress["rows"] += len(validated_contacts) + len(row_errors)
+        progress["failed"] += len(row_errors)
+        new_contacts: List[Tuple[int, Contact]] = []
+        for row_number, contact in validated_contacts:
+            first_row = first_row_per_contact.setdefault(contact.contactId, row_number)
+            if first_row != row_number:
+                progress["duplicates"] += 1
+                row_errors.append(build_row_error(
+                    row_number, "contactId", f"Duplicate of row {first_row}", contact.contactId))
+                continue
+            new_contacts.append((row_number, contact))
+        register_statuses = await self.register_service.register_contacts([contact for _, contact in new_contacts])
+        for (row_number, contact), register_status in zip(new_contacts, register_statuses):
+            if register_status:
+                progress["imported"] += 1
+                continue
+            progress["failed"] += 1
+            row_errors.append(build_row_error(
+                row_number, "contactId", "Contact is already registered or could not be written", contact.contactId))
+        return {**progress, "errors": sorted(row_errors, key=lambda row_error: row_error.get("row"))}
+
+
+class AsyncDeleteContact(DeleteContact, InterfaceBulkDelete):
+    def __init__(
+            self,
+            mongo_infrastructure: AsyncIOMotorClient,
+            redis_infrastructure: AsyncRedis,
+    ):
+        self.mongo_infrastructure = mongo_infrastructure
+        self.redis_repository = AsyncSoftDeleteContact(redis_infrastructure)
+        self.cache_repository = AsyncContactDetailCache(redis_infrastructure)
+        self.versions_repository = AsyncContactVersions(redis_infrastructure)
+        self.counters_repository = AsyncContactCounters(redis_infrastructure)
+        self.read_model = AsyncContactsReadModel(mongo_infrastructure, redis_infrastructure)
+
+    async def delete(self, contact_id: str) -> dict:
+        update_repository = AsyncSetExistentContact(self.mongo_infrastructure)
+        previous_contact = await update_repository.deactivate_contact(contact_id)
+        if not previous_contact:
+            return {'status': self.status_alias.get(False)}
+        recorded = await self._record_deletions({contact_id: previous_contact})
+        return {'status': self.status_alias.get(recorded)}
+
+    async def delete_many(self, contacts_ids: List[str]) -> dict:
+        if len(contacts_ids) > BULK_MAX_SIZE:
+            return {"status": Status.ERROR.value}
+        update_repository = AsyncSetExistentContact(self.mongo_infrastructure)
+        previous_contacts = await update_repository.deactivate_contacts(list(dict.fromkeys(contacts_ids)))
+        deleted_contacts = {
+            contact_id: previous_contact
+            for contact_id, previous_contact in previous_contacts.items()
+            if previous_contact
+        }
+        recorded = await self._record_deletions(deleted_contacts)
+        statuses = [contact_id in deleted_contacts and recorded for contact_id in contacts_ids]
+        return convert_bulk_statuses_to_json(contacts_ids, statuses)
+
+    async def _record_deletions(self, previous_contacts: Dict[str, dict]) -> bool:
+        if not previous_contacts:
+            return True
+        contacts_ids = list(previous_contacts)
+        transaction = self.redis_repository.start_transaction()
+        tombstones_version_index = self.redis_repository.queue_tombstones(transaction, contacts_ids)
+        self.counters_repository.queue_increment(transaction, (
+            build_document_increments(previous_contact, -1)
+            for previous_contact in previous_contacts.values()
+        ))
+        self.cache_repository.queue_invalidation(transaction, contacts_ids)
+        version_index = self.versions_repository.queue_bump(transaction, contacts_ids)
+        transaction_results = await self.redis_repository.execute_transaction(transaction)
+        if transaction_results is None:
+            return False
+        await self.redis_repository.publish_tombstones(contacts_ids, transaction_results[tombstones_version_index])
+        await self.read_model.record_changes(contacts_ids, transaction_results[version_index])
+        return True
+
+
+class AsyncArchiveContacts(InterfaceArchive):
+    ENABLED: bool = config("ARCHIVE_ENABLED", default=False, cast=bool)
+    RETENTION_DAYS: float = config("ARCHIVE_RETENTION_DAYS", default=30, cast=float)
+    BATCH_SIZE: int = config("ARCHIVE_BATCH_SIZE", default=1000, cast=int)
+    INTERVAL: float = config("ARCHIVE_INTERVAL", default=3600, cast=float)
+    RETRY_INTERVAL: float = config("ARCHIVE_RETRY_INTERVAL", default=60, cast=float)
+    LOCK_KEY: str = "contacts:archive:lock"
+
+    def __init__(self, mongo_infrastructure: AsyncIOMotorClient, redis_infrastructure: AsyncRedis):
+        self.inactive_repository = AsyncInactiveContacts(mongo_infrastructure)
+        self.archive_repository = AsyncContactArchive(mongo_infrastructure)
+        self.redis_repository = AsyncSoftDeleteContact(redis_infrastructure)
+
+    async def archive(self) -> dict:
+        deleted_before = datetime.now(timezone.utc) - timedelta(days=self.RETENTION_DAYS)
+        archived_count = 0
+        after = None
+        while True:
+            expired_contacts = await self.inactive_repository.get_expired(deleted_before, after, self.BATCH_SIZE)
+            if not expired_contacts:
+                break
+            after = expired_contacts[-1].get("_id")
+            archived_count += await self._archive_batch(expired_contacts, deleted_before)
+        stored_counts = await self.export_stored_counts()
+        return {"archived": archived_count, "stored": stored_counts, "status": Status.SUCCESS.value}
+
+    async def archive_continuously(self):
+        if not self.ENABLED:
+            return
+        while True:
+            locked = False
+            try:
+                locked = await self.redis_repository.set_value(self.LOCK_KEY, "1", max(int(self.INTERVAL), 1), only_if_absent=True)
+                if locked:
+                    await self.archive()
+            except (ConnectionError, PyMongoError):
+                logger.exception("Archiving contacts failed, retrying in %s seconds", self.RETRY_INTERVAL)
+                if locked:
+                    await self.redis_repository.exclude(self.LOCK_KEY)
+                await asyncio.sleep(self.RETRY_INTERVAL)
+                continue
+            await asyncio.sleep(self.INTERVAL)
+
+    async def export_stored_counts(self) -> Dict[str, int]:
+        stored_counts = await self.inactive_repository.count_by_state()
+        stored_counts["archived"] = await self.archive_repository.count()
+        for state, count in stored_counts.items():
+            contacts_stored.labels(state).set(count)
+        return stored_counts
+
+    async def _archive_batch(self, expired_contacts: List[dict], deleted_before: datetime) -> int:
+        archive_statuses = await self.archive_repository.archive(expired_contacts)
+        archived_ids = [
+            contact_as_dict.get("_id")
+            for contact_as_dict, archive_status in zip(expired_contacts, archive_statuses)
+            if archive_status
+        ]
+        if not archived_ids:
+            return 0
+        await self.inactive_repository.purge(archived_ids, deleted_before)
+        kept_ids = set(await self.inactive_repository.get_existing_ids(archived_ids))
+        await self.archive_repository.discard(list(kept_ids))
+        moved_ids = [contact_id for contact_id in archived_ids if contact_id not in kept_ids]
+        await self.redis_repository.replace_tombstones_with_archive(moved_ids)
+        contacts_archived.inc(len(moved_ids))
+        return len(moved_ids)
+
+
+class AsyncUpdateContact(UpdateContact, InterfaceBulkUpdate):
+    def __init__(self, mongo_infrastructure: AsyncIOMotorClient, redis_infrastructure: AsyncRedis):
+        self.mongo_infrastructure = mongo_infrastructure
+        self.cache_repository = AsyncContactDetailCache(redis_infrastructure)
+        self.versions_repository = AsyncContactVersions(redis_infrastructure)
+        self.counters_repository = AsyncContactCounters(redis_infrastructure)
+        self.read_model = AsyncContactsReadModel(mongo_infrastructure, redis_infrastructure)
+
+    async def update(self, contact_id: str, contact: ContactOptionalParameters) -> dict:
+        updates_list = list(self._wrapp_contact_parameters_in_update_entities(contact))
+        repository_update = AsyncSetExistentContact(self.mongo_infrastructure)
+        increments_list = []
+        if self._changes_phones(updates_list):
+            previous_contact = await repository_update.update_contact_returning_previous(contact_id, updates_list)
+            increments_list = self._build_phones_increments(previous_contact, updates_list)
+            update_status = previous_contact is not None
+        else:
+            update_status = await repository_update.update_contact(contact_id, updates_list)
+        if update_status:
+            await self._record_updates([contact_id], increments_list)
+        return {"status": self.status_alias.get(update_status)}
+
+    async def update_many(self, contacts_updates: List[ContactBulkUpdateParameters]) -> dict:
+        if len(contacts_updates) > BULK_MAX_SIZE:
+            return {"status": Status.ERROR.value}
+        updates_per_contact = {
+            contact_updates.contactId: list(self._wrapp_contact_parameters_in_update_entities(contact_updates.updates))
+            for contact_updates in contacts_updates
+        }
+        repository_update = AsyncSetExistentContact(self.mongo_infrastructure)
+        phones_updates_per_contact = {
+            contact_id: updates
+            for contact_id, updates in updates_per_contact.items()
+            if self._changes_phones(updates)
+        }
+        update_statuses = await repository_update.update_contacts({
+            contact_id: updates
+            for contact_id, updates in updates_per_contact.items()
+            if contact_id not in phones_updates_per_contact
+        })
+        previous_contacts = await repository_update.update_contacts_returning_previous(phones_updates_per_contact)
+        update_statuses.update({
+            contact_id: previous_contact is not None
+            for contact_id, previous_contact in previous_contacts.items()
+        })
+        contacts_ids = [contact_updates.contactId for contact_updates in contacts_updates]
+        updated_contacts_ids = [contact_id for contact_id in dict.fromkeys(contacts_ids) if update_statuses.get(contact_id)]
+        if updated_contacts_ids:
+            await self._record_updates(updated_contacts_ids, [
+                increments
+                for contact_id, previous_contact in previous_contacts.items()
+                for increments in self._build_phones_increments(previous_contact, phones_updates_per_contact.get(contact_id))
+            ])
+        statuses = [update_statuses.get(contact_id, False) for contact_id in contacts_ids]
+        return convert_bulk_statuses_to_json(contacts_ids, statuses)
+
+    async def _record_updates(self, contacts_ids: List[str], increments_list: List[dict]) -> bool:
+        transaction = self.cache_repository.start_transaction()
+        self.counters_repository.queue_increment(transaction, increments_list)
+        self.cache_repository.queue_invalidation(transaction, contacts_ids)
+        version_index = self.versions_repository.queue_bump(transaction, contacts_ids)
+        transaction_results = await self.cache_repository.execute_transaction(transaction)
+        if transaction_results is None:
+            return False
+        await self.read_model.record_changes(contacts_ids, transaction_results[version_index])
+        return True
+
+    @staticmethod
+    def _changes_phones(updates: list) -> bool:
+        return any(isinstance(update, PhoneList) for update in updates)
+
+    @staticmethod
+    def _build_phones_increments(previous_contact: Optional[dict], updates: list) -> List[dict]:
+        if not previous_contact or not previous_contact.get("active"):
+            return []
+        new_phones_types = [
+            phone.type.value
+            for update in updates if isinstance(update, PhoneList)
+            for phone in update.phoneList
+        ]
+        return [build_document_increments(previous_contact, -1), build_contact_increments(new_phones_types, 1)]
+
+
+class AsyncContactsEntityTag(InterfaceEntityTag):
+    def __init__(self, infrastructure: AsyncRedis):
+        self.versions_repository = AsyncContactVersions(infrastructure)
+
+    async def get_list_tag(self, *request_parts: Any, from_read_model: bool = False) -> Optional[str]:
+        version = AsyncContactsReadModel.pin_version() if from_read_model else None
+        if version is None:
+            version = await self.versions_repository.get_global_version()
+        tagged_version.set(version)
+        if version is None:
+            return None
+        return build_entity_tag(version, *request_parts)
+
+    async def get_contact_tag(self, contact_id: str, *request_parts: Any, from_read_model: bool = False) -> Optional[str]:
+        version = AsyncContactsReadModel.pin_version() if from_read_model else None
+        if version is not None:
+            tagged_version.set(version)
+            return build_entity_tag(version, AsyncContactVersions.GLOBAL_KEY, contact_id, *request_parts)
+        version = await self.versions_repository.get_contact_version(contact_id)
+        tagged_version.set(version)
+        if version is None:
+            return None
+        return build_entity_tag(version, contact_id, *request_parts)
+
+
+class AsyncReadiness(InterfaceReadiness):
+    REDIS_MIN_CONNECTIONS: int = config("REDIS_MIN_CONNECTIONS", default=5, cast=int)
+
+    def __init__(
+            self,
+            mongo_infrastructure: AsyncIOMotorClient,
+            redis_infrastructure: AsyncRedis,
+            mongo_pool_statistics: MongoPoolStatistics,
+    ):
+        self.mongo_infrastructure = mongo_infrastructure
+        self.redis_infrastructure = redis_infrastructure
+        self.mongo_pool_statistics = mongo_pool_statistics
+
+    async def warm_up(self) -> bool:
+        mongo_ready = await AsyncMongoActions(self.mongo_infrastructure).ping()
+        redis_repository = AsyncRedisActions(self.redis_infrastructure)
+        redis_pings = await asyncio.gather(*(redis_repository.ping() for _ in range(self.REDIS_MIN_CONNECTIONS)))
+        return mongo_ready and all(redis_pings)
+
+    async def check(self) -> dict:
+        mongo_ready, redis_ready = await asyncio.gather(
+            AsyncMongoActions(self.mongo_infrastructure).ping(),
+            AsyncRedisActions(self.redis_infrastructure).ping(),
+        )
+        ready = mongo_ready and redis_ready
+        return {
+            "mongo": {"ready": mongo_ready, "pool": self.mongo_pool_statistics.snapshot()},
+            "redis": {"ready": redis_ready, "pool": redis_pool_statistics(self.redis_infrastructure.connection_pool)},
+            "status": Status.SUCCESS.value if ready else Status.ERROR.value,
+        }
@@ -0,0 +1,20 @@
+import hashlib
+from typing import Optional, Any
+
+
+def build_entity_tag(version: int, *request_parts: Any) -> str:
+    request_key = "|".join(str(request_part) for request_part in request_parts)
+    request_digest = hashlib.md5(request_key.encode()).hexdigest()[:16]
+    return f'W/"{version}-{request_digest}"'
+
+
+def entity_tag_matches(if_none_match: Optional[str], entity_tag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = entity_tag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
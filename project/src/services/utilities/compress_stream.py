@@ -0,0 +1,13 @@
+import zlib
+from typing import AsyncIterator
+
+GZIP_WINDOW_BITS = 16 + zlib.MAX_WBITS
+
+
+async def compress_stream(chunks: AsyncIterator[bytes], level: int) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WINDOW_BITS)
+    async for chunk in chunks:
+        compressed_chunk = compressor.compress(chunk)
+        if compressed_chunk:
+            yield compressed_chunk
+    yield compressor.flush()
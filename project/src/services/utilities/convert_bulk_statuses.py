@@ -0,0 +1,19 @@
+from typing import List
+
+from project.src.core.enum.status import Status
+from project.src.services.utilities.env_config import config
+
+BULK_MAX_SIZE: int = config("BULK_MAX_SIZE", default=1000, cast=int)
+
+status_alias = {
+    True: Status.SUCCESS.value,
+    False: Status.ERROR.value
+}
+
+
+def convert_bulk_statuses_to_json(contacts_ids: List[str], statuses: List[bool]) -> dict:
+    contacts_status = [{
+        "contactId": contact_id,
+        "status": status_alias.get(bool(status)),
+    } for contact_id, status in zip(contacts_ids, statuses)]
+    return {"contactsStatus": contacts_status, "status": Status.SUCCESS.value}
@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+from typing import Callable, Dict, List
+
+from project.src.core.enum.contact_file_format import ContactFileFormat
+from project.src.core.enum.phone_type import PhoneType
+from project.src.services.utilities.convert_document_to_json import convert_document_to_json
+
+EXPORT_FIELDS: List[str] = ["contactId", "firstName", "lastName", "email", "address", "phoneList"]
+CSV_COLUMNS: List[str] = ["contactId", "firstName", "lastName", "email", "address", *PhoneType.__members__]
+CSV_NUMBERS_SEPARATOR = ";"
+VCARD_LINE_LENGTH = 75
+
+vcard_phone_types: Dict[str, str] = {
+    PhoneType.mobile.value: "CELL",
+    PhoneType.commercial.value: "WORK",
+    PhoneType.residential.value: "HOME",
+}
+
+media_type_per_export_format: Dict[ContactFileFormat, str] = {
+    ContactFileFormat.ndjson: "application/x-ndjson",
+    ContactFileFormat.csv: "text/csv; charset=utf-8",
+    ContactFileFormat.vcf: "text/vcard; charset=utf-8",
+}
+
+
+def render_ndjson(documents: List[dict]) -> str:
+    return "".join(json.dumps(convert_document_to_json(document, EXPORT_FIELDS)) + "\n" for document in documents)
+
+
+def render_csv_header() -> str:
+    return render_csv_rows([CSV_COLUMNS])
+
+
+def render_csv_rows(rows: List[list]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
+def convert_document_to_csv_row(document: dict) -> list:
+    numbers_per_type: Dict[str, List[str]] = {phone_type: [] for phone_type in PhoneType.__members__}
+    for phone in document.get("phones", []):
+        numbers_per_type.setdefault(phone.get("type"), []).append(phone.get("number"))
+    return [
+        document.get("_id"),
+        document.get("firstName"),
+        document.get("lastName"),
+        document.get("email"),
+        document.get("address"),
+        *(CSV_NUMBERS_SEPARATOR.join(numbers_per_type.get(phone_type)) for phone_type in PhoneType.__members__),
+    ]
+
+
+def render_csv(documents: List[dict]) -> str:
+    return render_csv_rows([convert_document_to_csv_row(document) for document in documents])
+
+
+def escape_vcard_value(value: str) -> str:
+    return (value or "").replace("\\", "\\\\").replace(",", "\\,").replace(";", "\\;").replace("\n", "\\n")
+
+
+def fold_vcard_line(line: str) -> str:
+    if len(line) <= VCARD_LINE_LENGTH:
+        return line
+    parts = [line[:VCARD_LINE_LENGTH]]
+    parts.extend(line[index:index + VCARD_LINE_LENGTH - 1] for index in range(VCARD_LINE_LENGTH, len(line), VCARD_LINE_LENGTH - 1))
+    return "\r\n ".join(parts)
+
+
+def convert_document_to_vcard(document: dict) -> str:
+    first_name = escape_vcard_value(document.get("firstName"))
+    last_name = escape_vcard_value(document.get("lastName"))
+    lines = [
+        "BEGIN:VCARD",
+        "VERSION:3.0",
+        f"UID:{document.get('_id')}",
+        f"N:{last_name};{first_name};;;",
+        f"FN:{first_name} {last_name}",
+        f"EMAIL:{escape_vcard_value(document.get('email'))}",
+        f"ADR:;;{escape_vcard_value(document.get('address'))};;;;",
+        *(
+            f"TEL;TYPE={vcard_phone_types.get(phone.get('type'), 'VOICE')}:{escape_vcard_value(phone.get('number'))}"
+            for phone in document.get("phones", [])
+        ),
+        "END:VCARD",
+    ]
+    return "".join(fold_vcard_line(line) + "\r\n" for line in lines)
+
+
+def render_vcf(documents: List[dict]) -> str:
+    return "".join(convert_document_to_vcard(document) for document in documents)
+
+
+render_methods_per_export_format: Dict[ContactFileFormat, Callable[[List[dict]], str]] = {
+    ContactFileFormat.ndjson: render_ndjson,
+    ContactFileFormat.csv: render_csv,
+    ContactFileFormat.vcf: render_vcf,
+}
+
+header_methods_per_export_format: Dict[ContactFileFormat, Callable[[], str]] = {
+    ContactFileFormat.csv: render_csv_header,
+}
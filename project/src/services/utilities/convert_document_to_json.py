@@ -0,0 +1,40 @@
+from typing import Any, Callable, Dict, List, Optional
+
+document_field_per_contact_field: Dict[str, str] = {
+    "contactId": "_id",
+    "firstName": "firstName",
+    "lastName": "lastName",
+    "email": "email",
+    "address": "address",
+    "phoneList": "phones",
+}
+
+convert_methods_per_contact_field: Dict[str, Callable[[dict], Any]] = {
+    "contactId": lambda document: document.get("_id"),
+    "firstName": lambda document: document.get("firstName"),
+    "lastName": lambda document: document.get("lastName"),
+    "email": lambda document: document.get("email"),
+    "address": lambda document: document.get("address"),
+    "phoneList": lambda document: [{
+        "number": phone.get("number"),
+        "type": phone.get("type"),
+    } for phone in document.get("phones", [])],
+}
+
+
+def split_contact_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if fields is None:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def are_valid_contact_fields(fields: List[str]) -> bool:
+    return bool(fields) and all(field in document_field_per_contact_field for field in fields)
+
+
+def build_contact_projection(fields: List[str]) -> dict:
+    return {document_field_per_contact_field.get(field): 1 for field in fields}
+
+
+def convert_document_to_json(document: dict, fields: List[str]) -> dict:
+    return {field: convert_methods_per_contact_field.get(field)(document) for field in fields}
@@ -0,0 +1,133 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+contact_detail_cache_hits = Counter(
+    "contact_detail_cache_hits",
+    "Contact details served from the Redis cache",
+)
+contact_detail_cache_misses = Counter(
+    "contact_detail_cache_misses",
+    "Contact details that had to be read from MongoDB",
+)
+
+soft_delete_checks_skipped = Counter(
+    "soft_delete_checks_skipped",
+    "Soft-delete checks answered by the local tombstone filter",
+)
+soft_delete_checks_redis = Counter(
+    "soft_delete_checks_redis",
+    "Soft-delete checks that went to Redis",
+)
+soft_delete_filter_items = Gauge(
+    "soft_delete_filter_items",
+    "Tombstoned contact ids added to the local filter",
+)
+soft_delete_filter_memory_bytes = Gauge(
+    "soft_delete_filter_memory_bytes",
+    "Memory used by the local tombstone filter bit array",
+)
+soft_delete_filter_false_positive_rate = Gauge(
+    "soft_delete_filter_false_positive_rate",
+    "Configured false-positive rate of the local tombstone filter",
+)
+soft_delete_filter_estimated_false_positive_rate = Gauge(
+    "soft_delete_filter_estimated_false_positive_rate",
+    "False-positive rate expected from the current filter fill",
+)
+
+contacts_stored = Gauge(
+    "contacts_stored",
+    "Contacts kept in the live collection (active or inactive) or in the archive, as of the last archival pass",
+    ["state"],
+    multiprocess_mode="mostrecent",
+)
+contacts_archived = Counter(
+    "contacts_archived",
+    "Inactive contacts moved from the live collection to the archive",
+)
+contacts_restored = Counter(
+    "contacts_restored",
+    "Archived contacts moved back to the live collection by a registration",
+)
+
+register_queue_size = Gauge(
+    "register_queue_size",
+    "Registrations waiting in the write-behind queue",
+    multiprocess_mode="livesum",
+)
+register_batch_size = Histogram(
+    "register_batch_size",
+    "Registrations written together by the write-behind queue",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+read_model_reads = Counter(
+    "read_model_reads",
+    "Reads answered from the in-memory read model or sent to MongoDB because it was cold",
+    ["operation", "result"],
+)
+read_model_contacts = Gauge(
+    "read_model_contacts",
+    "Active contacts held by the in-memory read model",
+    multiprocess_mode="livemax",
+)
+read_model_staleness_seconds = Gauge(
+    "read_model_staleness_seconds",
+    "Seconds since the in-memory read model was last confirmed to match the contacts version",
+    multiprocess_mode="livemax",
+)
+
+single_flight_requests = Counter(
+    "single_flight_requests",
+    "Reads that started a computation, shared one already in flight or gave up waiting for it",
+    ["operation", "result"],
+)
+
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "Time spent answering a request, by route template",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+http_responses = Counter(
+    "http_responses",
+    "Responses sent, by route template and HTTP status code",
+    ["method", "route", "status_code"],
+)
+http_validation_errors = Counter(
+    "http_validation_errors",
+    "Requests rejected by validation and answered with 200 and status 1004",
+    ["method", "route"],
+)
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight",
+    "Requests currently being answered",
+    multiprocess_mode="livesum",
+)
+
+repository_call_duration_seconds = Histogram(
+    "repository_call_duration_seconds",
+    "Time spent in a MongoDB or Redis repository operation",
+    ["store", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+repository_calls_in_flight = Gauge(
+    "repository_calls_in_flight",
+    "Repository operations currently waiting on MongoDB or Redis",
+    ["store"],
+    multiprocess_mode="livesum",
+)
+
+mongo_pool_connections = Gauge(
+    "mongo_pool_connections",
+    "MongoDB pool connections by state",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+redis_pool_connections = Gauge(
+    "redis_pool_connections",
+    "Redis pool connections by state",
+    ["state"],
+    multiprocess_mode="livesum",
+)
@@ -0,0 +1,173 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from project.src.core.enum.contact_file_format import ContactFileFormat
+from project.src.core.enum.phone_type import PhoneType
+from project.src.services.utilities.convert_document_to_export import CSV_NUMBERS_SEPARATOR, vcard_phone_types
+
+ContactRow = Tuple[int, Optional[dict]]
+
+phone_types_per_vcard_type: Dict[str, str] = {
+    vcard_type: phone_type for phone_type, vcard_type in vcard_phone_types.items()
+}
+vcard_escapes: Dict[str, str] = {"n": "\n", "N": "\n"}
+
+
+async def iterate_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    line_number = 0
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield line_number + 1, pending.rstrip("\r")
+
+
+def build_contact_row(first_name: str, last_name: str, email: str, address: str, phones: List[Tuple[str, str]]) -> dict:
+    return {
+        "firstName": first_name,
+        "lastName": last_name,
+        "email": email,
+        "address": address,
+        "phoneList": [{"type": phone_type, "number": number} for phone_type, number in phones],
+    }
+
+
+def convert_csv_record_to_row(header: List[str], record: List[str]) -> dict:
+    values = dict(zip(header, record))
+    phones = [
+        (phone_type, number.strip())
+        for phone_type in PhoneType.__members__
+        for number in (values.get(phone_type) or "").split(CSV_NUMBERS_SEPARATOR)
+        if number.strip()
+    ]
+    return build_contact_row(
+        values.get("firstName"), values.get("lastName"), values.get("email"), values.get("address"), phones)
+
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ContactRow]:
+    header: Optional[List[str]] = None
+    record_lines: List[str] = []
+    record_line_number = 0
+    async for line_number, line in iterate_lines(chunks):
+        if not record_lines:
+            record_line_number = line_number
+        record_lines.append(line)
+        record_text = "\n".join(record_lines)
+        if record_text.count('"') % 2:
+            continue
+        record_lines = []
+        if not record_text.strip():
+            continue
+        record = next(csv.reader([record_text]))
+        if header is None:
+            header = [column.strip() for column in record]
+            continue
+        yield record_line_number, convert_csv_record_to_row(header, record)
+    if record_lines:
+        yield record_line_number, None
+
+
+def split_vcard_value(value: str, separator: str = ";") -> List[str]:
+    components = [""]
+    characters = iter(value)
+    for character in characters:
+        if character == "\\":
+            escaped = next(characters, "")
+            components[-1] += vcard_escapes.get(escaped, escaped)
+        elif character == separator:
+            components.append("")
+        else:
+            components[-1] += character
+    return components
+
+
+def convert_vcard_properties_to_row(properties: List[Tuple[str, str]]) -> dict:
+    first_name = last_name = email = address = None
+    phones = []
+    for name, value in properties:
+        property_name, *parameters = name.upper().split(";")
+        if property_name == "N":
+            last_name, first_name, *_ = split_vcard_value(value) + ["", ""]
+        elif property_name == "EMAIL" and email is None:
+            email = split_vcard_value(value)[0]
+        elif property_name == "ADR" and address is None:
+            address = (split_vcard_value(value) + ["", "", ""])[2]
+        elif property_name == "TEL":
+            vcard_types = [
+                vcard_type
+                for parameter in parameters if parameter.startswith("TYPE=")
+                for vcard_type in parameter[len("TYPE="):].split(",")
+            ]
+            phone_type = next(
+                (phone_types_per_vcard_type[vcard_type] for vcard_type in vcard_types
+                 if vcard_type in phone_types_per_vcard_type),
+                PhoneType.mobile.value,
+            )
+            phones.append((phone_type, split_vcard_value(value)[0]))
+    return build_contact_row(first_name, last_name, email, address, phones)
+
+
+async def unfold_vcard_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    folded_line: Optional[Tuple[int, str]] = None
+    async for line_number, line in iterate_lines(chunks):
+        if line[:1] in (" ", "\t") and folded_line:
+            folded_line = (folded_line[0], folded_line[1] + line[1:])
+            continue
+        if folded_line:
+            yield folded_line
+        folded_line = (line_number, line)
+    if folded_line:
+        yield folded_line
+
+
+async def parse_vcf(chunks: AsyncIterator[bytes]) -> AsyncIterator[ContactRow]:
+    properties: Optional[List[Tuple[str, str]]] = None
+    card_line_number = 0
+    async for line_number, line in unfold_vcard_lines(chunks):
+        name, _, value = line.partition(":")
+        name = name.strip().upper()
+        if name == "BEGIN" and value.strip().upper() == "VCARD":
+            properties, card_line_number = [], line_number
+        elif name == "END" and value.strip().upper() == "VCARD" and properties is not None:
+            yield card_line_number, convert_vcard_properties_to_row(properties)
+            properties = None
+        elif properties is not None and name:
+            properties.append((name.split(".")[-1], value))
+    if properties is not None:
+        yield card_line_number, None
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ContactRow]:
+    async for line_number, line in iterate_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError:
+            yield line_number, None
+
+
+parse_methods_per_file_format: Dict[ContactFileFormat, Callable[[AsyncIterator[bytes]], AsyncIterator[ContactRow]]] = {
+    ContactFileFormat.ndjson: parse_ndjson,
+    ContactFileFormat.csv: parse_csv,
+    ContactFileFormat.vcf: parse_vcf,
+}
+
+
+async def batch_contact_rows(rows: AsyncIterator[ContactRow], batch_size: int) -> AsyncIterator[List[ContactRow]]:
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
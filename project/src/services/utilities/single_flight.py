@@ -0,0 +1,57 @@
+import asyncio
+import functools
+import json
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional, Tuple
+
+from project.src.services.utilities.env_config import config
+from project.src.services.utilities.metrics import single_flight_requests
+
+SINGLE_FLIGHT_ENABLED: bool = config("SINGLE_FLIGHT_ENABLED", default=True, cast=bool)
+SINGLE_FLIGHT_WAIT_TIMEOUT: float = config("SINGLE_FLIGHT_WAIT_TIMEOUT", default=5, cast=float)
+
+LEADER = "leader"
+COLLAPSED = "collapsed"
+TIMED_OUT = "timed_out"
+
+flights: Dict[Tuple[str, Optional[int], str], asyncio.Future] = {}
+tagged_version: ContextVar[Optional[int]] = ContextVar("tagged_version", default=None)
+
+
+def build_flight_key(*args, **kwargs) -> str:
+    return json.dumps([args, kwargs], sort_keys=True, default=str)
+
+
+def land_flight(key: Tuple[str, Optional[int], str], flight: asyncio.Future):
+    if flights.get(key) is flight:
+        del flights[key]
+    if not flight.cancelled():
+        flight.exception()
+
+
+def single_flight(operation: str) -> Callable:
+    def decorator(method: Callable) -> Callable:
+        leaders = single_flight_requests.labels(operation, LEADER)
+        collapsed = single_flight_requests.labels(operation, COLLAPSED)
+        timed_out = single_flight_requests.labels(operation, TIMED_OUT)
+
+        @functools.wraps(method)
+        async def coalesced_method(self, *args, **kwargs):
+            if not SINGLE_FLIGHT_ENABLED:
+                return await method(self, *args, **kwargs)
+            key = (operation, tagged_version.get(), build_flight_key(*args, **kwargs))
+            flight = flights.get(key)
+            if flight is None:
+                leaders.inc()
+                flight = flights[key] = asyncio.ensure_future(method(self, *args, **kwargs))
+                flight.add_done_callback(functools.partial(land_flight, key))
+                return await asyncio.shield(flight)
+            try:
+                flight_result = await asyncio.wait_for(asyncio.shield(flight), SINGLE_FLIGHT_WAIT_TIMEOUT)
+                collapsed.inc()
+                return flight_result
+            except asyncio.TimeoutError:
+                timed_out.inc()
+                return await method(self, *args, **kwargs)
+        return coalesced_method
+    return decorator
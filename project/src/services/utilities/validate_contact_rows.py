@@ -0,0 +1,39 @@
+from typing import List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from project.src.core.entities.contacts import Contact, ContactParameters
+from project.src.services.utilities.transform_parameters_to_contact import transform_parameters_to_contact
+
+
+def build_row_error(row_number: int, field: str, message: str, contact_id: Optional[str] = None) -> dict:
+    row_error = {"row": row_number, "errors": [{"field": field, "message": message}]}
+    if contact_id:
+        row_error["contactId"] = contact_id
+    return row_error
+
+
+def validate_contact_row(row_number: int, row: Optional[dict]) -> Tuple[Optional[Contact], Optional[dict]]:
+    if not isinstance(row, dict):
+        return None, build_row_error(row_number, "row", "Row could not be parsed as a contact")
+    try:
+        contact_parameters = ContactParameters(**row)
+    except ValidationError as error:
+        return None, {"row": row_number, "errors": [{
+            "field": ".".join(str(location) for location in validation_error.get("loc", ())),
+            "message": validation_error.get("msg"),
+        } for validation_error in error.errors()]}
+    if not contact_parameters.phoneList:
+        return None, build_row_error(row_number, "phoneList", "Phone List must have at least 1 phone")
+    return transform_parameters_to_contact(contact_parameters), None
+
+
+def validate_contact_rows(rows: List[Tuple[int, Optional[dict]]]) -> Tuple[List[Tuple[int, Contact]], List[dict]]:
+    contacts, row_errors = [], []
+    for row_number, row in rows:
+        contact, row_error = validate_contact_row(row_number, row)
+        if row_error:
+            row_errors.append(row_error)
+        else:
+            contacts.append((row_number, contact))
+    return contacts, row_errors
@@ -0,0 +1,20 @@
+from project.src.repository.utilities.bloom_filter import BloomFilter
+
+
+def test_added_keys_are_always_found():
+    bloom_filter = BloomFilter(1000, 0.01)
+    bloom_filter.update(f"contact-{index}" for index in range(1000))
+    assert all(f"contact-{index}" in bloom_filter for index in range(1000))
+    assert bloom_filter.items_count == 1000
+
+
+def test_false_positive_rate_stays_near_the_target():
+    bloom_filter = BloomFilter(1000, 0.01)
+    bloom_filter.update(f"contact-{index}" for index in range(1000))
+    false_positives = sum(f"other-{index}" in bloom_filter for index in range(10000))
+    assert false_positives < 300
+    assert bloom_filter.estimated_false_positive_rate < 0.02
+
+
+def test_empty_filter_finds_nothing():
+    assert "contact" not in BloomFilter(10, 0.01)
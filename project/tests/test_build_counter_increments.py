@@ -0,0 +1,33 @@
+from project.src.repository.utilities.build_counter_increments import build_contact_increments, \
+    build_document_increments, merge_increments, convert_count_to_counters, convert_counters_to_count, \
+    build_counters_drift
+
+
+def test_contact_increments_count_each_phone_type():
+    assert build_contact_increments(["mobile", "mobile", "commercial"], 1) == {
+        "countContacts": 1, "countType:mobile": 2, "countType:commercial": 1}
+
+
+def test_document_increments_read_stored_phones():
+    contact_as_dict = {"phones": [{"type": "residential", "number": "1"}]}
+    assert build_document_increments(contact_as_dict, -1) == {"countContacts": -1, "countType:residential": -1}
+
+
+def test_merge_increments_drops_fields_that_cancel_out():
+    assert merge_increments([
+        build_contact_increments(["mobile"], -1),
+        build_contact_increments(["commercial"], 1),
+    ]) == {"countType:mobile": -1, "countType:commercial": 1}
+
+
+def test_counters_round_trip_through_count():
+    contacts_count = {"countContacts": 3, "countType": [{"_id": "mobile", "Count": 2}, {"_id": "commercial", "Count": 1}]}
+    counters = convert_count_to_counters(contacts_count)
+    assert counters["seeded"] == 1
+    assert convert_counters_to_count(counters) == contacts_count
+
+
+def test_drift_lists_only_fields_that_differ():
+    expected = {"countContacts": 3, "countType:mobile": 2}
+    current = {"countContacts": 5, "countType:mobile": 2, "countType:commercial": 1}
+    assert build_counters_drift(expected, current) == {"countContacts": -2, "countType:commercial": -1}
@@ -0,0 +1,46 @@
+from project.src.repository.utilities.build_search_keys import build_field_search_keys, build_query_keys, \
+    build_search_fields, tokenize, WORD_MARKER
+from project.src.repository.utilities.build_search_pipeline import build_search_pipeline
+
+
+def list_stages(pipeline: list) -> list:
+    return [next(iter(stage)) for stage in pipeline]
+
+
+def test_pipeline_scores_and_sorts_before_limiting():
+    pipeline = build_search_pipeline(["an"], ["ana" + WORD_MARKER], None, 11, {"firstName": 1})
+    assert list_stages(pipeline) == ["$match", "$addFields", "$sort", "$limit", "$project"]
+    assert pipeline[0]["$match"]["searchKeys"] == {"$all": ["an"]}
+    assert pipeline[2]["$sort"] == {"searchScore": -1, "_id": 1}
+    assert pipeline[3]["$limit"] == 11
+    assert pipeline[4]["$project"] == {"firstName": 1, "searchScore": 1}
+
+
+def test_pipeline_resumes_after_cursor():
+    pipeline = build_search_pipeline(["an"], ["ana" + WORD_MARKER], (2, "abc"), 11, {})
+    assert list_stages(pipeline) == ["$match", "$addFields", "$match", "$sort", "$limit", "$project"]
+    assert pipeline[2]["$match"] == {"$or": [
+        {"searchScore": {"$lt": 2}},
+        {"searchScore": 2, "_id": {"$gt": "abc"}},
+    ]}
+
+
+def test_tokenize_folds_accents_and_case():
+    assert tokenize("São JOSÉ-da Silva") == ["sao", "jose", "da", "silva"]
+
+
+def test_field_search_keys_hold_prefixes_and_whole_words():
+    assert build_field_search_keys("Ana") == ["an", "ana", "ana" + WORD_MARKER]
+
+
+def test_search_fields_union_every_field():
+    search_fields = build_search_fields({"firstName": "Ana", "lastName": "Li"})
+    assert search_fields["searchFields"]["lastName"] == ["li", "li" + WORD_MARKER]
+    assert search_fields["searchFields"]["email"] == []
+    assert search_fields["searchKeys"] == ["an", "ana", "ana" + WORD_MARKER, "li", "li" + WORD_MARKER]
+
+
+def test_query_keys_drop_short_and_repeated_words():
+    prefix_keys, word_keys = build_query_keys("Silva a ana silva")
+    assert prefix_keys == ["silva", "ana"]
+    assert word_keys == ["silva" + WORD_MARKER, "ana" + WORD_MARKER]
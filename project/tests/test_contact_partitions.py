@@ -0,0 +1,44 @@
+from project.src.repository.utilities.contact_partitions import jump_hash, build_partition_key, find_partition, \
+    build_partition_names, group_positions_by_partition, DATABASE_SCOPE, COLLECTION_SCOPE
+
+
+def test_jump_hash_stays_in_range():
+    for key in range(1000):
+        assert 0 <= jump_hash(key, 7) < 7
+
+
+def test_jump_hash_only_moves_keys_to_the_new_bucket():
+    for key in range(1000):
+        bucket, grown_bucket = jump_hash(key, 5), jump_hash(key, 6)
+        assert grown_bucket in (bucket, 5)
+
+
+def test_jump_hash_spreads_keys():
+    buckets = [jump_hash(key * 2654435761, 4) for key in range(4000)]
+    assert all(800 < buckets.count(bucket) < 1200 for bucket in range(4))
+
+
+def test_partition_key_reads_hex_ids_and_hashes_others():
+    assert build_partition_key("00000000000000ff" + "0" * 16) == 255
+    assert build_partition_key("not-a-hex-id") == build_partition_key("not-a-hex-id")
+
+
+def test_single_partition_is_always_zero():
+    assert find_partition("ffffffffffffffff", 1) == 0
+    assert find_partition("ffffffffffffffff", 0) == 0
+
+
+def test_partition_names_per_scope():
+    assert build_partition_names("contact_list", "contacts", 1) == [("contact_list", "contacts")]
+    assert build_partition_names("contact_list", "contacts", 2, COLLECTION_SCOPE) == [
+        ("contact_list", "contacts_0"), ("contact_list", "contacts_1")]
+    assert build_partition_names("contact_list", "contacts", 2, DATABASE_SCOPE) == [
+        ("contact_list_0", "contacts"), ("contact_list_1", "contacts")]
+
+
+def test_group_positions_by_partition_keeps_every_position():
+    identities = [f"{index:032x}" for index in range(0, 2 ** 64, 2 ** 59)]
+    positions_per_partition = group_positions_by_partition(identities, 3)
+    assert sorted(position for positions in positions_per_partition.values() for position in positions) == list(range(len(identities)))
+    for partition, positions in positions_per_partition.items():
+        assert all(find_partition(identities[position], 3) == partition for position in positions)
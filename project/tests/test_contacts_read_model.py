@@ -0,0 +1,74 @@
+from contextvars import copy_context
+
+from project.src.repository.utilities.build_contact_keys import build_name_prefix_filter, build_name_key, \
+    build_page_cursor
+from project.src.repository.utilities.contacts_read_model import ContactsReadModel
+from project.src.services.service_actions import AsyncContactsReadModel
+
+
+def build_document(contact_id: str, first_name: str, phones_types=("mobile",)) -> dict:
+    phones = [{"type": phone_type} for phone_type in phones_types]
+    return {"_id": contact_id, "firstName": first_name, "firstNameKey": build_name_key(first_name), "phones": phones}
+
+
+def build_model() -> ContactsReadModel:
+    return ContactsReadModel([
+        build_document("c", "Bruno"),
+        build_document("a", "Ana"),
+        build_document("d", "anabela", ("commercial",)),
+        build_document("b", "Carla"),
+    ])
+
+
+def list_ids(documents: list) -> list:
+    return [document.get("_id") for document in documents]
+
+
+def test_pages_follow_id_order_after_cursor():
+    model = build_model()
+    assert list_ids(model.find_page(limit=2)) == ["a", "b"]
+    assert list_ids(model.find_page(after="b", limit=2)) == ["c", "d"]
+    assert list_ids(model.find_page(after="d", limit=2)) == []
+
+
+def test_name_prefix_pages_follow_name_key_then_id_order():
+    model = build_model()
+    model.put(build_document("e", "ana"))
+    name_filter = build_name_prefix_filter("AN")
+    assert ContactsReadModel.supports_filter(name_filter)
+    first_page = model.find_page(name_filter, limit=2)
+    assert list_ids(first_page) == ["a", "e"]
+    after = build_page_cursor(name_filter, "e", first_page[-1].get("firstNameKey"))
+    assert list_ids(model.find_page(name_filter, after=after, limit=2)) == ["d"]
+
+
+def test_put_and_remove_keep_indexes_and_counters():
+    model = build_model()
+    model.put(build_document("a", "Zoe", ("commercial",)))
+    model.remove("b")
+    model.remove("missing")
+    assert list_ids(model.find_page()) == ["a", "c", "d"]
+    assert list_ids(model.find_page(build_name_prefix_filter("an"))) == ["d"]
+    assert model.count() == {"countContacts": 3, "countType": [
+        {"_id": "mobile", "Count": 1}, {"_id": "commercial", "Count": 2}]}
+
+
+def test_other_filters_are_not_served():
+    assert not ContactsReadModel.supports_filter({"phoneKeys": "1"})
+
+
+def test_reads_are_served_only_once_the_pinned_version_is_applied(monkeypatch):
+    model = build_model()
+    monkeypatch.setattr(AsyncContactsReadModel, "ENABLED", True)
+    monkeypatch.setattr(AsyncContactsReadModel, "model", model)
+    monkeypatch.setattr(AsyncContactsReadModel, "version", 7)
+    monkeypatch.setattr(AsyncContactsReadModel, "missing_versions", {6, 7})
+    assert AsyncContactsReadModel.applied_version() == 5
+
+    def read_pinned(version: int):
+        AsyncContactsReadModel.pinned_version.set(version)
+        return AsyncContactsReadModel.get_warm_model("contact_detail")
+
+    assert copy_context().run(read_pinned, 5) is model
+    assert copy_context().run(read_pinned, 7) is None
+    assert AsyncContactsReadModel.get_warm_model("contact_detail") is None
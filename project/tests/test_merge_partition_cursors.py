@@ -0,0 +1,71 @@
+import asyncio
+
+from project.src.repository.utilities.build_contact_keys import build_name_prefix_filter, build_page_sort
+from project.src.repository.utilities.merge_partition_cursors import MergedCursor, AsyncMergedCursor
+
+
+class AsyncCursor:
+    def __init__(self, documents: list):
+        self.documents = iter(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self.documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def build_documents(*identities: str) -> list:
+    return [{"_id": identity} for identity in identities]
+
+
+def build_named_documents(*names_and_identities: tuple) -> list:
+    return [{"firstNameKey": name_key, "_id": identity} for name_key, identity in names_and_identities]
+
+
+def collect(cursor: AsyncMergedCursor) -> list:
+    async def read():
+        return [document.get("_id") async for document in cursor]
+    return asyncio.run(read())
+
+
+def test_merged_cursor_orders_and_skips_copies_being_moved():
+    cursor = MergedCursor([build_documents("a", "c", "d"), build_documents("b", "c", "e")])
+    assert [document.get("_id") for document in cursor] == ["a", "b", "c", "d", "e"]
+
+
+def test_merged_cursor_stops_at_limit():
+    cursor = MergedCursor([build_documents("a", "c"), build_documents("b", "d")], 3)
+    assert [document.get("_id") for document in cursor] == ["a", "b", "c"]
+
+
+def test_async_merged_cursor_orders_and_skips_copies_being_moved():
+    cursor = AsyncMergedCursor([
+        AsyncCursor(build_documents("a", "c", "d")),
+        AsyncCursor(build_documents("b", "c", "e")),
+        AsyncCursor([]),
+    ])
+    assert collect(cursor) == ["a", "b", "c", "d", "e"]
+
+
+def test_async_merged_cursor_without_limit_reads_everything():
+    cursor = AsyncMergedCursor([AsyncCursor(build_documents("a", "c")), AsyncCursor(build_documents("b"))], 0)
+    assert collect(cursor) == ["a", "b", "c"]
+
+
+def test_async_merged_cursor_stops_at_limit():
+    cursor = AsyncMergedCursor([AsyncCursor(build_documents("a", "c")), AsyncCursor(build_documents("b", "d"))], 2)
+    assert collect(cursor) == ["a", "b"]
+
+
+def test_merged_cursors_follow_the_name_prefix_page_order():
+    page_sort = build_page_sort(build_name_prefix_filter("a"))
+    first_partition = build_named_documents(("ana", "d"), ("ana", "e"), ("anabela", "a"))
+    second_partition = build_named_documents(("ana", "c"), ("ana", "e"), ("antonio", "b"))
+    cursor = MergedCursor([first_partition, second_partition], 4, page_sort)
+    assert [document.get("_id") for document in cursor] == ["c", "d", "e", "a"]
+    async_cursor = AsyncMergedCursor([AsyncCursor(first_partition), AsyncCursor(second_partition)], 0, page_sort)
+    assert collect(async_cursor) == ["c", "d", "e", "a", "b"]
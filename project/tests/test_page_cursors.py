@@ -0,0 +1,47 @@
+from project.src.repository.utilities.build_contact_keys import build_name_prefix_filter, build_after_filter
+from project.src.services.service_actions import ListsContacts, AsyncSearchContacts
+
+FIELDS = ["contactId", "firstName"]
+
+
+def build_documents(count: int) -> list:
+    return [{"_id": f"id{index}", "firstName": f"Name{index}", "firstNameKey": f"name{index}",
+             "searchScore": 3 - index} for index in range(count)]
+
+
+def test_page_points_next_cursor_at_last_returned_contact():
+    page = ListsContacts._page_to_json(build_documents(3), 2, FIELDS)
+    assert [contact["contactId"] for contact in page["contactsList"]] == ["id0", "id1"]
+    assert page["nextCursor"] == "id1"
+
+
+def test_last_page_has_no_next_cursor():
+    page = ListsContacts._page_to_json(build_documents(2), 2, FIELDS)
+    assert page["nextCursor"] is None
+
+
+def test_short_last_page_has_no_next_cursor():
+    page = ListsContacts._page_to_json(build_documents(1), 2, FIELDS)
+    assert [contact["contactId"] for contact in page["contactsList"]] == ["id0"]
+    assert page["nextCursor"] is None
+
+
+def test_prefix_page_cursor_carries_name_key_and_id():
+    name_prefix_filter = build_name_prefix_filter("name")
+    page = ListsContacts._page_to_json(build_documents(3), 2, FIELDS, name_prefix_filter)
+    assert page["nextCursor"] == "name1:id1"
+    assert build_after_filter(name_prefix_filter, page["nextCursor"])["$or"] == [
+        {"firstNameKey": {"$gt": "name1"}},
+        {"firstNameKey": "name1", "_id": {"$gt": "id1"}},
+    ]
+
+
+def test_search_cursor_carries_score_and_id():
+    page = AsyncSearchContacts._search_to_json(build_documents(3), 2, FIELDS)
+    assert page["nextCursor"] == "2:id1"
+    assert AsyncSearchContacts._parse_cursor(page["nextCursor"]) == (2, "id1")
+
+
+def test_malformed_search_cursors_are_rejected():
+    for cursor in (None, "", "id1", "x:id1", "2:", "-1:id1"):
+        assert AsyncSearchContacts._parse_cursor(cursor) is None
@@ -0,0 +1,46 @@
+import pymongo
+import pytest
+from pymongo.errors import PyMongoError
+
+from project.src.commands.indexes import checked_queries, find_plan_problems
+from project.src.core.entities.contacts import ContactParameters
+from project.src.repository.repository_actions import ContactIndexes
+from project.src.repository.utilities.convert_contact_to_dict import convert_contact_to_dict
+from project.src.services.utilities.env_config import config
+from project.src.services.utilities.transform_parameters_to_contact import transform_parameters_to_contact
+
+TEST_MONGO_URL: str = config("TEST_MONGO_URL", default="mongodb://127.0.0.1:27017")
+
+pytestmark = pytest.mark.mongod
+
+
+class ContactIndexesUnderTest(ContactIndexes):
+    DATABASE = "contact_list_test"
+
+
+@pytest.fixture(scope="module")
+def indexes_repository():
+    connection = pymongo.MongoClient(TEST_MONGO_URL, serverSelectionTimeoutMS=1000)
+    try:
+        connection.admin.command("ping")
+    except PyMongoError as error:
+        pytest.fail(f"no mongod at {TEST_MONGO_URL}, deselect with -m 'not mongod' to run without it: {error}")
+    connection.drop_database(ContactIndexesUnderTest.DATABASE)
+    indexes_repository = ContactIndexesUnderTest(connection)
+    indexes_repository.ensure_indexes()
+    indexes_repository.collection.insert_many([
+        convert_contact_to_dict(transform_parameters_to_contact(ContactParameters(
+            firstName=f"Ana{index}", lastName="Silva", email=f"ana{index}@example.com", address="Rua 1",
+            phoneList=[{"type": "mobile", "number": f"+55 11 91234-{index:04}"}],
+        )))
+        for index in range(20)
+    ])
+    yield indexes_repository
+    connection.drop_database(ContactIndexesUnderTest.DATABASE)
+    connection.close()
+
+
+@pytest.mark.parametrize("query_name", list(checked_queries))
+def test_query_is_served_by_an_index(indexes_repository, query_name):
+    filter_fields, sort = checked_queries[query_name]
+    assert find_plan_problems(query_name, indexes_repository.get_plan_stages(filter_fields, sort)) == []
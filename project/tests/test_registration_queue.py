@@ -0,0 +1,60 @@
+import asyncio
+
+from project.src.services.service_actions import AsyncRegistrationQueue
+
+
+class RecordingRegisterService:
+    def __init__(self, delay: float = 0):
+        self.batches = []
+        self.delay = delay
+
+    async def register_contacts(self, contacts: list) -> list:
+        self.batches.append(list(contacts))
+        await asyncio.sleep(self.delay)
+        return [contact % 2 == 0 for contact in contacts]
+
+
+def build_queue(register_service: RecordingRegisterService) -> AsyncRegistrationQueue:
+    registration_queue = AsyncRegistrationQueue.__new__(AsyncRegistrationQueue)
+    registration_queue.register_service = register_service
+    return registration_queue
+
+
+async def start_flusher(register_service: RecordingRegisterService) -> asyncio.Task:
+    flusher = asyncio.create_task(build_queue(register_service).flush_continuously())
+    await asyncio.sleep(0)
+    return flusher
+
+
+def test_submissions_are_written_together_and_get_their_own_status():
+    register_service = RecordingRegisterService()
+
+    async def run():
+        flusher = await start_flusher(register_service)
+        statuses = await asyncio.gather(*(AsyncRegistrationQueue.submit(contact) for contact in range(4)))
+        await AsyncRegistrationQueue.close()
+        await asyncio.wait_for(flusher, 1)
+        return statuses
+
+    assert asyncio.run(run()) == [True, False, True, False]
+    assert register_service.batches == [[0, 1, 2, 3]]
+
+
+def test_submit_without_flusher_falls_back_to_direct_write():
+    assert asyncio.run(AsyncRegistrationQueue.submit(1)) is None
+
+
+def test_cancelled_flusher_releases_every_waiting_submission(monkeypatch):
+    monkeypatch.setattr(AsyncRegistrationQueue, "CAPACITY", 2)
+    register_service = RecordingRegisterService(delay=10)
+
+    async def run():
+        flusher = await start_flusher(register_service)
+        submissions = [asyncio.create_task(AsyncRegistrationQueue.submit(contact)) for contact in range(6)]
+        await asyncio.sleep(0.05)
+        closing = asyncio.create_task(AsyncRegistrationQueue.close())
+        await asyncio.sleep(0.01)
+        flusher.cancel()
+        return await asyncio.wait_for(asyncio.gather(*submissions, closing), 1)
+
+    assert asyncio.run(run())[:6] == [None] * 6
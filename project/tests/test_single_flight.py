@@ -0,0 +1,66 @@
+import asyncio
+
+from project.src.services.utilities import single_flight
+
+
+class SlowRepository:
+    def __init__(self):
+        self.calls = 0
+
+    @single_flight.single_flight("test_get")
+    async def get(self, key: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    @single_flight.single_flight("test_fail")
+    async def fail(self, key: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError(key)
+
+
+def test_concurrent_calls_share_one_flight():
+    repository = SlowRepository()
+
+    async def run():
+        return await asyncio.gather(*(repository.get("a") for _ in range(5)), repository.get("b"))
+
+    assert asyncio.run(run()) == ["A"] * 5 + ["B"]
+    assert repository.calls == 2
+    assert not single_flight.flights
+
+
+def test_calls_tagged_with_other_versions_do_not_join():
+    repository = SlowRepository()
+
+    async def get_tagged(version: int) -> str:
+        single_flight.tagged_version.set(version)
+        return await repository.get("a")
+
+    async def run():
+        return await asyncio.gather(get_tagged(1), get_tagged(1), get_tagged(2))
+
+    assert asyncio.run(run()) == ["A"] * 3
+    assert repository.calls == 2
+
+
+def test_sequential_calls_are_not_cached():
+    repository = SlowRepository()
+
+    async def run():
+        return [await repository.get("a"), await repository.get("a")]
+
+    assert asyncio.run(run()) == ["A", "A"]
+    assert repository.calls == 2
+
+
+def test_failures_reach_every_waiter():
+    repository = SlowRepository()
+
+    async def run():
+        return await asyncio.gather(*(repository.fail("a") for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in asyncio.run(run()))
+    assert repository.calls == 1
+    assert not single_flight.flights